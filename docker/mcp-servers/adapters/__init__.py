@@ -5,12 +5,18 @@ Contains adapters for Freshdesk, Intercom, Jira, and Odoo integrations
 
 from .base_adapter import BaseAdapter
 from .rate_limiter import RateLimiter
+from .request_coalescer import RequestCoalescer
+from .response_cache import TTLCache
+from .tool_metrics import ToolMetrics
 from .freshdesk_adapter import FreshdeskAdapter
 from .intercom_adapter import IntercomAdapter
 
 __all__ = [
     'BaseAdapter',
     'RateLimiter', 
+    'RequestCoalescer',
+    'TTLCache',
+    'ToolMetrics',
     'FreshdeskAdapter',
     'IntercomAdapter'
 ]
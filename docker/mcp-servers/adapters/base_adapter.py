@@ -19,6 +19,20 @@ from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Compressed responses; httpx only decodes br with brotli (httpx[brotli]) installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
 
 class APIResponse(BaseModel):
     """Standardized API response model"""
@@ -36,6 +50,12 @@ class BaseAdapter(ABC):
     Provides common functionality for HTTP operations, rate limiting, and error handling
     """
     
+    # Connection pool size; with HTTP/2 one connection carries many concurrent requests
+    max_keepalive_connections = 20
+    max_connections = 100
+    # Seconds an idle pooled connection (and its TLS session) is kept open
+    keepalive_expiry = 5.0
+    
     def __init__(
         self,
         base_url: str,
@@ -67,6 +87,7 @@ class BaseAdapter(ABC):
         """Setup HTTP client with proper authentication and headers"""
         headers = {
             "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "User-Agent": "Aura-MCP-Unified-Server/1.0.0"
         }
         
@@ -83,11 +104,19 @@ class BaseAdapter(ABC):
         if self.access_token:
             headers["Authorization"] = f"Bearer {self.access_token}"
         
+        # One pooled client per adapter; with HTTP/2 concurrent requests are
+        # multiplexed over a single TCP+TLS connection per host
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers=headers,
             timeout=httpx.Timeout(self.timeout),
-            follow_redirects=True
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_keepalive_connections,
+                max_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_expiry
+            )
         )
     
     async def __aenter__(self):
@@ -99,9 +128,11 @@ class BaseAdapter(ABC):
         await self.close()
     
     async def close(self):
-        """Close HTTP client"""
+        """Close HTTP client and stop background rate limiter cleanup"""
         if hasattr(self, 'client'):
             await self.client.aclose()
+        if hasattr(self, 'rate_limiter'):
+            self.rate_limiter.stop_cleanup_task()
     
     async def _make_request(
         self,
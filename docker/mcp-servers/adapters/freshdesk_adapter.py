@@ -8,17 +8,63 @@ import os
 import json
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Union
+import time
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
-import aiohttp
 import base64
+import orjson
 from urllib.parse import urlencode, quote
 
 from .base_adapter import BaseAdapter
 from .rate_limiter import RateLimiter
+from .request_coalescer import RequestCoalescer
+from .response_cache import TTLCache
+from .tool_metrics import ToolMetrics
 
 logger = logging.getLogger(__name__)
 
+# Read tools whose identical concurrent calls share one in-flight request:
+# per-ID lookups and the expensive server-side searches
+_COALESCED_PREFIXES = ('view_', 'filter_')
+
+# Response bodies at least this large are parsed in a worker thread so a
+# multi-MB list_* payload does not stall the event loop
+_THREADED_PARSE_BYTES = 256 * 1024
+
+# Read-only tools over slowly changing metadata, cached with their invalidation tags
+_CACHED_TOOL_TAGS: Dict[str, Tuple[str, ...]] = {
+    'view_current_agent': ('agents',),
+    'agent_skills': ('agents',),
+    'agent_groups': ('agents', 'groups'),
+    'view_group': ('groups',),
+    'list_groups': ('groups',),
+    'view_email_configs': ('email_configs',),
+    'company_fields': ('company_fields',),
+    'list_business_hours': ('business_hours',),
+    'view_business_hour': ('business_hours',),
+    'list_sla_policies': ('sla_policies',),
+    'view_sla_policy': ('sla_policies',),
+    'list_solution_categories': ('solution_categories',),
+    'mailbox_settings': ('mailboxes',),
+}
+
+# Mutating tools and the cache tags their success invalidates
+_INVALIDATED_TAGS: Dict[str, Tuple[str, ...]] = {
+    'create_agent': ('agents',),
+    'update_agent': ('agents',),
+    'delete_agent': ('agents',),
+    'make_agent': ('agents',),
+    'create_group': ('groups',),
+    'update_group': ('groups',),
+    'delete_group': ('groups',),
+    'create_solution_category': ('solution_categories',),
+    'update_solution_category': ('solution_categories',),
+    'delete_solution_category': ('solution_categories',),
+    'create_mailbox': ('mailboxes',),
+    'update_mailbox': ('mailboxes',),
+    'delete_mailbox': ('mailboxes',),
+}
+
 
 class FreshdeskAdapter(BaseAdapter):
     """
@@ -60,6 +106,23 @@ class FreshdeskAdapter(BaseAdapter):
             'Authorization': f'Basic {encoded_auth}'
         }
         
+        # Bound concurrent API calls so bursts wait for a slot instead of
+        # piling up pending requests and memory
+        self.max_concurrent_requests = 40
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        # Concurrent identical view_*/filter_* calls share one in-flight request
+        self._coalescer = RequestCoalescer()
+        
+        # Short-lived cache for read-only metadata tools (see _CACHED_TOOL_TAGS)
+        self._response_cache = TTLCache(ttl_seconds=300, max_entries=512)
+        
+        # Last ETag and body per view_* resource, revalidated with If-None-Match
+        self._etag_cache = TTLCache(ttl_seconds=3600, max_entries=2048)
+        
+        # Per-tool call latency (P50/P99), exported to Prometheus when installed
+        self.tool_metrics = ToolMetrics(self.platform_name)
+        
         # Initialize tools
         self.all_tools = {}
         self._setup_tools()
@@ -986,18 +1049,20 @@ class FreshdeskAdapter(BaseAdapter):
             **forum_tools
         }
         
+        # Invalidate the cached get_tools() result
+        self._tools_cache = None
+        
         logger.info(f"✅ Configured {len(self.all_tools)} Freshdesk API tools")
     
     async def test_connection(self) -> bool:
         """Test connection to Freshdesk API"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/v2/tickets",
-                    headers=self.headers,
-                    params={'per_page': 1}
-                ) as response:
-                    return response.status == 200
+            response = await self.client.get(
+                f"{self.base_url}/api/v2/tickets",
+                headers=self.headers,
+                params={'per_page': 1}
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Freshdesk connection test failed: {e}")
             return False
@@ -1020,8 +1085,10 @@ class FreshdeskAdapter(BaseAdapter):
         return self.get_tools()
     
     def get_tools(self, status: str = None, priority: str = None, updated_since: str = None, page: int = 1, per_page: int = 30) -> List[str]:
-        """Get list of available tool names"""
-        return list(self.all_tools.keys())
+        """Get list of available tool names (cached until tools are reconfigured)"""
+        if self._tools_cache is None:
+            self._tools_cache = list(self.all_tools.keys())
+        return self._tools_cache
     
     def get_tool_config(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific tool"""
@@ -1040,7 +1107,40 @@ class FreshdeskAdapter(BaseAdapter):
         """
         if arguments is None:
             arguments = {}
-            
+        
+        started = time.perf_counter_ns()
+        result = await self._execute_with_cache(tool_name, arguments)
+        self.tool_metrics.record(tool_name, (time.perf_counter_ns() - started) / 1e9, bool(result.get('success')))
+        return result
+    
+    async def _execute_with_cache(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a tool/endpoint call through the response cache and request coalescer"""
+        cache_tags = _CACHED_TOOL_TAGS.get(tool_name)
+        coalesced = tool_name.startswith(_COALESCED_PREFIXES)
+        if cache_tags is not None or coalesced:
+            key = (tool_name, json.dumps(arguments, sort_keys=True, default=str))
+        
+        if cache_tags is not None:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        if coalesced:
+            result = await self._coalescer.run(key, lambda: self._execute_tool(tool_name, arguments))
+        else:
+            result = await self._execute_tool(tool_name, arguments)
+        
+        if result.get('success'):
+            if cache_tags is not None:
+                self._response_cache.set(key, result, cache_tags)
+            invalidated = _INVALIDATED_TAGS.get(tool_name)
+            if invalidated:
+                self._response_cache.invalidate_tags(invalidated)
+        
+        return result
+    
+    async def _execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a tool/endpoint call without coalescing"""
         if tool_name not in self.all_tools:
             return {
                 'success': False,
@@ -1068,12 +1168,18 @@ class FreshdeskAdapter(BaseAdapter):
                 else:
                     body_data[key] = value
             
+            # view_* reads are revalidated with their last ETag
+            etag_key = None
+            if tool_name.startswith('view_'):
+                etag_key = f"{endpoint_path}?{urlencode(sorted(query_params.items()), doseq=True)}"
+            
             # Make API request
             result = await self._make_api_request(
                 method=config['method'],
                 endpoint=endpoint_path,
                 params=query_params if query_params else None,
-                data=body_data if body_data else None
+                data=body_data if body_data else None,
+                etag_key=etag_key
             )
             
             return {
@@ -1092,14 +1198,80 @@ class FreshdeskAdapter(BaseAdapter):
                 'platform': self.platform_name
             }
     
+    async def iter_pages(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any] = None,
+        per_page: int = 100,
+        prefetch: int = 2
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over a paginated list tool one page at a time
+        
+        A background task fetches up to `prefetch` pages ahead while the caller
+        processes the current one, so API latency overlaps with consumer work and
+        memory stays bounded by the prefetch depth rather than the total size.
+        
+        Args:
+            tool_name: Name of a list_* tool accepting page/per_page
+            arguments: Additional tool arguments (optional)
+            per_page: Items per page (Freshdesk maximum is 100)
+            prefetch: Number of pages buffered ahead of the consumer
+            
+        Yields:
+            The items of each non-empty page
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+        finished = object()
+        
+        async def produce():
+            page = 1
+            try:
+                while True:
+                    response = await self.execute_tool(tool_name, {**(arguments or {}), 'page': page, 'per_page': per_page})
+                    if not response.get('success'):
+                        raise Exception(response.get('error'))
+                    
+                    items = response.get('result') or []
+                    if items:
+                        await queue.put(items)
+                    if len(items) < per_page:
+                        break
+                    page += 1
+                await queue.put(finished)
+            except Exception as e:
+                await queue.put(e)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page_items = await queue.get()
+                if page_items is finished:
+                    return
+                if isinstance(page_items, Exception):
+                    raise page_items
+                yield page_items
+        finally:
+            producer.cancel()
+    
+    def iter_tickets(self, per_page: int = 100, prefetch: int = 2) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over all tickets page by page with background prefetching"""
+        return self.iter_pages('list_tickets', per_page=per_page, prefetch=prefetch)
+    
     async def _make_api_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        etag_key: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Make authenticated request to Freshdesk API"""
+        """
+        Make authenticated request to Freshdesk API
+        
+        When etag_key is given the request is conditional: the last ETag seen for
+        that key is sent as If-None-Match and a 304 reuses the cached body.
+        """
         
         # Check rate limit
         rate_check = await self.rate_limiter.check_rate_limit(self.platform_name)
@@ -1110,28 +1282,45 @@ class FreshdeskAdapter(BaseAdapter):
         
         self.stats['requests_made'] += 1
         
+        headers = self.headers
+        cached = self._etag_cache.get(etag_key) if etag_key else None
+        if cached is not None:
+            headers = {**headers, 'If-None-Match': cached[0]}
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
+            # Shared base client: one pooled (HTTP/2 when available) connection set
+            async with self._request_semaphore:
+                response = await self.client.request(
                     method=method,
                     url=url,
-                    headers=self.headers,
+                    headers=headers,
                     params=params,
                     json=data
-                ) as response:
-                    
-                    await self.rate_limiter.record_request(self.platform_name)
-                    
-                    if response.status in [200, 201, 204]:
-                        self.stats['successful_requests'] += 1
-                        if response.status == 204:
-                            return {'message': 'Operation completed successfully'}
-                        else:
-                            return await response.json()
-                    else:
-                        self.stats['failed_requests'] += 1
-                        error_text = await response.text()
-                        raise Exception(f"API request failed (status {response.status}): {error_text}")
+                )
+            
+            await self.rate_limiter.record_request(self.platform_name)
+            
+            if response.status_code == 304 and cached is not None:
+                self.stats['successful_requests'] += 1
+                return cached[1]
+            
+            if response.status_code in [200, 201, 204]:
+                self.stats['successful_requests'] += 1
+                if response.status_code == 204:
+                    return {'message': 'Operation completed successfully'}
+                
+                raw = response.content
+                if len(raw) < _THREADED_PARSE_BYTES:
+                    body = orjson.loads(raw)
+                else:
+                    body = await asyncio.to_thread(orjson.loads, raw)
+                etag = response.headers.get('ETag')
+                if etag_key and etag:
+                    self._etag_cache.set(etag_key, (etag, body))
+                return body
+            else:
+                self.stats['failed_requests'] += 1
+                raise Exception(f"API request failed (status {response.status_code}): {response.text}")
         
         except Exception as e:
             self.stats['failed_requests'] += 1
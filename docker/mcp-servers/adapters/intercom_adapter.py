@@ -8,16 +8,116 @@ import os
 import json
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Union
+import random
+import re
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
-import aiohttp
+import httpx
+import orjson
 from urllib.parse import urlencode, quote
 
 from .base_adapter import BaseAdapter
 from .rate_limiter import RateLimiter
+from .request_coalescer import RequestCoalescer
+from .response_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Resource families (name fragments) that tag cached reads; a successful write
+# whose name contains a family drops every cached read tagged with it
+_CACHE_FAMILIES = (
+    'conversation', 'contact', 'compan', 'admin', 'team', 'segment', 'tag',
+    'data_attribute', 'article', 'collection', 'help_center', 'note', 'event', 'message'
+)
+
+# TTLs for cached GET tools; slowly changing workspace metadata is kept longer
+_READ_TTL_SECONDS = 120
+_METADATA_TTL_SECONDS = 600
+_METADATA_TOOLS = frozenset({
+    'list_admins', 'retrieve_admin', 'list_away_reasons', 'get_team_permissions',
+    'list_tags', 'list_segments', 'retrieve_segment',
+    'list_data_attributes', 'retrieve_data_attribute',
+    'list_articles', 'list_collections', 'retrieve_collection', 'help_center_settings'
+})
+
+# GET tools that must always hit the API (server-side scroll cursors)
+_UNCACHED_READS = frozenset({'scroll_companies'})
+
+# List tools returning every record, with the response key holding the records
+# and the retrieve tool that a cached record can answer by ID
+_RECORD_INDEXES = {
+    'list_admins': ('admins', 'retrieve_admin'),
+    'list_segments': ('segments', 'retrieve_segment')
+}
+_INDEXED_RETRIEVES = frozenset(retrieve_tool for _, retrieve_tool in _RECORD_INDEXES.values())
+_RECORD_TTL_SECONDS = 300
+
+# Retry policy for throttled (429) and transient (5xx) API responses; Retry-After
+# is honoured, otherwise exponential backoff with jitter, each wait capped
+_MAX_RETRIES = 3
+_RETRY_BASE_SECONDS = 1.0
+_RETRY_CAP_SECONDS = 3.0
+_RETRYABLE_SERVER_ERRORS = frozenset({500, 502, 503, 504})
+
+# Exports are written to disk one page / chunk at a time instead of buffered
+_EXPORT_PAGE_SIZE = 150
+_EXPORT_CHUNK_BYTES = 64 * 1024
+_EXPORT_POLL_SECONDS = 5
+_EXPORT_TIMEOUT_SECONDS = 300
+_EXPORT_FAILED_STATUSES = frozenset({'failed', 'canceled', 'no_data'})
+
+# Sanitized MCP parameter names mapped back to the Intercom API names
+_PARAM_MAPPING: Dict[str, str] = {
+    # Common mappings that reverse the sanitization
+    'item_id': 'id',
+    'item_name': 'name',
+    'item_title': 'title',
+    'item_type': 'type',
+    'page_size': 'per_page',
+    'content_body': 'body',
+    'from_date': 'from',
+    'target': 'to',
+    'msg_type': 'message_type',
+    'search_query': 'query',
+    'search_phrase': 'phrase',
+    'lang_code': 'language',
+    'is_away': 'away_mode_enabled',
+    'created_after': 'created_at_after',
+    'contact_list': 'contacts',
+    'contact_data': 'contact',
+    'contact_ref': 'contact_id',
+    'event_type': 'event_name',
+    'filter_query': 'filter',
+    'model_type': 'model'
+}
+
+# Path placeholders of a tool endpoint, e.g. {item_id}
+_PATH_PARAM = re.compile(r'\{([^}]+)\}')
+
+# Query-string keys of GET requests and the search tools with a query-only body
+_QUERY_KEYS = frozenset({'per_page', 'page', 'starting_after', 'sort', 'order', 'display_as'})
+_SEARCH_TOOLS = frozenset({'search_conversations', 'search_contacts', 'search_companies'})
+
+# Intercom tool categories reported by discover_api_schema (shared, never mutated)
+_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "conversations": ("list_conversations", "retrieve_conversation", "search_conversations", "reply_to_conversation", "assign_conversation", "close_conversation", "snooze_conversation", "open_conversation"),
+    "contacts": ("list_contacts", "retrieve_contact", "create_contact", "update_contact", "delete_contact", "search_contacts", "merge_contacts", "archive_contact", "unarchive_contact"),
+    "companies": ("list_companies", "retrieve_company", "create_company", "update_company", "delete_company", "list_company_contacts", "list_company_segments"),
+    "messages": ("create_message", "list_messages"),
+    "articles": ("list_articles", "retrieve_article", "create_article", "update_article", "delete_article", "search_articles"),
+    "admins": ("list_admins", "retrieve_admin", "set_admin_away"),
+    "teams": ("list_teams", "retrieve_team"),
+    "segments": ("list_segments", "retrieve_segment"),
+    "tags": ("list_tags", "create_tag", "delete_tag", "tag_contact", "tag_company", "untag_contact", "untag_company"),
+    "notes": ("create_note", "list_notes", "retrieve_note"),
+    "events": ("create_event", "list_events"),
+    "data_attributes": ("list_data_attributes", "create_data_attribute", "update_data_attribute"),
+    "subscription_types": ("list_subscription_types",),
+    "phone_call_redirects": ("list_phone_call_redirects", "create_phone_call_redirect"),
+    "visitors": ("retrieve_visitor", "update_visitor", "convert_visitor"),
+    "counts": ("get_app_total_count", "get_company_segment_count", "get_company_tag_count", "get_company_user_count", "get_conversation_admin_count", "get_user_segment_count", "get_user_tag_count")
+}
+
 
 class IntercomAdapter(BaseAdapter):
     """
@@ -28,6 +128,12 @@ class IntercomAdapter(BaseAdapter):
     
     platform_name = "intercom"
     
+    # api.intercom.io speaks HTTP/2, so fan-out calls multiplex over a few connections
+    max_keepalive_connections = 8
+    max_connections = 32
+    # Keep the connection warmed by the startup connection test for the first tool calls
+    keepalive_expiry = 60.0
+    
     def __init__(self, access_token: str = None):
         """
         Initialize Intercom adapter
@@ -74,14 +180,25 @@ class IntercomAdapter(BaseAdapter):
             'requests_made': 0,
             'successful_requests': 0,
             'failed_requests': 0,
-            'rate_limit_hits': 0
+            'rate_limit_hits': 0,
+            'retries': 0
         }
         
         # Set up tools
         self._setup_tools()
         
-        # Initialize session for connection pooling
-        self.session = None
+        # TTL cache for read tools (orjson-encoded, so callers cannot mutate entries),
+        # invalidated by resource family on writes
+        self._response_cache = TTLCache(ttl_seconds=_READ_TTL_SECONDS, max_entries=1024)
+        
+        # Concurrent identical reads share one in-flight API call
+        self._coalescer = RequestCoalescer()
+        
+        # ID -> encoded record from the last full list_* response, answering retrieve_* lookups
+        self._record_cache = TTLCache(ttl_seconds=_RECORD_TTL_SECONDS, max_entries=4096)
+        
+        # Static API schema, built on first use
+        self._api_schema: Optional[Dict[str, Any]] = None
         
         logger.info(f"✅ Intercom adapter initialized")
         logger.info(f"🔗 Base URL: {self.base_url}")
@@ -123,6 +240,70 @@ class IntercomAdapter(BaseAdapter):
                 "required_parameters": required_params
             }
         
+        if tool_name in _INDEXED_RETRIEVES:
+            record = self._record_cache.get((tool_name, str(arguments.get('item_id'))))
+            if record is not None:
+                return {
+                    "success": True,
+                    "result": {
+                        'success': True,
+                        'data': orjson.loads(record),
+                        'status_code': 200,
+                        'platform': self.platform_name
+                    }
+                }
+        
+        read_policy = self._read_cache_policy.get(tool_name)
+        if read_policy is not None:
+            cache_key = (tool_name, json.dumps(arguments, sort_keys=True, default=str))
+            payload = self._response_cache.get(cache_key)
+            if payload is None:
+                payload = await self._coalescer.run(
+                    cache_key, lambda: self._execute_read(tool_name, arguments, read_policy, cache_key)
+                )
+            # Cached and coalesced results are shared encoded bytes; every caller gets its own copy
+            return orjson.loads(payload)
+        
+        return await self._execute_uncached(tool_name, arguments)
+    
+    async def _execute_read(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        read_policy: Tuple[int, Tuple[str, ...]],
+        cache_key: Tuple[str, str]
+    ) -> bytes:
+        """
+        Call a cacheable read tool and cache its successful result
+        
+        Args:
+            tool_name: Name of the tool to execute
+            arguments: Tool-specific parameters
+            read_policy: (ttl, families) of this read
+            cache_key: Response cache key of this read
+            
+        Returns:
+            The orjson-encoded result, so the cached value cannot be mutated by callers
+        """
+        response = await self._execute_uncached(tool_name, arguments)
+        payload = orjson.dumps(response, default=str, option=orjson.OPT_NON_STR_KEYS)
+        if response.get("success"):
+            self._response_cache.set(cache_key, payload, read_policy[1], ttl_seconds=read_policy[0])
+            if tool_name in _RECORD_INDEXES:
+                self._index_records(tool_name, response["result"], read_policy[1])
+        return payload
+    
+    async def _execute_uncached(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call a validated tool against the API and invalidate the reads a successful write affects
+        
+        Args:
+            tool_name: Name of the tool to execute
+            arguments: Tool-specific parameters
+            
+        Returns:
+            Dict with the result of the tool execution
+        """
         try:
             # Apply rate limiting
             if self.rate_limiter:
@@ -141,10 +322,15 @@ class IntercomAdapter(BaseAdapter):
             
             # Return in the format expected by main.py (matching FreshdeskAdapter format)
             if result.get('success'):
-                return {
+                response = {
                     "success": True,
                     "result": result.get('result', result)
                 }
+                invalidated = self._write_invalidations.get(tool_name)
+                if invalidated:
+                    self._response_cache.invalidate_tags(invalidated)
+                    self._record_cache.invalidate_tags(invalidated)
+                return response
             else:
                 return {
                     "success": False,
@@ -162,23 +348,29 @@ class IntercomAdapter(BaseAdapter):
                 "parameters": arguments
             }
 
-    def unified_search(self, query: str) -> Dict[str, Any]:
+    def _index_records(self, tool_name: str, result: Any, families: Tuple[str, ...]) -> None:
+        """Cache each record of a list_* response by ID for its retrieve_* tool"""
+        records_key, retrieve_tool = _RECORD_INDEXES[tool_name]
+        payload = result.get('data') if isinstance(result, dict) else None
+        records = payload.get(records_key) if isinstance(payload, dict) else None
+        if not isinstance(records, list):
+            return
+        
+        for record in records:
+            if isinstance(record, dict) and record.get('id') is not None:
+                self._record_cache.set(
+                    (retrieve_tool, str(record['id'])),
+                    orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS),
+                    families
+                )
+    
+    async def unified_search(self, query: str) -> Dict[str, Any]:
         """
         Unified search interface to match main.py expectations.
         Wraps the existing search_unified_data method.
         """
         try:
-            # Create a new event loop if we're not in an async context
-            import asyncio
-            try:
-                # Try to get existing event loop
-                loop = asyncio.get_running_loop()
-                # If we're already in an async context, we need to use run_until_complete
-                future = asyncio.ensure_future(self.search_unified_data(query))
-                return loop.run_until_complete(future)
-            except RuntimeError:
-                # No event loop running, safe to use asyncio.run
-                return asyncio.run(self.search_unified_data(query))
+            return await self.search_unified_data(query)
         except Exception as e:
             logger.error(f"Error in unified_search: {e}")
             return {
@@ -240,8 +432,11 @@ class IntercomAdapter(BaseAdapter):
         Get a list of available tools for this adapter
         
         Returns:
-            List[Dict[str, Any]]: List of tool definitions
+            List[Dict[str, Any]]: List of tool definitions (cached until tools are reconfigured)
         """
+        if self._tools_cache is not None:
+            return self._tools_cache
+        
         tools = []
         for name, config in self.all_tools.items():
             tool = {
@@ -259,9 +454,10 @@ class IntercomAdapter(BaseAdapter):
                     "description": f"Parameter: {param}"
                 }
             tools.append(tool)
+        self._tools_cache = tools
         return tools
 
-    def get_customer_journey(self, identifier: str, identifier_type: str = "email") -> Dict[str, Any]:
+    async def get_customer_journey(self, identifier: str, identifier_type: str = "email") -> Dict[str, Any]:
         """Get customer journey data from Intercom
         
         Args:
@@ -272,23 +468,7 @@ class IntercomAdapter(BaseAdapter):
             Dict containing customer journey data
         """
         try:
-            # Search for contact
-            search_query = {
-                'query': {
-                    'field': identifier_type,
-                    'operator': '=',
-                    'value': identifier
-                }
-            }
-            
-            # Use asyncio to run the async method
-            import asyncio
-            try:
-                loop = asyncio.get_running_loop()
-                future = asyncio.ensure_future(self._get_customer_journey_async(identifier, identifier_type))
-                return loop.run_until_complete(future)
-            except RuntimeError:
-                return asyncio.run(self._get_customer_journey_async(identifier, identifier_type))
+            return await self._get_customer_journey_async(identifier, identifier_type)
         except Exception as e:
             logger.error(f"Error getting customer journey: {str(e)}")
             return {
@@ -1032,6 +1212,26 @@ class IntercomAdapter(BaseAdapter):
         self.all_tools.update(self.note_tools)
         self.all_tools.update(self.data_event_tools)
         
+        # Invalidate the cached get_tools() result
+        self._tools_cache = None
+        
+        # Path placeholders per tool, so calls skip the regex scan
+        self._path_params: Dict[str, Tuple[str, ...]] = {
+            name: tuple(_PATH_PARAM.findall(config['path'])) for name, config in self.all_tools.items()
+        }
+        
+        # Cache policy per tool: reads get (ttl, families), writes the families they invalidate
+        self._read_cache_policy: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+        self._write_invalidations: Dict[str, Tuple[str, ...]] = {}
+        for name, config in self.all_tools.items():
+            families = tuple(family for family in _CACHE_FAMILIES if family in name)
+            if config['method'] == 'GET':
+                if name not in _UNCACHED_READS:
+                    ttl = _METADATA_TTL_SECONDS if name in _METADATA_TOOLS else _READ_TTL_SECONDS
+                    self._read_cache_policy[name] = (ttl, families)
+            elif not name.startswith('search_') and families:
+                self._write_invalidations[name] = families
+        
         logger.info(f"🔧 Configured {len(self.all_tools)} Intercom API tools with sanitized parameter names")
     
     async def make_request(
@@ -1062,83 +1262,84 @@ class IntercomAdapter(BaseAdapter):
             raise Exception(f"Rate limit exceeded: {rate_check['message']}")
         
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            'Authorization': f'Bearer {self.access_token}',
-            'Accept': f'application/vnd.intercom.3+json',
-            'Content-Type': 'application/json',
-            'Intercom-Version': self.api_version
-        }
+        headers = self._request_headers()
         
         # Handle file uploads (rare in Intercom)
         if files:
-            headers.pop('Content-Type')  # Let aiohttp set multipart boundary
+            headers.pop('Content-Type')  # Let httpx set multipart boundary
         
         self.stats['requests_made'] += 1
         
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.request(
+            for attempt in range(1, _MAX_RETRIES + 2):
+                # Shared pooled client from BaseAdapter (keep-alive across tool calls)
+                response = await self.client.request(
                     method=method,
                     url=url,
                     headers=headers,
                     params=params,
                     json=data if not files else None,
-                    data=files if files else None
-                ) as response:
-                    # Record successful request for rate limiting
-                    await self.rate_limiter.record_request(self.platform_name)
-                    
-                    if response.status in [200, 201]:
-                        self.stats['successful_requests'] += 1
-                        try:
-                            result = await response.json()
-                        except (json.JSONDecodeError, aiohttp.ContentTypeError):
-                            result = await response.text()
-                        
-                        return {
-                            'success': True,
-                            'data': result,
-                            'status_code': response.status,
-                            'platform': self.platform_name
-                        }
-                    
-                    elif response.status == 204:  # No content (successful delete)
-                        self.stats['successful_requests'] += 1
-                        return {
-                            'success': True,
-                            'data': 'Operation completed successfully',
-                            'status_code': response.status,
-                            'platform': self.platform_name
-                        }
-                    
-                    elif response.status == 429:  # Rate limited by API
-                        self.stats['rate_limit_hits'] += 1
-                        error_text = await response.text()
-                        # Parse rate limit headers if available
-                        reset_time = response.headers.get('X-RateLimit-Reset')
-                        raise Exception(f"API rate limit exceeded: {error_text}. Reset at: {reset_time}")
-                    
-                    elif response.status == 401:
-                        self.stats['failed_requests'] += 1
-                        raise Exception("Authentication failed - check your access token")
-                    
-                    elif response.status == 404:
-                        self.stats['failed_requests'] += 1
-                        error_text = await response.text()
-                        raise Exception(f"Resource not found: {error_text}")
-                    
-                    elif response.status == 422:
-                        self.stats['failed_requests'] += 1
-                        error_text = await response.text()
-                        raise Exception(f"Validation error: {error_text}")
-                    
-                    else:
-                        self.stats['failed_requests'] += 1
-                        error_text = await response.text()
-                        raise Exception(f"API request failed (status {response.status}): {error_text}")
-        
-        except aiohttp.ClientError as e:
+                    files=files if files else None
+                )
+                # Record successful request for rate limiting
+                await self.rate_limiter.record_request(self.platform_name)
+                
+                if attempt > _MAX_RETRIES or not self._is_retryable(method, response.status_code):
+                    break
+                
+                delay = self._retry_delay(response, attempt)
+                if response.status_code == 429:
+                    self.stats['rate_limit_hits'] += 1
+                self.stats['retries'] += 1
+                logger.warning(f"⏳ Intercom returned {response.status_code} for {method} {endpoint}, retry {attempt}/{_MAX_RETRIES} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            
+            if response.status_code in [200, 201]:
+                self.stats['successful_requests'] += 1
+                try:
+                    result = response.json()
+                except json.JSONDecodeError:
+                    result = response.text
+                
+                return {
+                    'success': True,
+                    'data': result,
+                    'status_code': response.status_code,
+                    'platform': self.platform_name
+                }
+            
+            elif response.status_code == 204:  # No content (successful delete)
+                self.stats['successful_requests'] += 1
+                return {
+                    'success': True,
+                    'data': 'Operation completed successfully',
+                    'status_code': response.status_code,
+                    'platform': self.platform_name
+                }
+            
+            elif response.status_code == 429:  # Rate limited by API
+                self.stats['rate_limit_hits'] += 1
+                # Parse rate limit headers if available
+                reset_time = response.headers.get('X-RateLimit-Reset')
+                raise Exception(f"API rate limit exceeded: {response.text}. Reset at: {reset_time}")
+            
+            elif response.status_code == 401:
+                self.stats['failed_requests'] += 1
+                raise Exception("Authentication failed - check your access token")
+            
+            elif response.status_code == 404:
+                self.stats['failed_requests'] += 1
+                raise Exception(f"Resource not found: {response.text}")
+            
+            elif response.status_code == 422:
+                self.stats['failed_requests'] += 1
+                raise Exception(f"Validation error: {response.text}")
+            
+            else:
+                self.stats['failed_requests'] += 1
+                raise Exception(f"API request failed (status {response.status_code}): {response.text}")
+        
+        except httpx.RequestError as e:
             self.stats['failed_requests'] += 1
             logger.error(f"💥 Network error in Intercom API request: {e}")
             raise Exception(f"Network error: {str(e)}")
@@ -1148,6 +1349,42 @@ class IntercomAdapter(BaseAdapter):
             logger.error(f"💥 Unexpected error in Intercom API request: {e}")
             raise
     
+    def _request_headers(self, accept: str = 'application/vnd.intercom.3+json') -> Dict[str, str]:
+        """Authenticated Intercom API request headers"""
+        return {
+            'Authorization': f'Bearer {self.access_token}',
+            'Accept': accept,
+            'Content-Type': 'application/json',
+            'Intercom-Version': self.api_version
+        }
+    
+    @staticmethod
+    def _is_retryable(method: str, status_code: int) -> bool:
+        """429s were never processed and are always retried; 5xx only for idempotent GETs"""
+        if status_code == 429:
+            return True
+        return method.upper() == 'GET' and status_code in _RETRYABLE_SERVER_ERRORS
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retry number attempt
+        
+        Args:
+            response: The throttled or failed response
+            attempt: 1-based retry number
+            
+        Returns:
+            Retry-After when the API sent one, else base * 2^(attempt-1) plus jitter, capped
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(_RETRY_CAP_SECONDS, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return min(_RETRY_CAP_SECONDS, _RETRY_BASE_SECONDS * 2 ** (attempt - 1) + random.uniform(0, 0.25))
+    
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Execute an Intercom API tool call
@@ -1190,41 +1427,11 @@ class IntercomAdapter(BaseAdapter):
             endpoint_path = config['path']
             path_params = {}
             
-            # Map sanitized parameters back to original API parameter names
-            param_mapping = {
-                # Common mappings that reverse the sanitization
-                'item_id': 'id',
-                'item_name': 'name', 
-                'item_title': 'title',
-                'item_type': 'type',
-                'page_size': 'per_page',
-                'content_body': 'body',
-                'from_date': 'from',
-                'target': 'to',
-                'msg_type': 'message_type',
-                'search_query': 'query',
-                'search_phrase': 'phrase',
-                'lang_code': 'language',
-                'is_away': 'away_mode_enabled',
-                'created_after': 'created_at_after',
-                'contact_list': 'contacts',
-                'contact_data': 'contact',
-                'contact_ref': 'contact_id',
-                'event_type': 'event_name',
-                'filter_query': 'filter',
-                'model_type': 'model'
-            }
-            
             # Convert sanitized arguments back to original parameter names
-            converted_arguments = {}
-            for key, value in arguments.items():
-                original_key = param_mapping.get(key, key)
-                converted_arguments[original_key] = value
+            converted_arguments = {_PARAM_MAPPING.get(key, key): value for key, value in arguments.items()}
             
-            # Extract path parameters (e.g., {id}, {conversation_id})
-            import re
-            path_param_matches = re.findall(r'\{([^}]+)\}', endpoint_path)
-            for param in path_param_matches:
+            # Extract path parameters (e.g., {id}, {conversation_id}), found once per tool
+            for param in self._path_params[tool_name]:
                 # Check both original and mapped parameter names
                 if param in converted_arguments:
                     path_params[param] = converted_arguments[param]
@@ -1249,7 +1456,7 @@ class IntercomAdapter(BaseAdapter):
             files_data = {}
             
             for key, value in converted_arguments.items():
-                if key in ['per_page', 'page', 'starting_after', 'sort', 'order', 'display_as'] and config['method'] == 'GET':
+                if key in _QUERY_KEYS and config['method'] == 'GET':
                     query_params[key] = value
                 elif key == 'attachments' or key.endswith('_files'):
                     files_data[key] = value
@@ -1259,7 +1466,7 @@ class IntercomAdapter(BaseAdapter):
                     body_data[key] = value
             
             # Handle special Intercom API patterns
-            if tool_name in ['search_conversations', 'search_contacts', 'search_companies']:
+            if tool_name in _SEARCH_TOOLS:
                 # Search tools need special handling
                 if 'query' in body_data:
                     body_data = {'query': body_data['query']}
@@ -1295,6 +1502,111 @@ class IntercomAdapter(BaseAdapter):
                 'platform': self.platform_name
             }
     
+    async def download_to_file(self, endpoint: str, destination: str) -> int:
+        """
+        Stream a (binary) Intercom API response body to a file
+        
+        Args:
+            endpoint: API endpoint path
+            destination: File path to write
+            
+        Returns:
+            Number of bytes written
+        """
+        size = 0
+        headers = self._request_headers(accept='application/octet-stream')
+        async with self.client.stream('GET', f"{self.base_url}{endpoint}", headers=headers) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise Exception(f"Download failed (status {response.status_code}): {response.text}")
+            
+            with open(destination, 'wb') as f:
+                async for chunk in response.aiter_bytes(_EXPORT_CHUNK_BYTES):
+                    f.write(chunk)
+                    size += len(chunk)
+        return size
+    
+    async def export_contacts(self, destination: str, segment_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Write every contact, or every contact of one segment, to a JSON lines file
+        
+        Only one page of contacts is held in memory at a time.
+        
+        Args:
+            destination: File path to write
+            segment_id: Restrict the export to this segment (optional)
+            
+        Returns:
+            Export summary with the file path, contact count and size
+        """
+        count = 0
+        cursor = None
+        with open(destination, 'wb') as f:
+            while True:
+                if segment_id:
+                    pagination = {'per_page': _EXPORT_PAGE_SIZE}
+                    if cursor:
+                        pagination['starting_after'] = cursor
+                    result = await self.make_request('POST', '/contacts/search', data={
+                        'query': {'field': 'segment_id', 'operator': '=', 'value': segment_id},
+                        'pagination': pagination
+                    })
+                else:
+                    params = {'per_page': _EXPORT_PAGE_SIZE}
+                    if cursor:
+                        params['starting_after'] = cursor
+                    result = await self.make_request('GET', '/contacts', params=params)
+                
+                page = result['data'] if isinstance(result['data'], dict) else {}
+                for contact in page.get('data', []):
+                    f.write(orjson.dumps(contact))
+                    f.write(b'\n')
+                    count += 1
+                
+                next_page = (page.get('pages') or {}).get('next')
+                cursor = next_page.get('starting_after') if isinstance(next_page, dict) else None
+                if not cursor:
+                    break
+        
+        logger.info(f"📦 Exported {count} Intercom contacts to {destination}")
+        return {
+            'path': destination,
+            'contacts': count,
+            'bytes': os.path.getsize(destination)
+        }
+    
+    async def export_conversations(self, destination: str, created_at_after: int, created_at_before: int) -> Dict[str, Any]:
+        """
+        Run an Intercom content data export job and stream its archive to a file
+        
+        Args:
+            destination: File path to write (gzip archive)
+            created_at_after: Export start (Unix timestamp)
+            created_at_before: Export end (Unix timestamp)
+            
+        Returns:
+            Export summary with the job identifier, status, file path and size
+        """
+        job = await self.make_request('POST', '/export/content/data', data={
+            'created_at_after': created_at_after,
+            'created_at_before': created_at_before
+        })
+        job_id = job['data']['job_identifier']
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _EXPORT_TIMEOUT_SECONDS
+        while True:
+            status = (await self.make_request('GET', f'/export/content/data/{job_id}'))['data'].get('status')
+            if status == 'completed':
+                break
+            if status in _EXPORT_FAILED_STATUSES or loop.time() >= deadline:
+                return {'job_identifier': job_id, 'status': status, 'path': None, 'bytes': 0}
+            await asyncio.sleep(_EXPORT_POLL_SECONDS)
+        
+        size = await self.download_to_file(f'/download/content/data/{job_id}', destination)
+        logger.info(f"📦 Exported Intercom conversations ({size} bytes) to {destination}")
+        return {'job_identifier': job_id, 'status': status, 'path': destination, 'bytes': size}
+    
     async def get_health_status(self) -> Dict[str, Any]:
         """Get adapter health status and statistics"""
         try:
@@ -1329,13 +1641,14 @@ class IntercomAdapter(BaseAdapter):
         Returns:
             Unified search results
         """
+        platform = self.platform_name
         results = {
             'query': query,
             'data_type': data_type,
             'results': {},
             'total_results': 0,
             'matches': [],
-            'platform': self.platform_name
+            'platform': platform
         }
         
         try:
@@ -1364,13 +1677,12 @@ class IntercomAdapter(BaseAdapter):
                     if isinstance(conv_results['result']['data'], dict) and 'conversations' in conv_results['result']['data']:
                         conversations = conv_results['result']['data']['conversations']
                         results['total_results'] += len(conversations)
-                        for conv in conversations:
-                            results['matches'].append({
-                                'type': 'conversation',
-                                'item_id': conv.get('id'),
-                                'item_title': conv.get('source', {}).get('subject', 'Conversation'),
-                                'platform': self.platform_name
-                            })
+                        results['matches'].extend({
+                            'type': 'conversation',
+                            'item_id': conv.get('id'),
+                            'item_title': conv.get('source', {}).get('subject', 'Conversation'),
+                            'platform': platform
+                        } for conv in conversations)
             
             # Search contacts
             if data_type in ['contacts', 'all']:
@@ -1397,13 +1709,12 @@ class IntercomAdapter(BaseAdapter):
                     if isinstance(contact_results['result']['data'], dict) and 'data' in contact_results['result']['data']:
                         contacts = contact_results['result']['data']['data']
                         results['total_results'] += len(contacts)
-                        for contact in contacts:
-                            results['matches'].append({
-                                'type': 'contact',
-                                'item_id': contact.get('id'),
-                                'item_title': contact.get('name', contact.get('email', 'Contact')),
-                                'platform': self.platform_name
-                            })
+                        results['matches'].extend({
+                            'type': 'contact',
+                            'item_id': contact.get('id'),
+                            'item_title': contact.get('name') or contact.get('email') or 'Contact',
+                            'platform': platform
+                        } for contact in contacts)
             
             return results
             
@@ -1413,30 +1724,19 @@ class IntercomAdapter(BaseAdapter):
             return results
     
     async def discover_api_schema(self) -> Dict[str, Any]:
-        """Discover API schema and capabilities"""
+        """Discover API schema and capabilities (static, built once and cached)"""
+        if self._api_schema is None:
+            self._api_schema = self._build_api_schema()
+        return self._api_schema
+    
+    def _build_api_schema(self) -> Dict[str, Any]:
+        """Build the API schema and capabilities description"""
         return {
             "platform": self.platform_name,
             "api_version": self.api_version,
             "base_url": self.base_url,
             "total_tools": len(self.all_tools),
-            "categories": {
-                "conversations": ["list_conversations", "retrieve_conversation", "search_conversations", "reply_to_conversation", "assign_conversation", "close_conversation", "snooze_conversation", "open_conversation"],
-                "contacts": ["list_contacts", "retrieve_contact", "create_contact", "update_contact", "delete_contact", "search_contacts", "merge_contacts", "archive_contact", "unarchive_contact"],
-                "companies": ["list_companies", "retrieve_company", "create_company", "update_company", "delete_company", "list_company_contacts", "list_company_segments"],
-                "messages": ["create_message", "list_messages"],
-                "articles": ["list_articles", "retrieve_article", "create_article", "update_article", "delete_article", "search_articles"],
-                "admins": ["list_admins", "retrieve_admin", "set_admin_away"],
-                "teams": ["list_teams", "retrieve_team"],
-                "segments": ["list_segments", "retrieve_segment"],
-                "tags": ["list_tags", "create_tag", "delete_tag", "tag_contact", "tag_company", "untag_contact", "untag_company"],
-                "notes": ["create_note", "list_notes", "retrieve_note"],
-                "events": ["create_event", "list_events"],
-                "data_attributes": ["list_data_attributes", "create_data_attribute", "update_data_attribute"],
-                "subscription_types": ["list_subscription_types"],
-                "phone_call_redirects": ["list_phone_call_redirects", "create_phone_call_redirect"],
-                "visitors": ["retrieve_visitor", "update_visitor", "convert_visitor"],
-                "counts": ["get_app_total_count", "get_company_segment_count", "get_company_tag_count", "get_company_user_count", "get_conversation_admin_count", "get_user_segment_count", "get_user_tag_count"]
-            }
+            "categories": _CATEGORIES
         }
 
     async def get_available_tools(self) -> List[Dict[str, Any]]:
@@ -8,7 +8,8 @@ import time
 import logging
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import json
 
 logger = logging.getLogger(__name__)
@@ -24,8 +25,6 @@ class RateLimiter:
         self.max_requests = max_requests
         self.window_seconds = window_minutes * 60
         
-        # Track requests per platform using sliding window
-        self._request_history: Dict[str, deque] = defaultdict(deque)
         self._lock = asyncio.Lock()
         
         # Platform-specific rate limits (requests per minute)
@@ -36,19 +35,33 @@ class RateLimiter:
             'odoo': 1000,       # Default conservative limit
             'default': max_requests
         }
+        # Read-only view handed out by get_platform_limits (reflects updates)
+        self._platform_limits_view = MappingProxyType(self._platform_limits)
+        
+        # Track requests per platform using sliding window, preregistered for
+        # known platforms; others are added via update_platform_limit
+        self._request_history: Dict[str, deque] = {
+            p: deque() for p in self._platform_limits if p != 'default'
+        }
         
         # Track rate limit violations for reporting
         self._violations: Dict[str, int] = defaultdict(int)
         self._last_violation: Dict[str, float] = {}
         
+        # Background expiry of old request data (started on first recorded request)
+        self.cleanup_interval_seconds = 10
+        self._cleanup_task: Optional[asyncio.Task] = None
+        
+        self._initialized = True
         logger.info(f"⚡ Rate limiter initialized: {max_requests} req/{window_minutes}min")
     
-    async def check_rate_limit(self, platform: str) -> Dict[str, Any]:
+    async def check_rate_limit(self, platform: str, verbose: bool = False) -> Dict[str, Any]:
         """
         Check if a request is allowed under rate limits
         
         Args:
             platform: Platform name (freshdesk, intercom, etc.)
+            verbose: Include a user-friendly message for allowed requests
             
         Returns:
             Dict containing:
@@ -57,14 +70,17 @@ class RateLimiter:
                 - limit: int - maximum allowed requests
                 - remaining: int - requests remaining in window
                 - retry_after: int - seconds to wait if rate limited
-                - message: str - user-friendly message
+                - message: str - user-friendly message (always set when rate
+                  limited, only set for allowed requests when verbose=True)
         """
         async with self._lock:
             now = time.time()
             platform_limit = self._platform_limits.get(platform, self._platform_limits['default'])
             
             # Get request history for this platform
-            request_times = self._request_history[platform]
+            request_times = self._request_history.get(platform)
+            if request_times is None:
+                request_times = self._register_platform(platform)
             
             # Remove old requests outside the window
             cutoff_time = now - self.window_seconds
@@ -106,15 +122,17 @@ class RateLimiter:
                 }
             else:
                 # Request allowed
-                return {
+                result = {
                     'allowed': True,
                     'current_usage': current_usage,
                     'limit': platform_limit,
                     'remaining': remaining,
                     'retry_after': 0,
-                    'message': f"✅ Request allowed for {platform} ({remaining} remaining)",
                     'platform': platform
                 }
+                if verbose:
+                    result['message'] = f"✅ Request allowed for {platform} ({remaining} remaining)"
+                return result
     
     async def record_request(self, platform: str) -> None:
         """
@@ -123,17 +141,28 @@ class RateLimiter:
         Args:
             platform: Platform name
         """
+        self._ensure_cleanup_task()
+        
         async with self._lock:
             now = time.time()
-            self._request_history[platform].append(now)
+            request_times = self._request_history.get(platform)
+            if request_times is None:
+                request_times = self._register_platform(platform)
+            request_times.append(now)
             
-            # Log periodic usage stats
-            if len(self._request_history[platform]) % 10 == 0:  # Every 10 requests
-                current_usage = len(self._request_history[platform])
+            # Log periodic usage stats (only when debug logging is enabled)
+            if logger.isEnabledFor(logging.DEBUG) and len(request_times) % 10 == 0:  # Every 10 requests
+                current_usage = len(request_times)
                 limit = self._platform_limits.get(platform, self._platform_limits['default'])
                 remaining = max(0, limit - current_usage)
                 
-                logger.debug(f"📊 {platform} usage: {current_usage}/{limit} ({remaining} remaining)")
+                logger.debug("📊 %s usage: %d/%d (%d remaining)", platform, current_usage, limit, remaining)
+    
+    def _register_platform(self, platform: str) -> deque:
+        """Add request history for a platform that was not preregistered"""
+        logger.info(f"📝 Registering rate limit tracking for {platform}")
+        request_times = self._request_history[platform] = deque()
+        return request_times
     
     def _get_rate_limit_message(self, platform: str, retry_after: int, usage: int, limit: int) -> str:
         """Generate user-friendly rate limit message"""
@@ -165,6 +194,9 @@ class RateLimiter:
         """
         Get rate limiting statistics
         
+        Read-only: expired entries are skipped rather than removed; pruning
+        is left to check_rate_limit and the periodic cleanup_old_data task.
+        
         Args:
             platform: Specific platform, or None for all platforms
             
@@ -172,44 +204,52 @@ class RateLimiter:
             Dictionary of rate limiting statistics
         """
         async with self._lock:
-            now = time.time()
-            stats = {}
+            if platform:
+                history = self._request_history.get(platform)
+                snapshot = [(platform, history)] if history is not None else []
+            else:
+                snapshot = list(self._request_history.items())
+        
+        now = time.time()
+        cutoff_time = now - self.window_seconds
+        window_seconds = self.window_seconds
+        limits = self._platform_limits
+        default_limit = limits['default']
+        violations = self._violations
+        last_violation = self._last_violation
+        stats = {}
+        
+        for p, request_times in snapshot:
+            # Count expired requests at the head of the window without mutating it
+            expired = 0
+            for request_time in request_times:
+                if request_time > cutoff_time:
+                    break
+                expired += 1
             
-            platforms = [platform] if platform else self._request_history.keys()
+            current_usage = len(request_times) - expired
+            limit = limits.get(p, default_limit)
+            remaining = max(0, limit - current_usage)
             
-            for p in platforms:
-                if p not in self._request_history:
-                    continue
-                
-                # Clean old requests
-                request_times = self._request_history[p]
-                cutoff_time = now - self.window_seconds
-                while request_times and request_times[0] <= cutoff_time:
-                    request_times.popleft()
-                
-                current_usage = len(request_times)
-                limit = self._platform_limits.get(p, self._platform_limits['default'])
-                remaining = max(0, limit - current_usage)
-                
-                # Calculate requests per second
-                if request_times:
-                    time_span = now - request_times[0] if len(request_times) > 1 else self.window_seconds
-                    rps = len(request_times) / max(time_span, 1)
-                else:
-                    rps = 0
-                
-                stats[p] = {
-                    'current_usage': current_usage,
-                    'limit_per_minute': limit,
-                    'remaining': remaining,
-                    'usage_percentage': round((current_usage / limit) * 100, 2),
-                    'requests_per_second': round(rps, 2),
-                    'violations': self._violations.get(p, 0),
-                    'last_violation': self._last_violation.get(p),
-                    'window_seconds': self.window_seconds
-                }
+            # Calculate requests per second
+            if current_usage:
+                time_span = now - request_times[expired] if current_usage > 1 else window_seconds
+                rps = current_usage / max(time_span, 1)
+            else:
+                rps = 0
             
-            return stats
+            stats[p] = {
+                'current_usage': current_usage,
+                'limit_per_minute': limit,
+                'remaining': remaining,
+                'usage_percentage': round((current_usage / limit) * 100, 2),
+                'requests_per_second': round(rps, 2),
+                'violations': violations.get(p, 0),
+                'last_violation': last_violation.get(p),
+                'window_seconds': window_seconds
+            }
+        
+        return stats
     
     async def reset_platform_stats(self, platform: str) -> None:
         """Reset statistics for a specific platform"""
@@ -233,22 +273,19 @@ class RateLimiter:
         async with self._lock:
             old_limit = self._platform_limits.get(platform, self._platform_limits['default'])
             self._platform_limits[platform] = new_limit
+            if platform != 'default' and platform not in self._request_history:
+                self._register_platform(platform)
             
             logger.info(f"📝 Updated {platform} rate limit: {old_limit} → {new_limit} req/min")
     
-    def get_platform_limits(self) -> Dict[str, int]:
-        """Get all platform rate limits"""
-        return self._platform_limits.copy()
+    def get_platform_limits(self) -> Mapping[str, int]:
+        """Get all platform rate limits (read-only view)"""
+        return self._platform_limits_view
     
     async def is_healthy(self) -> bool:
         """Check if rate limiter is functioning properly"""
-        try:
-            # Simple health check - ensure data structures are accessible
-            stats = await self.get_platform_stats()
-            return True
-        except Exception as e:
-            logger.error(f"💥 Rate limiter health check failed: {e}")
-            return False
+        # O(1) liveness check - don't compute full stats for every health probe
+        return self._initialized and isinstance(self._request_history, dict)
     
     async def cleanup_old_data(self) -> None:
         """Periodic cleanup of old request data"""
@@ -270,6 +307,26 @@ class RateLimiter:
             if cleaned_platforms > 0:
                 logger.debug(f"🧹 Cleaned old request data for {cleaned_platforms} platforms")
     
+    def _ensure_cleanup_task(self) -> None:
+        """Start the periodic cleanup task if it is not already running"""
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.get_running_loop().create_task(self._run_periodic_cleanup())
+    
+    async def _run_periodic_cleanup(self) -> None:
+        """Expire old request data every cleanup_interval_seconds"""
+        while True:
+            await asyncio.sleep(self.cleanup_interval_seconds)
+            try:
+                await self.cleanup_old_data()
+            except Exception as e:
+                logger.error(f"💥 Rate limiter cleanup failed: {e}")
+    
+    def stop_cleanup_task(self) -> None:
+        """Cancel the periodic cleanup task"""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
+    
     def __str__(self) -> str:
         return f"RateLimiter(max_requests={self.max_requests}, window={self.window_seconds}s)"
     
@@ -0,0 +1,54 @@
+"""
+Request Coalescer for API Adapters
+Shares one in-flight API call between concurrent callers asking for the same thing
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCoalescer:
+    """
+    Single-flight request coalescer
+    Concurrent calls with the same key await one shared task instead of each
+    issuing its own request; the key is released as soon as the task finishes
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.stats = {
+            'calls': 0,
+            'coalesced': 0
+        }
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run factory() for key, or join the call already in flight for key
+
+        Args:
+            key: Hashable identity of the request (e.g. tool name and arguments)
+            factory: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            The shared result of the in-flight call
+        """
+        self.stats['calls'] += 1
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.stats['coalesced'] += 1
+            logger.debug("Coalesced in-flight request %r", key)
+
+        # Shield so one caller being cancelled does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight"""
+        return len(self._in_flight)
@@ -0,0 +1,98 @@
+"""
+Response Cache for API Adapters
+In-memory TTL cache with a size cap and tag-based invalidation
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries expire after a fixed TTL
+    Entries can carry tags so a mutating call can drop every entry it affects
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # key -> (expires_at, value, tags), oldest use first
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._tag_index: Dict[str, Set[Hashable]] = {}
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self.stats['misses'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = (), ttl_seconds: Optional[float] = None) -> None:
+        """Cache value under key for the TTL (or ttl_seconds), evicting the least recently used entry when full"""
+        if key in self._entries:
+            self._remove(key)
+
+        tags = tuple(tags)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.stats['evictions'] += 1
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Drop every entry carrying any of the given tags
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for tag in tags:
+            for key in self._tag_index.pop(tag, ()):
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+        if removed:
+            logger.debug("Invalidated %d cached responses", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+        self._tag_index.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove key and its tag index references"""
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
@@ -0,0 +1,71 @@
+"""
+Tool Latency Metrics for API Adapters
+Records per-tool call latency and exports it to Prometheus when available
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict
+
+logger = logging.getLogger(__name__)
+
+# Prometheus export is optional; in-process percentiles are always kept
+try:
+    from prometheus_client import Histogram
+
+    TOOL_LATENCY = Histogram(
+        "mcp_tool_seconds",
+        "MCP adapter tool call latency in seconds",
+        ["platform", "tool"]
+    )
+except ImportError:
+    TOOL_LATENCY = None
+
+
+class ToolMetrics:
+    """
+    Per-tool latency recorder
+    Keeps the most recent samples of each tool for P50/P99 reporting
+    """
+
+    def __init__(self, platform: str, max_samples: int = 1024):
+        self.platform = platform
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._calls: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+
+    def record(self, tool_name: str, seconds: float, success: bool = True) -> None:
+        """Record one call of tool_name that took the given number of seconds"""
+        samples = self._samples.get(tool_name)
+        if samples is None:
+            samples = self._samples[tool_name] = deque(maxlen=self.max_samples)
+        samples.append(seconds)
+
+        self._calls[tool_name] = self._calls.get(tool_name, 0) + 1
+        if not success:
+            self._errors[tool_name] = self._errors.get(tool_name, 0) + 1
+
+        if TOOL_LATENCY is not None:
+            TOOL_LATENCY.labels(self.platform, tool_name).observe(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize recorded latencies per tool
+
+        Returns:
+            Dict mapping tool name to calls, errors and p50/p99/max in milliseconds,
+            slowest P99 first
+        """
+        summary = {}
+        for tool_name, samples in self._samples.items():
+            ordered = sorted(samples)
+            count = len(ordered)
+            summary[tool_name] = {
+                'calls': self._calls[tool_name],
+                'errors': self._errors.get(tool_name, 0),
+                'p50_ms': round(ordered[(count - 1) // 2] * 1000, 2),
+                'p99_ms': round(ordered[min(count - 1, int(count * 0.99))] * 1000, 2),
+                'max_ms': round(ordered[-1] * 1000, 2)
+            }
+        return dict(sorted(summary.items(), key=lambda item: item[1]['p99_ms'], reverse=True))
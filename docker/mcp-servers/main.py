@@ -6,15 +6,26 @@ Port: 9000 (StreamableHTTP transport)
 """
 
 import asyncio
+import atexit
+import base64
+import contextlib
+import heapq
 import inspect
 import keyword
-import json
 import logging
 import os
+import queue
+import re
 import sys
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, Union
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import orjson
 from fastmcp import FastMCP
 from pydantic import BaseModel
 
@@ -29,44 +40,42 @@ from validation.pydantic_validator import validate_tool_parameters
 # DYNAMIC FUNCTION GENERATION FOR MCP COMPLIANCE
 # =============================================================================
 
-import inspect
-import re
-from typing import Optional
+# Common problematic params and their safe alternatives (read-only)
+_COMMON_PARAM_RENAMES = MappingProxyType({
+    'id': 'item_id',
+    'from': 'from_date',
+    'filter': 'filter_query',
+    'type': 'item_type',
+    'format': 'format_type',
+    'class': 'css_class',
+    'import': 'import_data',
+    'in': 'input_data',
+    'for': 'target',
+    'if': 'condition',
+    'per_page': 'page_size',
+    'message_type': 'msg_type',
+    'event_name': 'event_type',
+    'created_at_after': 'created_after',
+    'away_mode_enabled': 'is_away',
+    'contacts': 'contact_list',
+    'contact': 'contact_data',
+    'contact_id': 'contact_ref',
+    'conversation_id': 'conv_id',
+    'name': 'item_name',
+    'title': 'item_title',
+    'body': 'content_body',
+    'language': 'lang_code',
+    'phrase': 'search_phrase',
+    'query': 'search_query',
+    'model': 'model_type'
+})
 
 def sanitize_param_name(name: str) -> str:
     """Sanitize parameter name to be a valid Python identifier."""
     # Replace common problematic params with safe alternatives
-    common_renames = {
-        'id': 'item_id',
-        'from': 'from_date',
-        'filter': 'filter_query',
-        'type': 'item_type',
-        'format': 'format_type',
-        'class': 'css_class',
-        'import': 'import_data',
-        'in': 'input_data',
-        'for': 'target',
-        'if': 'condition',
-        'per_page': 'page_size',
-        'message_type': 'msg_type',
-        'event_name': 'event_type',
-        'created_at_after': 'created_after',
-        'away_mode_enabled': 'is_away',
-        'contacts': 'contact_list',
-        'contact': 'contact_data',
-        'contact_id': 'contact_ref',
-        'conversation_id': 'conv_id',
-        'name': 'item_name',
-        'title': 'item_title',
-        'body': 'content_body',
-        'language': 'lang_code',
-        'phrase': 'search_phrase',
-        'query': 'search_query',
-        'model': 'model_type'
-    }
-    
-    if name in common_renames:
-        return common_renames[name]
+    renamed = _COMMON_PARAM_RENAMES.get(name)
+    if renamed is not None:
+        return renamed
         
     # Replace invalid chars with underscores
     sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
@@ -81,7 +90,7 @@ def sanitize_param_name(name: str) -> str:
     # Remove trailing underscores
     sanitized = sanitized.rstrip('_')
     
-    # Handle Python keywords not caught by common_renames
+    # Handle Python keywords not caught by _COMMON_PARAM_RENAMES
     if keyword.iskeyword(sanitized):
         sanitized = f'param_{sanitized}'
         
@@ -97,15 +106,25 @@ def create_explicit_tool_function(platform_name: str, tool_name: str, tool_confi
     logger.warning(f"Dynamic tool generation disabled for {platform_name}.{tool_name} - using static decorators")
     return None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/app/logs/mcp_server.log')
-    ]
-)
+# Configure logging: callers only enqueue records; a listener thread does the
+# formatting and stdout/file I/O so handlers never block the event loop
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('/app/logs/mcp_server.log')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+# The queue handler only merges args into the message; the listener's handlers add the layout
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 # Initialize FastMCP server
@@ -119,6 +138,35 @@ mcp = FastMCP(
 freshdesk_adapter = None
 intercom_adapter = None
 active_adapters = {}
+# Rate limiters of the active adapters, resolved once at registration
+_rate_limiters = {}
+# Immutable snapshots of the active platform names, refreshed at registration
+_active_platforms: Tuple[str, ...] = ()
+_active_platform_set: frozenset = frozenset()
+# Bumped on every adapter registry change; invalidates cached tool catalogs
+_adapter_registry_version = 0
+# Serialized list_platform_tools output keyed by pretty flag: (registry version, JSON)
+_tool_catalog_cache: Dict[bool, Tuple[int, str]] = {}
+# Serialized docs://tools resource: (registry version, JSON)
+_tools_doc_cache: Optional[Tuple[int, str]] = None
+# Serialized config://server resource: (registry version, JSON)
+_server_config_cache: Optional[Tuple[int, str]] = None
+
+def _unavailable_executor(platform: str):
+    """Build a stand-in for execute_tool while no adapter is registered for platform"""
+    async def execute_tool(tool_name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
+        return {
+            'success': False,
+            'error': f"{platform.title()} adapter not available",
+            'tool_name': tool_name,
+            'platform': platform
+        }
+    return execute_tool
+
+# Bound execute_tool of the active Freshdesk/Intercom adapters, rebound at
+# registration so platform tools skip the registry lookup on every call
+_fd_execute = _unavailable_executor("freshdesk")
+_ic_execute = _unavailable_executor("intercom")
 
 class MCPServerConfig:
     """Configuration for MCP server"""
@@ -144,6 +192,10 @@ class MCPServerConfig:
     FRESHDESK_WEBHOOK_PORT = 9300
     INTERCOM_WEBHOOK_PORT = 9400
     RATE_LIMITER_PORT = 9500
+    # Optional Prometheus /metrics port (requires prometheus_client)
+    METRICS_PORT = os.getenv("MCP_METRICS_PORT")
+    # Directory for export files (defaults to the system temp directory)
+    EXPORT_DIR = os.getenv("MCP_EXPORT_DIR")
     
     # Rate limiting configuration
     RATE_LIMIT_REQUESTS_PER_MINUTE = 100
@@ -213,88 +265,284 @@ class UnifiedTicket(BaseModel):
 # ADAPTER INITIALIZATION
 # =============================================================================
 
-async def initialize_adapters():
-    """Initialize all platform adapters with configuration"""
-    global freshdesk_adapter, intercom_adapter, active_adapters
+async def _init_freshdesk():
+    """Initialize the Freshdesk adapter and test its connection"""
+    if not (MCPServerConfig.FRESHDESK_DOMAIN and MCPServerConfig.FRESHDESK_API_KEY):
+        logger.warning("⚠️  Freshdesk adapter not initialized - missing domain or API key")
+        return "freshdesk", None
+    
+    try:
+        logger.info("📄 Initializing Freshdesk adapter...")
+        adapter = FreshdeskAdapter(
+            domain=MCPServerConfig.FRESHDESK_DOMAIN,
+            api_key=MCPServerConfig.FRESHDESK_API_KEY
+        )
+        logger.info(f"✅ Freshdesk adapter initialized - Domain: {MCPServerConfig.FRESHDESK_DOMAIN}")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize Freshdesk adapter: {e}")
+        # Don't raise, continue with other adapters
+        return "freshdesk", None
+    
+    # Test connection
+    try:
+        test_result = await adapter.test_connection()
+        if test_result:
+            logger.info("✅ Freshdesk connection test passed")
+        else:
+            logger.error("❌ Freshdesk connection test failed")
+            # Don't fail the whole initialization, just log the error
+    except Exception as e:
+        logger.error(f"❌ Freshdesk connection test error: {e}")
+        # Don't fail the whole initialization, just log the error
+    
+    return "freshdesk", adapter
+
+async def _init_intercom():
+    """Initialize the Intercom adapter and test its connection"""
+    if not MCPServerConfig.INTERCOM_ACCESS_TOKEN:
+        logger.warning("⚠️  Intercom adapter not initialized - missing access token")
+        return "intercom", None
+    
+    try:
+        logger.info("📄 Initializing Intercom adapter...")
+        adapter = IntercomAdapter(
+            access_token=MCPServerConfig.INTERCOM_ACCESS_TOKEN
+        )
+        logger.info("✅ Intercom adapter initialized")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize Intercom adapter: {e}")
+        # Don't raise, continue with other adapters
+        return "intercom", None
+    
+    # Test connection
+    try:
+        test_result = await adapter.test_connection()
+        if test_result:
+            logger.info("✅ Intercom connection test passed")
+        else:
+            logger.error("❌ Intercom connection test failed")
+    except Exception as e:
+        logger.error(f"❌ Intercom connection test error: {e}")
+    
+    return "intercom", adapter
+
+def _refresh_adapter_registry():
+    """Refresh derived adapter state and invalidate caches after a registry change"""
+    global _active_platforms, _active_platform_set, _adapter_registry_version
+    
+    _active_platforms = tuple(active_adapters)
+    _active_platform_set = frozenset(_active_platforms)
+    _adapter_registry_version += 1
+
+def register_adapter(platform: str, adapter):
+    """Add an adapter to the active registry"""
+    global freshdesk_adapter, intercom_adapter, _fd_execute, _ic_execute
+    
+    active_adapters[platform] = adapter
+    rate_limiter = getattr(adapter, 'rate_limiter', None)
+    if rate_limiter is not None:
+        _rate_limiters[platform] = rate_limiter
+    if platform == "freshdesk":
+        freshdesk_adapter = adapter
+        _fd_execute = adapter.execute_tool
+    elif platform == "intercom":
+        intercom_adapter = adapter
+        _ic_execute = adapter.execute_tool
+    
+    _refresh_adapter_registry()
+
+def clear_adapters():
+    """Remove all adapters from the active registry"""
+    global freshdesk_adapter, intercom_adapter, _fd_execute, _ic_execute
     
-    # Clear any existing adapters
     active_adapters.clear()
+    _rate_limiters.clear()
     freshdesk_adapter = None
+    _fd_execute = _unavailable_executor("freshdesk")
     intercom_adapter = None
+    _ic_execute = _unavailable_executor("intercom")
     
-    logger.info("🔧 Initializing platform adapters...")
-    
-    # Initialize Freshdesk adapter
-    if MCPServerConfig.FRESHDESK_DOMAIN and MCPServerConfig.FRESHDESK_API_KEY:
+    _refresh_adapter_registry()
+
+async def close_adapters():
+    """Close all active adapters and release their HTTP connection pools"""
+    for platform, adapter in list(active_adapters.items()):
+        close = getattr(adapter, 'close', None)
+        if close is None:
+            continue
         try:
-            logger.info("📄 Initializing Freshdesk adapter...")
-            freshdesk_adapter = FreshdeskAdapter(
-                domain=MCPServerConfig.FRESHDESK_DOMAIN,
-                api_key=MCPServerConfig.FRESHDESK_API_KEY
-            )
-            active_adapters["freshdesk"] = freshdesk_adapter
-            logger.info(f"✅ Freshdesk adapter initialized - Domain: {MCPServerConfig.FRESHDESK_DOMAIN}")
-            
-            # Test connection
-            try:
-                test_result = await freshdesk_adapter.test_connection()
-                if test_result:
-                    logger.info("✅ Freshdesk connection test passed")
-                else:
-                    logger.error("❌ Freshdesk connection test failed")
-                    # Don't fail the whole initialization, just log the error
-            except Exception as e:
-                logger.error(f"❌ Freshdesk connection test error: {e}")
-                # Don't fail the whole initialization, just log the error
-                
+            await close()
         except Exception as e:
-            logger.error(f"❌ Failed to initialize Freshdesk adapter: {e}")
-            # Don't raise, continue with other adapters
-    else:
-        logger.warning("⚠️  Freshdesk adapter not initialized - missing domain or API key")
+            logger.error(f"❌ Failed to close {platform} adapter: {e}")
+
+async def initialize_adapters():
+    """Initialize all platform adapters with configuration"""
+    # Clear any existing adapters
+    clear_adapters()
     
-    # Initialize Intercom adapter
-    if MCPServerConfig.INTERCOM_ACCESS_TOKEN:
-        try:
-            logger.info("📄 Initializing Intercom adapter...")
-            intercom_adapter = IntercomAdapter(
-                access_token=MCPServerConfig.INTERCOM_ACCESS_TOKEN
-            )
-            active_adapters["intercom"] = intercom_adapter
-            logger.info("✅ Intercom adapter initialized")
-            
-            # Test connection
-            try:
-                test_result = await intercom_adapter.test_connection()
-                if test_result:
-                    logger.info("✅ Intercom connection test passed")
-                else:
-                    logger.error("❌ Intercom connection test failed")
-            except Exception as e:
-                logger.error(f"❌ Intercom connection test error: {e}")
-                
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize Intercom adapter: {e}")
-            # Don't raise, continue with other adapters
-    else:
-        logger.warning("⚠️  Intercom adapter not initialized - missing access token")
+    logger.info("🔧 Initializing platform adapters...")
     
-    logger.info(f"🎯 Successfully initialized {len(active_adapters)}/{2} platform adapters")
+    # Set up adapters and run their connection tests concurrently
+    results = await asyncio.gather(_init_freshdesk(), _init_intercom(), return_exceptions=True)
+    
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error(f"❌ Adapter initialization error: {result}")
+            continue
+        
+        platform, adapter = result
+        if adapter is not None:
+            register_adapter(platform, adapter)
+    
+    logger.info(f"🎯 Successfully initialized {len(active_adapters)}/{len(results)} platform adapters")
     
     if not active_adapters:
         logger.warning("⚠️  No adapters were successfully initialized. Check your configuration and logs.")
     
     return len(active_adapters) > 0
 
+# =============================================================================
+# TOOL HELPERS
+# =============================================================================
+
+# Unified (cross-platform) tools exposed by this server
+_UNIFIED_TOOLS = ("health_check", "unified_search", "get_customer_journey", "list_platform_tools", "get_rate_limit_status")
+_UNIFIED_TOOLS_COUNT = len(_UNIFIED_TOOLS)
+
+# Static server-wide rate limits reported by get_rate_limit_status
+_GLOBAL_LIMITS = {
+    "server_limit": MCPServerConfig.RATE_LIMIT_REQUESTS_PER_MINUTE,
+    "freshdesk_limit": MCPServerConfig.FRESHDESK_RATE_LIMIT,
+    "intercom_limit": MCPServerConfig.INTERCOM_RATE_LIMIT
+}
+
+# orjson options for compact (machine) and indented (human) tool output
+_COMPACT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+_PRETTY_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+# Sort key for timeline events; events without a timestamp sort first
+_TIMESTAMP_KEY = lambda event: event.get("timestamp", "")
+
+def _dump(obj: Any, pretty: bool = False) -> str:
+    """Serialize a tool response to JSON using orjson, indented only when pretty is set"""
+    option = _PRETTY_JSON_OPTIONS if pretty else _COMPACT_JSON_OPTIONS
+    return orjson.dumps(obj, option=option, default=str).decode()
+
+def _encode_fields(fields: Iterable[Tuple[str, Any]], out: List[bytes]) -> None:
+    """Append the compact JSON object for (key, value) pairs to out"""
+    out.append(b"{")
+    for index, (key, value) in enumerate(fields):
+        if index:
+            out.append(b",")
+        out.append(orjson.dumps(key))
+        out.append(b":")
+        if isinstance(value, bytes):
+            out.append(value)
+        elif isinstance(value, Iterator):
+            _encode_fields(value, out)
+        else:
+            out.append(orjson.dumps(value, option=_COMPACT_JSON_OPTIONS, default=str))
+    out.append(b"}")
+
+def _collect_fields(fields: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Materialize (key, value) pairs, including nested and pre-encoded ones, into a dict"""
+    return {
+        key: orjson.loads(value) if isinstance(value, bytes)
+        else _collect_fields(value) if isinstance(value, Iterator)
+        else value
+        for key, value in fields
+    }
+
+def _dump_fields(fields: Iterable[Tuple[str, Any]], pretty: bool = False) -> str:
+    """
+    Serialize a JSON object from (key, value) pairs, encoding each value as it is produced
+    
+    A value may be pre-encoded JSON bytes or an iterator of nested (key, value) pairs,
+    so large responses never have to exist as one complete dict. Pretty output needs
+    the whole structure for indentation and is materialized first.
+    """
+    if pretty:
+        return _dump(_collect_fields(fields), pretty=True)
+    out: List[bytes] = []
+    _encode_fields(fields, out)
+    return b"".join(out).decode()
+
+async def _gather_rate_limit_stats() -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetch rate limiter stats for all active platforms in one concurrent batch
+    
+    Returns:
+        Dict mapping each platform that has a rate limiter to its stats (None if no data)
+    """
+    limited = list(_rate_limiters.items())
+    results = await asyncio.gather(*(limiter.get_platform_stats(platform) for platform, limiter in limited))
+    return {platform: stats.get(platform) for (platform, _), stats in zip(limited, results)}
+
+def _record_adapter_error(platform: str, sink: Dict[str, Any], action: str, error: BaseException) -> None:
+    """Record a failure of one platform in sink"""
+    sink[platform] = {"error": str(error)}
+    logger.error(f"{action} error on {platform}: {error}")
+
+@contextlib.contextmanager
+def _adapter_guard(platform: str, sink: Dict[str, Any], action: str):
+    """Record a failure of one platform in sink instead of failing the whole tool"""
+    try:
+        yield
+    except Exception as e:
+        _record_adapter_error(platform, sink, action, e)
+
+async def _bounded(semaphore: asyncio.Semaphore, coro):
+    """Await coro once a semaphore slot is free"""
+    async with semaphore:
+        return await coro
+
+async def _fan_out(platform: str, execute, action: str, payloads: Sequence[Dict[str, Any]], concurrency: int) -> str:
+    """
+    Run one adapter tool call per payload concurrently (bounded) and merge the results
+    
+    Args:
+        platform: Platform name reported in the result
+        execute: Bound adapter execute_tool
+        action: Adapter tool name
+        payloads: Arguments for each call
+        concurrency: Maximum calls in flight
+        
+    Returns:
+        JSON of the merged execute_tool-style result with per-call results and errors
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(*(
+        _bounded(semaphore, execute(action, payload))
+        for payload in payloads
+    ))
+    
+    return _dump({
+        'success': all(result.get('success') for result in results),
+        'tool_name': action,
+        'result': [result.get('result') for result in results if result.get('success')],
+        'errors': [result.get('error') for result in results if not result.get('success')],
+        'requests': len(results),
+        'platform': platform
+    })
+
+async def _call_adapter(method, *args):
+    """Call an adapter method, awaiting async ones and offloading sync ones to a thread"""
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+    return await asyncio.to_thread(method, *args)
+
 # =============================================================================
 # UNIFIED MCP TOOLS - High Level
 # =============================================================================
 
 @mcp.tool()
-async def health_check() -> str:
+async def health_check(pretty: bool = False) -> str:
     """
     Get comprehensive health status of the MCP server and all integrated platforms.
     
+    Args:
+        pretty (bool): Indent the JSON output for human readers (default: compact)
+    
     Returns:
         str: Detailed health status including adapter status, rate limits, and connection tests
     """
@@ -312,42 +560,47 @@ async def health_check() -> str:
             "total_tools": 0
         }
         
+        rate_limit_stats = await _gather_rate_limit_stats()
+        
+        total_tools = 0
         for platform, adapter in active_adapters.items():
             # Get adapter health
-            health_data["adapters"][platform] = {
-                "status": "connected",
-                "total_tools": len(adapter.get_tools()),
-                "tools_registered": len([tool for tool in adapter.get_tools() if tool])
-            }
+            with _adapter_guard(platform, health_data["adapters"], "Health check"):
+                tools = adapter.get_tools()
+                total_tools += len(tools)
+                health_data["adapters"][platform] = {
+                    "status": "connected",
+                    "total_tools": len(tools),
+                    "tools_registered": sum(1 for tool in tools if tool)
+                }
             
             # Get rate limit status
-            if hasattr(adapter, 'rate_limiter'):
-                platform_stats = await adapter.rate_limiter.get_platform_stats(platform)
-                if platform in platform_stats:
-                    rate_status = platform_stats[platform]
-                    health_data["rate_limits"][platform] = {
-                        "requests_made": rate_status["current_usage"],
-                        "limit": rate_status["limit_per_minute"],
-                        "remaining": rate_status["remaining"],
-                        "usage_percentage": rate_status["usage_percentage"]
-                    }
+            rate_status = rate_limit_stats.get(platform)
+            if rate_status:
+                health_data["rate_limits"][platform] = {
+                    "requests_made": rate_status["current_usage"],
+                    "limit": rate_status["limit_per_minute"],
+                    "remaining": rate_status["remaining"],
+                    "usage_percentage": rate_status["usage_percentage"]
+                }
         
-        health_data["total_tools"] = sum(len(adapter.get_tools()) for adapter in active_adapters.values()) + 5  # +5 for unified tools
+        health_data["total_tools"] = total_tools + _UNIFIED_TOOLS_COUNT
         
-        return json.dumps(health_data, indent=2, default=str)
+        return _dump(health_data, pretty)
         
     except Exception as e:
         logger.error(f"Health check error: {e}")
         return f"❌ Health check failed: {str(e)}"
 
 @mcp.tool()
-def unified_search(query: str, platforms: str = "all") -> str:
+async def unified_search(query: str, platforms: str = "all", pretty: bool = False) -> str:
     """
     Search across multiple platforms simultaneously for customers, tickets, conversations, and articles.
     
     Args:
         query (str): Search query (email, name, ticket ID, or keyword)
         platforms (str): Comma-separated platforms to search ("freshdesk", "intercom", or "all")
+        pretty (bool): Indent the JSON output for human readers (default: compact)
     
     Returns:
         str: Unified search results from all specified platforms
@@ -356,14 +609,13 @@ def unified_search(query: str, platforms: str = "all") -> str:
         if not query.strip():
             return "❌ Search query cannot be empty"
         
-        search_platforms = []
         if platforms == "all":
-            search_platforms = list(active_adapters.keys())
+            search_platforms = _active_platforms
         else:
-            search_platforms = [p.strip() for p in platforms.split(",") if p.strip() in active_adapters]
+            search_platforms = [name for name in (p.strip() for p in platforms.split(",")) if name in _active_platform_set]
         
         if not search_platforms:
-            return f"❌ No valid platforms specified. Available: {list(active_adapters.keys())}"
+            return f"❌ No valid platforms specified. Available: {list(_active_platforms)}"
         
         unified_results = {
             "query": query,
@@ -373,133 +625,169 @@ def unified_search(query: str, platforms: str = "all") -> str:
             "timestamp": datetime.now().isoformat()
         }
         
-        for platform in search_platforms:
-            adapter = active_adapters[platform]
-            try:
-                # Use adapter's unified search capability
-                platform_results = adapter.unified_search(query)
-                unified_results["results"][platform] = platform_results
-                
-                # Count matches
-                if isinstance(platform_results, dict) and "matches" in platform_results:
-                    unified_results["total_matches"] += len(platform_results["matches"])
-                    
-            except Exception as e:
-                unified_results["results"][platform] = {"error": str(e)}
-                logger.error(f"Search error on {platform}: {e}")
+        # Use each adapter's unified search capability, all platforms concurrently
+        search_results = await asyncio.gather(
+            *(_call_adapter(active_adapters[platform].unified_search, query) for platform in search_platforms),
+            return_exceptions=True
+        )
+        
+        for platform, platform_results in zip(search_platforms, search_results):
+            if isinstance(platform_results, BaseException):
+                _record_adapter_error(platform, unified_results["results"], "Search", platform_results)
+                continue
+            
+            unified_results["results"][platform] = platform_results
+            
+            # Count matches
+            if isinstance(platform_results, dict) and "matches" in platform_results:
+                unified_results["total_matches"] += len(platform_results["matches"])
         
-        return json.dumps(unified_results, indent=2, default=str)
+        return _dump(unified_results, pretty)
         
     except Exception as e:
         logger.error(f"Unified search error: {e}")
         return f"❌ Unified search failed: {str(e)}"
 
 @mcp.tool()
-def get_customer_journey(identifier: str, identifier_type: str = "email") -> str:
+async def get_customer_journey(identifier: str, identifier_type: str = "email", pretty: bool = False) -> str:
     """
     Get complete customer journey across all platforms.
     
     Args:
         identifier (str): Customer identifier (email, phone, or customer ID)
         identifier_type (str): Type of identifier ("email", "phone", "id")
+        pretty (bool): Indent the JSON output for human readers (default: compact)
     
     Returns:
         str: Complete customer journey with unified timeline
     """
     try:
-        journey = {
-            "customer_identifier": identifier,
-            "identifier_type": identifier_type,
-            "platforms": {},
-            "unified_timeline": [],
-            "summary": {
-                "total_interactions": 0,
-                "first_contact": None,
-                "last_contact": None,
-                "platforms_found": []
-            }
-        }
+        # Get customer data from each platform concurrently
+        journey_platforms = list(active_adapters.items())
+        journey_results = await asyncio.gather(
+            *(_call_adapter(adapter.get_customer_journey, identifier, identifier_type) for _, adapter in journey_platforms),
+            return_exceptions=True
+        )
         
-        for platform, adapter in active_adapters.items():
-            try:
-                # Get customer data from each platform
-                customer_data = adapter.get_customer_journey(identifier, identifier_type)
-                journey["platforms"][platform] = customer_data
-                
-                if customer_data and "timeline" in customer_data:
-                    journey["unified_timeline"].extend(customer_data["timeline"])
-                    journey["summary"]["platforms_found"].append(platform)
-                    
-            except Exception as e:
-                journey["platforms"][platform] = {"error": str(e)}
-                logger.error(f"Customer journey error on {platform}: {e}")
+        # Encode each platform payload as soon as it is processed and release it,
+        # keeping only the timeline events needed for the merge below
+        encoded_platforms = []
+        platform_timelines = []
+        platforms_found = []
+        platform_errors = {}
+        for index, (platform, _) in enumerate(journey_platforms):
+            customer_data = journey_results[index]
+            journey_results[index] = None
+            
+            if isinstance(customer_data, BaseException):
+                _record_adapter_error(platform, platform_errors, "Customer journey", customer_data)
+            else:
+                # Sorting can still fail on malformed timeline events
+                with _adapter_guard(platform, platform_errors, "Customer journey"):
+                    if customer_data and "timeline" in customer_data:
+                        # Adapters return their timelines already ordered (possibly newest
+                        # first), so this sort is a linear pass over a single run
+                        platform_timelines.append(sorted(customer_data["timeline"], key=_TIMESTAMP_KEY))
+                        platforms_found.append(platform)
+            
+            customer_data = platform_errors.get(platform, customer_data)
+            encoded_platforms.append(
+                (platform, orjson.dumps(customer_data, option=_COMPACT_JSON_OPTIONS, default=str))
+            )
         
-        # Sort unified timeline by date
-        journey["unified_timeline"].sort(key=lambda x: x.get("timestamp", ""))
+        # Merge the per-platform timelines into one ordered by date, collecting
+        # the summary stats in the same pass
+        timeline = []
+        first_contact = last_contact = None
+        for event in heapq.merge(*platform_timelines, key=_TIMESTAMP_KEY):
+            last_contact = event.get("timestamp")
+            if not timeline:
+                first_contact = last_contact
+            timeline.append(event)
         
-        # Calculate summary stats
-        journey["summary"]["total_interactions"] = len(journey["unified_timeline"])
-        if journey["unified_timeline"]:
-            journey["summary"]["first_contact"] = journey["unified_timeline"][0].get("timestamp")
-            journey["summary"]["last_contact"] = journey["unified_timeline"][-1].get("timestamp")
+        summary = {
+            "total_interactions": len(timeline),
+            "first_contact": first_contact,
+            "last_contact": last_contact,
+            "platforms_found": platforms_found
+        }
         
-        return json.dumps(journey, indent=2, default=str)
+        return _dump_fields((
+            ("customer_identifier", identifier),
+            ("identifier_type", identifier_type),
+            ("platforms", iter(encoded_platforms)),
+            ("unified_timeline", timeline),
+            ("summary", summary)
+        ), pretty)
         
     except Exception as e:
         logger.error(f"Customer journey error: {e}")
         return f"❌ Customer journey failed: {str(e)}"
 
 @mcp.tool()
-def list_platform_tools() -> str:
+async def list_platform_tools(pretty: bool = False) -> str:
     """
     List all available tools from all connected platforms.
     
+    Args:
+        pretty (bool): Indent the JSON output for human readers (default: compact)
+    
     Returns:
         str: Categorized list of all available platform tools
     """
     try:
-        tools_catalog = {
-            "total_platforms": len(active_adapters),
-            "total_tools": 0,
-            "platforms": {}
-        }
+        # The catalog only changes when adapters are (re)registered
+        cached = _tool_catalog_cache.get(pretty)
+        if cached is not None and cached[0] == _adapter_registry_version:
+            return cached[1]
         
-        for platform, adapter in active_adapters.items():
-            platform_tools = adapter.get_tools()
-            tools_catalog["platforms"][platform] = {
-                "total_tools": len(platform_tools),
-                "categories": {},
-                "tools": platform_tools
-            }
-            
-            # Categorize tools
-            for tool in platform_tools:
-                category = tool.split('_')[0] if '_' in tool else 'general'
-                if category not in tools_catalog["platforms"][platform]["categories"]:
-                    tools_catalog["platforms"][platform]["categories"][category] = []
-                tools_catalog["platforms"][platform]["categories"][category].append(tool)
-            
-            tools_catalog["total_tools"] += len(platform_tools)
+        catalog_version = _adapter_registry_version
+        platform_tool_lists = [(platform, adapter.get_tools()) for platform, adapter in active_adapters.items()]
+        total_tools = sum(len(platform_tools) for _, platform_tools in platform_tool_lists)
         
-        # Add unified tools
-        unified_tools = ["health_check", "unified_search", "get_customer_journey", "list_platform_tools", "get_rate_limit_status"]
-        tools_catalog["unified_tools"] = {
-            "total": len(unified_tools),
-            "tools": unified_tools
-        }
-        tools_catalog["total_tools"] += len(unified_tools)
+        def platform_catalogs():
+            # Build and encode one platform catalog at a time
+            for platform, platform_tools in platform_tool_lists:
+                # Categorize tools by the prefix before the first underscore
+                categories = defaultdict(list)
+                for tool in platform_tools:
+                    # Freshdesk lists tool names, Intercom tool definition dicts
+                    name = tool["name"] if isinstance(tool, dict) else tool
+                    idx = name.find('_')
+                    categories[name[:idx] if idx != -1 else 'general'].append(name)
+                
+                yield platform, {
+                    "total_tools": len(platform_tools),
+                    "categories": dict(categories),
+                    "tools": platform_tools
+                }
+        
+        catalog_json = _dump_fields((
+            ("total_platforms", len(active_adapters)),
+            ("total_tools", total_tools + _UNIFIED_TOOLS_COUNT),
+            ("platforms", platform_catalogs()),
+            # Add unified tools
+            ("unified_tools", {
+                "total": _UNIFIED_TOOLS_COUNT,
+                "tools": _UNIFIED_TOOLS
+            })
+        ), pretty)
         
-        return json.dumps(tools_catalog, indent=2)
+        _tool_catalog_cache[pretty] = (catalog_version, catalog_json)
+        return catalog_json
         
     except Exception as e:
         logger.error(f"List platform tools error: {e}")
         return f"❌ List platform tools failed: {str(e)}"
 
 @mcp.tool()
-async def get_rate_limit_status() -> str:
+async def get_rate_limit_status(pretty: bool = False) -> str:
     """
     Get current rate limit status for all integrated platforms.
     
+    Args:
+        pretty (bool): Indent the JSON output for human readers (default: compact)
+    
     Returns:
         str: Detailed rate limit information and current usage for all platforms
     """
@@ -507,18 +795,15 @@ async def get_rate_limit_status() -> str:
         rate_status = {
             "timestamp": datetime.now().isoformat(),
             "platforms": {},
-            "global_limits": {
-                "server_limit": MCPServerConfig.RATE_LIMIT_REQUESTS_PER_MINUTE,
-                "freshdesk_limit": MCPServerConfig.FRESHDESK_RATE_LIMIT,
-                "intercom_limit": MCPServerConfig.INTERCOM_RATE_LIMIT
-            }
+            "global_limits": _GLOBAL_LIMITS
         }
         
-        for platform, adapter in active_adapters.items():
-            if hasattr(adapter, 'rate_limiter'):
-                platform_stats = await adapter.rate_limiter.get_platform_stats(platform)
-                if platform in platform_stats:
-                    limiter_status = platform_stats[platform]
+        rate_limit_stats = await _gather_rate_limit_stats()
+        
+        for platform in active_adapters:
+            if platform in rate_limit_stats:
+                limiter_status = rate_limit_stats[platform]
+                if limiter_status:
                     rate_status["platforms"][platform] = {
                         "requests_made": limiter_status["current_usage"],
                         "limit_per_minute": limiter_status["limit_per_minute"],
@@ -532,7 +817,7 @@ async def get_rate_limit_status() -> str:
             else:
                 rate_status["platforms"][platform] = {"status": "rate_limiter_not_configured"}
         
-        return json.dumps(rate_status, indent=2)
+        return _dump(rate_status, pretty)
         
     except Exception as e:
         logger.error(f"Rate limit status error: {e}")
@@ -546,1133 +831,1003 @@ async def get_rate_limit_status() -> str:
 # STATIC TOOL DEFINITIONS - FRESHDESK
 # =============================================================================
 
-@mcp.tool()
-async def freshdesk_list_tickets(per_page: int = 10, page: int = 1) -> str:
-    """List all tickets from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_tickets", {"per_page": per_page, "page": page})
+# Marks a tool parameter without a default
+_REQUIRED = inspect.Parameter.empty
+
+# Declarative freshdesk_<action> tool table: (action, description, parameters).
+# Each parameter is (name, type, default[, API field]); optional parameters
+# default to None and are only sent when not None.
+_FRESHDESK_TOOL_SPECS: Tuple[Tuple[str, str, Tuple[tuple, ...]], ...] = (
+    ("list_tickets", "List all tickets from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("create_ticket", "Create a new support ticket in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("email", str, _REQUIRED),
+        ("subject", str, _REQUIRED),
+        ("description", str, _REQUIRED),
+        ("status", int, 2),
+        ("priority", int, 1),
+    )),
+    ("view_ticket", "Retrieve a specific ticket by ID from Freshdesk", (("ticket_id", str, _REQUIRED, "id"),)),
+    ("update_ticket", "Update an existing ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED, "id"),
+        ("subject", str, None),
+        ("description", str, None),
+        ("status", int, None),
+        ("priority", int, None),
+    )),
+    ("delete_ticket", "Delete a ticket from Freshdesk", (("ticket_id", str, _REQUIRED, "id"),)),
+    ("list_contacts", "List all contacts from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("create_contact", "Create a new contact in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("email", str, _REQUIRED),
+        ("phone", str, None),
+        ("company_id", str, None),
+    )),
+    ("view_contact", "Retrieve a specific contact by ID from Freshdesk", (("contact_id", str, _REQUIRED, "id"),)),
+    ("add_note_to_ticket", "Add a note to an existing ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED, "id"),
+        ("body", str, _REQUIRED),
+        ("private", bool, True),
+    )),
+    ("filter_tickets", "Filter tickets using advanced search in Freshdesk", (("query", str, _REQUIRED),)),
+    ("create_company", "Create a new company in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("description", str, None),
+        ("website", str, None),
+    )),
+    ("view_company", "Retrieve a specific company by ID from Freshdesk", (("company_id", str, _REQUIRED, "id"),)),
+    ("list_companies", "List all companies from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("update_company", "Update an existing company in Freshdesk", (
+        ("company_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("description", str, None),
+        ("website", str, None),
+    )),
+    ("delete_company", "Delete a company from Freshdesk", (("company_id", str, _REQUIRED, "id"),)),
+    ("list_agents", "List all agents from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("create_agent", "Create a new agent in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("email", str, _REQUIRED),
+        ("phone", str, None),
+    )),
+    ("view_agent", "Retrieve a specific agent by ID from Freshdesk", (("agent_id", str, _REQUIRED, "id"),)),
+    ("update_agent", "Update an existing agent in Freshdesk", (
+        ("agent_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("email", str, None),
+        ("phone", str, None),
+    )),
+    ("delete_agent", "Delete an agent from Freshdesk", (("agent_id", str, _REQUIRED, "id"),)),
+    ("list_groups", "List all groups from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("create_group", "Create a new group in Freshdesk", (("name", str, _REQUIRED), ("description", str, None))),
+    ("view_group", "Retrieve a specific group by ID from Freshdesk", (("group_id", str, _REQUIRED, "id"),)),
+    ("update_group", "Update an existing group in Freshdesk", (
+        ("group_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("description", str, None),
+    )),
+    ("delete_group", "Delete a group from Freshdesk", (("group_id", str, _REQUIRED, "id"),)),
+    ("create_comment", "Create a comment on a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED, "id"),
+        ("body", str, _REQUIRED),
+        ("private", bool, False),
+    )),
+    ("create_reply", "Create a reply to a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED, "id"),
+        ("body", str, _REQUIRED),
+        ("from_email", str, None),
+    )),
+    ("list_time_entries", "List time entries from Freshdesk", (
+        ("ticket_id", str, None),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("create_time_entry", "Create a time entry for a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("time_spent", str, _REQUIRED),
+        ("note", str, None),
+    )),
+    ("view_time_entry", "Retrieve a specific time entry by ID from Freshdesk", (
+        ("time_entry_id", str, _REQUIRED, "id"),
+    )),
+    ("update_time_entry", "Update an existing time entry in Freshdesk", (
+        ("time_entry_id", str, _REQUIRED, "id"),
+        ("time_spent", str, None),
+        ("note", str, None),
+    )),
+    ("delete_time_entry", "Delete a time entry from Freshdesk", (("time_entry_id", str, _REQUIRED, "id"),)),
+    ("filter_contacts", "Filter contacts using advanced search in Freshdesk", (("query", str, _REQUIRED),)),
+    ("filter_companies", "Filter companies using advanced search in Freshdesk", (("query", str, _REQUIRED),)),
+    ("merge_tickets", "Merge two tickets in Freshdesk", (
+        ("primary_ticket_id", str, _REQUIRED),
+        ("secondary_ticket_id", str, _REQUIRED),
+    )),
+    ("merge_contacts", "Merge two contacts in Freshdesk", (
+        ("primary_contact_id", str, _REQUIRED),
+        ("secondary_contact_id", str, _REQUIRED),
+    )),
+    ("add_watcher", "Add a watcher to a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("user_id", str, _REQUIRED),
+    )),
+    ("remove_watcher", "Remove a watcher from a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("user_id", str, _REQUIRED),
+    )),
+    ("list_conversations", "List all conversations from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("update_conversation", "Update a conversation in Freshdesk", (
+        ("conversation_id", str, _REQUIRED, "id"),
+        ("status", str, None),
+    )),
+    ("delete_conversation", "Delete a conversation from Freshdesk", (("conversation_id", str, _REQUIRED, "id"),)),
+    ("restore_contact", "Restore a deleted contact in Freshdesk", (("contact_id", str, _REQUIRED, "id"),)),
+    ("make_agent", "Convert a contact to an agent in Freshdesk", (("contact_id", str, _REQUIRED, "id"),)),
+    ("send_invite", "Send an invite to an agent in Freshdesk", (("agent_id", str, _REQUIRED, "id"),)),
+    ("list_solution_articles", "List all solution articles from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("create_solution_article", "Create a new solution article in Freshdesk", (
+        ("title", str, _REQUIRED),
+        ("description", str, _REQUIRED),
+        ("folder_id", str, _REQUIRED),
+    )),
+    ("view_solution_article", "Retrieve a specific solution article by ID from Freshdesk", (
+        ("article_id", str, _REQUIRED, "id"),
+    )),
+    ("update_solution_article", "Update an existing solution article in Freshdesk", (
+        ("article_id", str, _REQUIRED, "id"),
+        ("title", str, None),
+        ("description", str, None),
+    )),
+    ("delete_solution_article", "Delete a solution article from Freshdesk", (("article_id", str, _REQUIRED, "id"),)),
+    ("list_solution_categories", "List all solution categories from Freshdesk", (
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("create_solution_category", "Create a new solution category in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("description", str, None),
+    )),
+    ("view_solution_category", "Retrieve a specific solution category by ID from Freshdesk", (
+        ("category_id", str, _REQUIRED, "id"),
+    )),
+    ("update_solution_category", "Update an existing solution category in Freshdesk", (
+        ("category_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("description", str, None),
+    )),
+    ("delete_solution_category", "Delete a solution category from Freshdesk", (("category_id", str, _REQUIRED, "id"),)),
+    ("list_solution_folders", "List all solution folders from a category in Freshdesk", (
+        ("category_id", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("create_solution_folder", "Create a new solution folder in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("category_id", str, _REQUIRED),
+        ("description", str, None),
+    )),
+    ("view_solution_folder", "Retrieve a specific solution folder by ID from Freshdesk", (
+        ("folder_id", str, _REQUIRED, "id"),
+    )),
+    ("update_solution_folder", "Update an existing solution folder in Freshdesk", (
+        ("folder_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("description", str, None),
+    )),
+    ("delete_solution_folder", "Delete a solution folder from Freshdesk", (("folder_id", str, _REQUIRED, "id"),)),
+    ("list_forums", "List all forums from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("create_forum", "Create a new forum in Freshdesk", (("name", str, _REQUIRED), ("description", str, None))),
+    ("list_forum_categories", "List all forum categories from Freshdesk", (
+        ("forum_id", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("create_forum_category", "Create a new forum category in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("forum_id", str, _REQUIRED),
+        ("description", str, None),
+    )),
+    ("list_topics", "List all topics from a forum category in Freshdesk", (
+        ("category_id", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("create_topic", "Create a new topic in a forum category in Freshdesk", (
+        ("title", str, _REQUIRED),
+        ("message", str, _REQUIRED),
+        ("category_id", str, _REQUIRED),
+    )),
+    ("view_topic", "Retrieve a specific topic by ID from Freshdesk", (("topic_id", str, _REQUIRED, "id"),)),
+    ("update_topic", "Update an existing topic in Freshdesk", (
+        ("topic_id", str, _REQUIRED, "id"),
+        ("title", str, None),
+        ("message", str, None),
+    )),
+    ("delete_topic", "Delete a topic from Freshdesk", (("topic_id", str, _REQUIRED, "id"),)),
+    ("monitor_topic", "Monitor a topic for updates in Freshdesk", (("topic_id", str, _REQUIRED, "id"),)),
+    ("list_ratings", "List all ratings from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("create_rating", "Create a rating for a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("rating", int, _REQUIRED),
+        ("feedback", str, None),
+    )),
+    ("view_ratings", "View ratings for a specific ticket in Freshdesk", (("ticket_id", str, _REQUIRED),)),
+    ("list_mailboxes", "List all mailboxes from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("create_mailbox", "Create a new mailbox in Freshdesk", (("name", str, _REQUIRED), ("email", str, _REQUIRED))),
+    ("view_mailbox", "Retrieve a specific mailbox by ID from Freshdesk", (("mailbox_id", str, _REQUIRED, "id"),)),
+    ("update_mailbox", "Update an existing mailbox in Freshdesk", (
+        ("mailbox_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("email", str, None),
+    )),
+    ("delete_mailbox", "Delete a mailbox from Freshdesk", (("mailbox_id", str, _REQUIRED, "id"),)),
+    ("mailbox_settings", "Get mailbox settings from Freshdesk", (("mailbox_id", str, _REQUIRED, "id"),)),
+    ("list_sla_policies", "List all SLA policies from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("view_sla_policy", "Retrieve a specific SLA policy by ID from Freshdesk", (("policy_id", str, _REQUIRED, "id"),)),
+    ("list_business_hours", "List all business hours from Freshdesk", (("per_page", int, 10), ("page", int, 1))),
+    ("view_business_hour", "Retrieve specific business hours by ID from Freshdesk", (
+        ("business_hour_id", str, _REQUIRED, "id"),
+    )),
+    ("view_current_agent", "Get current agent information from Freshdesk", ()),
+    ("view_email_configs", "Get email configurations from Freshdesk", ()),
+    ("agent_groups", "Get groups for a specific agent in Freshdesk", (("agent_id", str, _REQUIRED, "id"),)),
+    ("agent_skills", "Get skills for a specific agent in Freshdesk", (("agent_id", str, _REQUIRED, "id"),)),
+    ("company_fields", "Get company custom fields from Freshdesk", ()),
+    ("create_note", "Create a note on a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("body", str, _REQUIRED),
+        ("private", bool, True),
+    )),
+    ("create_outbound_email", "Create an outbound email in Freshdesk", (
+        ("to_email", str, _REQUIRED),
+        ("subject", str, _REQUIRED),
+        ("description", str, _REQUIRED),
+    )),
+    ("create_bcc_email", "Add a BCC email to a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("bcc_email", str, _REQUIRED),
+    )),
+    ("forward_ticket", "Forward a ticket to an email address in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("email", str, _REQUIRED),
+    )),
+    ("reply_to_forward", "Reply to a forwarded ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("body", str, _REQUIRED),
+    )),
+    ("reply_ticket", "Reply to a ticket in Freshdesk", (("ticket_id", str, _REQUIRED), ("body", str, _REQUIRED))),
+    ("toggle_timer", "Toggle timer for a time entry in Freshdesk", (("time_entry_id", str, _REQUIRED, "id"),)),
+    ("get_associated_tickets", "Get tickets associated with a contact in Freshdesk", (("contact_id", str, _REQUIRED),)),
+    ("create_child_ticket", "Create a child ticket for an existing ticket in Freshdesk", (
+        ("parent_ticket_id", str, _REQUIRED),
+        ("name", str, _REQUIRED),
+        ("email", str, _REQUIRED),
+        ("subject", str, _REQUIRED),
+        ("description", str, _REQUIRED),
+    )),
+    ("create_ticket_with_attachments", "Create a ticket with file attachments in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("email", str, _REQUIRED),
+        ("subject", str, _REQUIRED),
+        ("description", str, _REQUIRED),
+        ("attachments", str, _REQUIRED),
+    )),
+    ("create_contact_with_avatar", "Create a contact with avatar in Freshdesk", (
+        ("name", str, _REQUIRED),
+        ("email", str, _REQUIRED),
+        ("avatar_url", str, _REQUIRED),
+    )),
+    ("list_comments", "List all comments for a ticket in Freshdesk", (
+        ("ticket_id", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("create_tracker", "Create a new tracker in Freshdesk", (("name", str, _REQUIRED), ("description", str, None))),
+)
 
-@mcp.tool()
-async def freshdesk_create_ticket(name: str, email: str, subject: str, description: str, status: int = 2, priority: int = 1) -> str:
-    """Create a new support ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_ticket", {
-        "name": name, "email": email, "subject": subject, "description": description, 
-        "status": status, "priority": priority
-    })
+def _tool_source(name: str, execute: str, action: str, params: Sequence[tuple], dump: bool = True) -> str:
+    """
+    Render the source of a platform tool wrapper with an explicit signature
+    
+    Args:
+        name: Function (MCP tool) name
+        execute: Name of the module-level bound execute_tool to call
+        action: Adapter tool name
+        params: (name, type, default[, API field]) parameter specs
+        dump: Serialize the adapter result with _dump instead of returning the dict
+    
+    Returns:
+        Python source defining the async wrapper
+    """
+    signature = []
+    fixed = []
+    optional = []
+    for param, annotation, default, *field in params:
+        key = field[0] if field else param
+        if default is _REQUIRED:
+            signature.append(f"{param}: {annotation.__name__}")
+        else:
+            signature.append(f"{param}: {annotation.__name__} = {default!r}")
+        (optional if default is None else fixed).append((key, param))
+    
+    call = f"await {execute}({action!r}, {{params}})"
+    result = f"_dump({call})" if dump else call
+    
+    # A literal with constant keys compiles to one BUILD_CONST_KEY_MAP, which
+    # measured no slower than copying a prebuilt template dict and filling it
+    body = "{" + ", ".join(f"{key!r}: {param}" for key, param in fixed) + "}"
+    lines = [f"async def {name}({', '.join(signature)}) -> str:"]
+    if not optional:
+        lines.append(f"    return {result.format(params=body)}")
+        return "\n".join(lines) + "\n"
+    
+    lines.append(f"    params = {body}")
+    # "is not None" so explicit falsy values (status=0, private=False, "") are sent
+    lines.extend(f"    if {param} is not None: params[{key!r}] = {param}" for key, param in optional)
+    lines.append(f"    return {result.format(params='params')}")
+    return "\n".join(lines) + "\n"
+
+def _register_tools(platform: str, execute: str, specs: Sequence[tuple], dump: bool = True):
+    """Compile and register one <platform>_<name> MCP tool per spec entry"""
+    namespace = globals()
+    for tool_name, description, params, *action in specs:
+        name = f"{platform}_{tool_name}"
+        source = _tool_source(name, execute, action[0] if action else tool_name, params, dump)
+        exec(compile(source, f"<{name}>", "exec"), namespace)
+        tool = namespace[name]
+        tool.__doc__ = description
+        namespace[name] = mcp.tool()(tool)
+
+_register_tools("freshdesk", "_fd_execute", _FRESHDESK_TOOL_SPECS)
+
+# Freshdesk bulk endpoints accept at most this many ticket IDs per call
+_FRESHDESK_BULK_CHUNK_SIZE = 100
+# Concurrent Freshdesk requests issued by one bulk tool call
+_FRESHDESK_BULK_CONCURRENCY = 8
+
+def _parse_ticket_ids(ticket_ids: str) -> List[int]:
+    """Parse a comma-separated ticket ID list, raising ValueError on a non-numeric ID"""
+    ids = []
+    for ticket_id in ticket_ids.split(","):
+        ticket_id = ticket_id.strip()
+        if not ticket_id:
+            continue
+        if not ticket_id.isdigit():
+            raise ValueError(f"Invalid ticket ID: {ticket_id!r}")
+        ids.append(int(ticket_id))
+    return ids
+
+async def _freshdesk_fan_out(action: str, payloads: Sequence[Dict[str, Any]]) -> str:
+    """Run one Freshdesk tool call per payload with bounded concurrency"""
+    return await _fan_out("freshdesk", _fd_execute, action, payloads, _FRESHDESK_BULK_CONCURRENCY)
 
 @mcp.tool()
-async def freshdesk_view_ticket(ticket_id: str) -> str:
-    """Retrieve a specific ticket by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_ticket", {"id": ticket_id})
+async def freshdesk_bulk_update_tickets(ticket_ids: str, status: int = None, priority: int = None) -> str:
+    """Bulk update multiple tickets in Freshdesk"""
+    properties = {}
+    if status is not None: properties["status"] = status
+    if priority is not None: properties["priority"] = priority
+    if not properties:
+        return _dump({"success": False, "error": "Nothing to update: give status and/or priority"})
+    
+    try:
+        ids = _parse_ticket_ids(ticket_ids)
+    except ValueError as e:
+        return _dump({"success": False, "error": str(e)})
+    return await _freshdesk_fan_out("bulk_update_tickets", [
+        {"ids": ids[i:i + _FRESHDESK_BULK_CHUNK_SIZE], "properties": properties}
+        for i in range(0, len(ids), _FRESHDESK_BULK_CHUNK_SIZE)
+    ])
 
 @mcp.tool()
-async def freshdesk_update_ticket(ticket_id: str, subject: str = None, description: str = None, status: int = None, priority: int = None) -> str:
-    """Update an existing ticket in Freshdesk"""
-    params = {"id": ticket_id}
-    if subject: params["subject"] = subject
-    if description: params["description"] = description
-    if status: params["status"] = status
-    if priority: params["priority"] = priority
-    return await adapters['freshdesk'].execute_tool("update_ticket", params)
+async def freshdesk_bulk_delete_tickets(ticket_ids: str) -> str:
+    """Bulk delete multiple tickets in Freshdesk"""
+    try:
+        ids = _parse_ticket_ids(ticket_ids)
+    except ValueError as e:
+        return _dump({"success": False, "error": str(e)})
+    return await _freshdesk_fan_out("bulk_delete_tickets", [
+        {"ids": ids[i:i + _FRESHDESK_BULK_CHUNK_SIZE]}
+        for i in range(0, len(ids), _FRESHDESK_BULK_CHUNK_SIZE)
+    ])
 
 @mcp.tool()
-async def freshdesk_delete_ticket(ticket_id: str) -> str:
-    """Delete a ticket from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_ticket", {"id": ticket_id})
+async def freshdesk_archive_tickets(ticket_ids: str) -> str:
+    """Archive multiple tickets in Freshdesk"""
+    try:
+        ids = _parse_ticket_ids(ticket_ids)
+    except ValueError as e:
+        return _dump({"success": False, "error": str(e)})
+    
+    # The archive endpoint is per ticket, so fan out one call per ID
+    return await _freshdesk_fan_out("archive_tickets", [{"id": ticket_id} for ticket_id in ids])
 
 @mcp.tool()
-async def freshdesk_list_contacts(per_page: int = 10, page: int = 1) -> str:
-    """List all contacts from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_contacts", {"per_page": per_page, "page": page})
+async def freshdesk_get_tickets(ticket_ids: str) -> str:
+    """Retrieve multiple tickets by comma-separated IDs from Freshdesk in one call"""
+    try:
+        ids = _parse_ticket_ids(ticket_ids)
+    except ValueError as e:
+        return _dump({"success": False, "error": str(e)})
+    
+    # Ticket search cannot match on id, so fetch concurrently (bounded) through
+    # view_ticket, which is coalesced and ETag-revalidated by the adapter
+    return await _freshdesk_fan_out("view_ticket", [{"id": ticket_id} for ticket_id in dict.fromkeys(ids)])
+
+# Keyset position that sorts before every ticket; list_tickets only returns
+# tickets from the last 30 days unless updated_since is given
+_TICKET_CURSOR_ORIGIN = {"last_id": 0, "last_updated_at": "1970-01-01T00:00:00Z"}
+# Freshdesk's per_page ceiling; a full page means more rows may follow
+_TICKET_CURSOR_PAGE_SIZE = 100
+# Pages read per call while a single updated_at tie fills every row fetched
+_TICKET_CURSOR_MAX_PAGES = 10
+
+def _ticket_cursor_key(ticket: Dict[str, Any]) -> tuple:
+    """Keyset sort key for a ticket: (updated_at, id)"""
+    return (ticket["updated_at"], ticket["id"])
+
+def _encode_ticket_cursor(ticket: Dict[str, Any]) -> str:
+    """Encode a ticket's (id, updated_at) keyset position as an opaque base64url cursor"""
+    raw = orjson.dumps({"last_id": ticket["id"], "last_updated_at": ticket["updated_at"]})
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def _decode_ticket_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by _encode_ticket_cursor"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    position = orjson.loads(base64.urlsafe_b64decode(padded))
+    return {"last_id": int(position["last_id"]), "last_updated_at": str(position["last_updated_at"])}
+
+@mcp.tool()
+async def freshdesk_list_tickets_cursor(cursor: str = None, limit: int = 30) -> str:
+    """
+    List Freshdesk tickets in (updated_at, id) order using keyset pagination
+    
+    Args:
+        cursor: Opaque next_cursor from a previous call (omit for the first page)
+        limit: Number of tickets to return (1-100)
+        
+    Returns:
+        JSON with the tickets as items and the next_cursor (null on the last page)
+    """
+    try:
+        position = _decode_ticket_cursor(cursor) if cursor else _TICKET_CURSOR_ORIGIN
+    except Exception as e:
+        return f"❌ Invalid cursor: {str(e)}"
+    
+    limit = max(1, min(limit, _TICKET_CURSOR_PAGE_SIZE))
+    
+    # Seek straight to the cursor instead of skipping page offsets; updated_since
+    # is inclusive, so rows tied on the timestamp are trimmed by id below
+    last_key = (position["last_updated_at"], position["last_id"])
+    unseen: Dict[Any, Dict[str, Any]] = {}
+    for page_number in range(1, _TICKET_CURSOR_MAX_PAGES + 1):
+        response = await _fd_execute("list_tickets", {
+            "updated_since": position["last_updated_at"],
+            "order_by": "updated_at",
+            "order_type": "asc",
+            "per_page": _TICKET_CURSOR_PAGE_SIZE,
+            "page": page_number
+        })
+        if not response.get("success"):
+            return _dump(response)
+        
+        batch = response.get("result") or []
+        unseen.update((ticket["id"], ticket) for ticket in batch if _ticket_cursor_key(ticket) > last_key)
+        page_full = len(batch) == _TICKET_CURSOR_PAGE_SIZE
+        # Keep reading only while one timestamp covers every new row, since the
+        # cursor cannot move past a tie until all of its rows have been seen
+        if not page_full or len({ticket["updated_at"] for ticket in unseen.values()}) > 1:
+            break
+    
+    # Freshdesk only orders by updated_at, so ties come back in arbitrary id order
+    tickets = sorted(unseen.values(), key=_ticket_cursor_key)
+    if page_full and tickets:
+        # Rows tied on the page's last timestamp may continue on the next page;
+        # hold them back so the cursor never moves past a partially returned tie
+        boundary = tickets[-1]["updated_at"]
+        settled = [ticket for ticket in tickets if ticket["updated_at"] < boundary]
+        if settled:
+            tickets = settled
+    
+    items = tickets[:limit]
+    has_more = page_full or len(tickets) > limit
+    next_cursor = _encode_ticket_cursor(items[-1]) if has_more and items else None
+    
+    return _dump({"items": items, "next_cursor": next_cursor})
 
-@mcp.tool()
-async def freshdesk_create_contact(name: str, email: str, phone: str = None, company_id: str = None) -> str:
-    """Create a new contact in Freshdesk"""
-    params = {"name": name, "email": email}
-    if phone: params["phone"] = phone
-    if company_id: params["company_id"] = company_id
-    return await adapters['freshdesk'].execute_tool("create_contact", params)
+# =============================================================================
+# STATIC TOOL DEFINITIONS - INTERCOM (Core Tools)
+# =============================================================================
 
-@mcp.tool()
-async def freshdesk_view_contact(contact_id: str) -> str:
-    """Retrieve a specific contact by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_contact", {"id": contact_id})
+# Declarative intercom_<name> tool table: (name, description, parameters[, adapter tool]).
+# Parameters follow _FRESHDESK_TOOL_SPECS; the adapter tool defaults to name.
+_INTERCOM_TOOL_SPECS: Tuple[tuple, ...] = (
+    # Conversation Management
+    ("list_conversations", "List all conversations from Intercom", (("per_page", int, 10), ("page", int, 1))),
+    ("create_conversation", "Create a new conversation in Intercom", (
+        ("contact_id", str, _REQUIRED),
+        ("message", str, _REQUIRED),
+        ("message_type", str, "comment"),
+    )),
+    ("view_conversation", "Retrieve a specific conversation by ID from Intercom", (("conversation_id", str, _REQUIRED, "id"),)),
+    ("reply_conversation", "Reply to a conversation in Intercom", (
+        ("conversation_id", str, _REQUIRED, "id"),
+        ("message", str, _REQUIRED),
+        ("message_type", str, "comment"),
+    )),
+    ("close_conversation", "Close a conversation in Intercom", (("conversation_id", str, _REQUIRED, "id"),)),
+    # Contact Management
+    ("list_contacts", "List all contacts from Intercom", (("per_page", int, 10), ("page", int, 1))),
+    ("create_contact", "Create a new contact in Intercom", (
+        ("email", str, _REQUIRED),
+        ("name", str, None),
+        ("phone", str, None),
+    )),
+    ("view_contact", "Retrieve a specific contact by ID from Intercom", (("contact_id", str, _REQUIRED, "id"),)),
+    ("update_contact", "Update an existing contact in Intercom", (
+        ("contact_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("email", str, None),
+        ("phone", str, None),
+    )),
+    ("delete_contact", "Delete a contact from Intercom", (("contact_id", str, _REQUIRED, "id"),)),
+    # Company Management
+    ("list_companies", "List all companies from Intercom", (("per_page", int, 10), ("page", int, 1))),
+    ("create_company", "Create a new company in Intercom", (
+        ("name", str, _REQUIRED),
+        ("company_id", str, _REQUIRED),
+        ("website", str, None),
+        ("industry", str, None),
+    )),
+    ("view_company", "Retrieve a specific company by ID from Intercom", (("company_id", str, _REQUIRED, "id"),)),
+    # Admin Management
+    ("list_admins", "List all admins from Intercom", ()),
+    ("retrieve_admin", "Retrieve a specific admin by ID from Intercom", (("admin_id", str, _REQUIRED, "item_id"),)),
+    ("set_admin_away", "Set admin away status in Intercom", (("admin_id", str, _REQUIRED, "id"), ("away_mode_enabled", bool, True))),
+    ("list_away_reasons", "List all away reasons from Intercom", ()),
+    ("get_team_permissions", "Get team permissions for an admin in Intercom", (("admin_id", str, _REQUIRED, "id"),)),
+    ("list_admin_activities", "List admin activities from Intercom", (
+        ("admin_id", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    # Message Management
+    ("list_messages", "List all messages from a conversation in Intercom", (
+        ("conversation_id", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("create_message", "Create a message in a conversation in Intercom", (
+        ("conversation_id", str, _REQUIRED),
+        ("message_type", str, _REQUIRED),
+        ("body", str, _REQUIRED),
+    )),
+    ("reply_to_message", "Reply to a message in Intercom", (
+        ("conversation_id", str, _REQUIRED),
+        ("message", str, _REQUIRED),
+        ("message_type", str, "comment"),
+    )),
+    ("email_message", "Send an email message via Intercom", (
+        ("to_email", str, _REQUIRED),
+        ("subject", str, _REQUIRED),
+        ("body", str, _REQUIRED),
+    )),
+    ("group_message", "Send a group message in Intercom", (("user_ids", str, _REQUIRED), ("message", str, _REQUIRED))),
+    ("message_attachments", "Get attachments for a message in Intercom", (("message_id", str, _REQUIRED, "id"),)),
+    ("attach_file", "Attach a file to a conversation in Intercom", (("conversation_id", str, _REQUIRED), ("file_url", str, _REQUIRED))),
+    # Conversation Actions
+    ("assign_conversation", "Assign a conversation to an admin in Intercom", (("conversation_id", str, _REQUIRED), ("admin_id", str, _REQUIRED))),
+    ("open_conversation", "Open a conversation in Intercom", (("conversation_id", str, _REQUIRED, "id"),)),
+    ("snooze_conversation", "Snooze a conversation in Intercom", (("conversation_id", str, _REQUIRED), ("snooze_until", str, _REQUIRED))),
+    ("list_conversation_parts", "List conversation parts from Intercom", (
+        ("conversation_id", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("redact_conversation_part", "Redact a conversation part in Intercom", (("conversation_id", str, _REQUIRED), ("part_id", str, _REQUIRED))),
+    ("customer_initiated_conversation", "Create a customer-initiated conversation in Intercom", (
+        ("contact_id", str, _REQUIRED),
+        ("message", str, _REQUIRED),
+    )),
+    ("admin_initiated_conversation", "Create an admin-initiated conversation in Intercom", (
+        ("admin_id", str, _REQUIRED),
+        ("contact_id", str, _REQUIRED),
+        ("message", str, _REQUIRED),
+    )),
+    ("view_admin", "Retrieve a specific admin by ID from Intercom", (("admin_id", str, _REQUIRED, "item_id"),), "retrieve_admin"),
+    # Segment Management
+    ("list_segments", "List all segments from Intercom", ()),
+    ("view_segment", "Retrieve a specific segment by ID from Intercom", (("segment_id", str, _REQUIRED, "item_id"),), "retrieve_segment"),
+    ("create_segment", "Create a new segment in Intercom", (("name", str, _REQUIRED), ("conditions", str, _REQUIRED))),
+    ("update_segment", "Update a segment in Intercom", (
+        ("segment_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("conditions", str, None),
+    )),
+    ("delete_segment", "Delete a segment from Intercom", (("segment_id", str, _REQUIRED, "id"),)),
+    # Tag Management
+    ("list_tags", "List all tags from Intercom", ()),
+    ("create_tag", "Create a new tag in Intercom", (("name", str, _REQUIRED),)),
+    ("delete_tag", "Delete a tag from Intercom", (("tag_id", str, _REQUIRED, "id"),)),
+    ("tag_contact", "Tag a contact in Intercom", (("contact_id", str, _REQUIRED), ("tag_id", str, _REQUIRED))),
+    ("untag_contact", "Remove a tag from a contact in Intercom", (("contact_id", str, _REQUIRED), ("tag_id", str, _REQUIRED))),
+    ("tag_conversation", "Tag a conversation in Intercom", (("conversation_id", str, _REQUIRED), ("tag_id", str, _REQUIRED))),
+    ("untag_conversation", "Remove a tag from a conversation in Intercom", (("conversation_id", str, _REQUIRED), ("tag_id", str, _REQUIRED))),
+    # Team Management
+    ("list_teams", "List all teams from Intercom", ()),
+    ("view_team", "Retrieve a specific team by ID from Intercom", (("team_id", str, _REQUIRED, "id"),)),
+    ("create_team", "Create a new team in Intercom", (("name", str, _REQUIRED),)),
+    ("update_team", "Update a team in Intercom", (("team_id", str, _REQUIRED, "id"), ("name", str, _REQUIRED))),
+    ("delete_team", "Delete a team from Intercom", (("team_id", str, _REQUIRED, "id"),)),
+    # Event Management
+    ("list_events", "List events for a contact from Intercom", (
+        ("contact_id", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("create_event", "Create an event for a contact in Intercom", (
+        ("contact_id", str, _REQUIRED),
+        ("event_name", str, _REQUIRED),
+        ("metadata", str, None),
+    )),
+    ("track_event", "Track an event for a contact in Intercom", (
+        ("contact_id", str, _REQUIRED),
+        ("event_name", str, _REQUIRED),
+        ("created_at", str, None),
+        ("metadata", str, None),
+    )),
+    # Data Attributes
+    ("list_data_attributes", "List all data attributes from Intercom", ()),
+    ("create_data_attribute", "Create a data attribute in Intercom", (
+        ("name", str, _REQUIRED),
+        ("model", str, _REQUIRED),
+        ("data_type", str, _REQUIRED),
+    )),
+    ("update_data_attribute", "Update a data attribute in Intercom", (
+        ("data_attribute_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("description", str, None),
+    )),
+    # Article Management
+    ("list_articles", "List all articles from Intercom", ()),
+    ("view_article", "Retrieve a specific article by ID from Intercom", (("article_id", str, _REQUIRED, "id"),)),
+    ("create_article", "Create a new article in Intercom", (
+        ("title", str, _REQUIRED),
+        ("body", str, _REQUIRED),
+        ("author_id", str, _REQUIRED),
+    )),
+    ("update_article", "Update an article in Intercom", (
+        ("article_id", str, _REQUIRED, "id"),
+        ("title", str, None),
+        ("body", str, None),
+    )),
+    ("delete_article", "Delete an article from Intercom", (("article_id", str, _REQUIRED, "id"),)),
+    # Collection Management
+    ("list_collections", "List all collections from Intercom", ()),
+    ("view_collection", "Retrieve a specific collection by ID from Intercom", (("collection_id", str, _REQUIRED, "id"),)),
+    ("create_collection", "Create a new collection in Intercom", (("name", str, _REQUIRED), ("description", str, None))),
+    ("update_collection", "Update a collection in Intercom", (
+        ("collection_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("description", str, None),
+    )),
+    ("delete_collection", "Delete a collection from Intercom", (("collection_id", str, _REQUIRED, "id"),)),
+    # Note Management
+    ("list_notes", "List notes for a contact from Intercom", (("contact_id", str, _REQUIRED),)),
+    ("create_note", "Create a note for a contact in Intercom", (("contact_id", str, _REQUIRED), ("body", str, _REQUIRED))),
+    ("view_note", "Retrieve a specific note by ID from Intercom", (("note_id", str, _REQUIRED, "id"),)),
+    # Subscription Management
+    ("list_subscription_types", "List all subscription types from Intercom", ()),
+    ("create_subscription", "Create a subscription for a contact in Intercom", (
+        ("contact_id", str, _REQUIRED),
+        ("subscription_type_id", str, _REQUIRED),
+    )),
+    ("delete_subscription", "Delete a subscription for a contact in Intercom", (
+        ("contact_id", str, _REQUIRED),
+        ("subscription_type_id", str, _REQUIRED),
+    )),
+    # Visitor Management
+    ("list_visitors", "List all visitors from Intercom", (("per_page", int, 10), ("page", int, 1))),
+    ("view_visitor", "Retrieve a specific visitor by ID from Intercom", (("visitor_id", str, _REQUIRED, "id"),)),
+    ("update_visitor", "Update a visitor in Intercom", (
+        ("visitor_id", str, _REQUIRED, "id"),
+        ("name", str, None),
+        ("email", str, None),
+    )),
+    ("convert_visitor", "Convert a visitor to a contact in Intercom", (("visitor_id", str, _REQUIRED), ("contact_id", str, None))),
+    # Count and Statistics
+    ("count_conversations", "Get conversation count from Intercom", ()),
+    ("count_contacts", "Get contact count from Intercom", ()),
+    ("count_companies", "Get company count from Intercom", ()),
+    ("count_admins", "Get admin count from Intercom", ()),
+    # Search Operations
+    ("search_contacts", "Search contacts in Intercom", (
+        ("query", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("search_conversations", "Search conversations in Intercom", (
+        ("query", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+    ("search_companies", "Search companies in Intercom", (
+        ("query", str, _REQUIRED),
+        ("per_page", int, 10),
+        ("page", int, 1),
+    )),
+)
 
-@mcp.tool()
-async def freshdesk_add_note_to_ticket(ticket_id: str, body: str, private: bool = True) -> str:
-    """Add a note to an existing ticket in Freshdesk"""
-    params = {"id": ticket_id, "body": body, "private": private}
-    return await adapters['freshdesk'].execute_tool("add_note_to_ticket", params)
+_register_tools("intercom", "_ic_execute", _INTERCOM_TOOL_SPECS, dump=False)
 
-@mcp.tool()
-async def freshdesk_filter_tickets(query: str) -> str:
-    """Filter tickets using advanced search in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("filter_tickets", {"query": query})
+# Search Operations
+# Result keys of intercom_unified_search, in the order of their search tools
+_INTERCOM_UNIFIED_SEARCHES = (
+    ("contacts", "search_contacts"),
+    ("conversations", "search_conversations"),
+    ("companies", "search_companies")
+)
 
 @mcp.tool()
-async def freshdesk_create_company(name: str, description: str = None, website: str = None) -> str:
-    """Create a new company in Freshdesk"""
-    params = {"name": name}
-    if description: params["description"] = description
-    if website: params["website"] = website
-    return await adapters['freshdesk'].execute_tool("create_company", params)
+async def intercom_unified_search(query: str, per_page: int = 10) -> str:
+    """
+    Search contacts, conversations and companies in Intercom with one query.
+    
+    Args:
+        query (str): Intercom search query applied to all three resources
+        per_page (int): Results per resource (default: 10)
+    
+    Returns:
+        str: JSON object with contacts, conversations and companies results
+    """
+    params = {"search_query": query, "pagination": {"per_page": per_page}}
+    # The three searches are independent: one round trip instead of three
+    results = await asyncio.gather(
+        *(_ic_execute(tool_name, dict(params)) for _, tool_name in _INTERCOM_UNIFIED_SEARCHES),
+        return_exceptions=True
+    )
+    
+    combined = {}
+    for (key, _), result in zip(_INTERCOM_UNIFIED_SEARCHES, results):
+        if isinstance(result, Exception):
+            logger.error(f"Intercom unified search ({key}) error: {result}")
+            result = {"success": False, "error": str(result)}
+        combined[key] = result
+    return _dump({"query": query, "platform": "intercom", "results": combined})
+
+# Auto-paginated Listing
+# Concurrent page requests issued by one *_all tool call
+_INTERCOM_PAGE_CONCURRENCY = 8
+# Upper bound on pages fetched by one *_all tool call
+_INTERCOM_MAX_PAGES = 50
+# Keys Intercom list responses carry their items under
+_INTERCOM_LIST_KEYS = ("data", "conversations", "contacts", "companies", "events")
+
+def _intercom_page(result: Dict[str, Any]) -> Tuple[List[Any], Dict[str, Any]]:
+    """Split an execute_tool result into its items and Intercom 'pages' block"""
+    payload = result.get("result", {})
+    if isinstance(payload, dict) and "data" in payload and "status_code" in payload:
+        # Unwrap make_request's envelope
+        payload = payload["data"]
+    if not isinstance(payload, dict):
+        return [], {}
+    
+    items = next((payload[key] for key in _INTERCOM_LIST_KEYS if isinstance(payload.get(key), list)), [])
+    return items, payload.get("pages") or {}
 
-@mcp.tool()
-async def freshdesk_view_company(company_id: str) -> str:
-    """Retrieve a specific company by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_company", {"id": company_id})
+async def _paginate_all(tool_name: str, base_params: Dict[str, Any], max_concurrency: int = _INTERCOM_PAGE_CONCURRENCY) -> str:
+    """
+    Fetch every page of an Intercom list tool and merge the items
+    
+    Page-numbered lists fetch page 1, then the remaining pages concurrently;
+    cursor lists (pages.next.starting_after) can only be followed one page at a time.
+    
+    Args:
+        tool_name: Adapter list tool name
+        base_params: Arguments shared by every page request
+        max_concurrency: Maximum page requests in flight
+        
+    Returns:
+        JSON with the merged items, page count and per-page errors
+    """
+    first = await _ic_execute(tool_name, dict(base_params))
+    if not first.get("success"):
+        return _dump(first)
+    
+    first_items, pages = _intercom_page(first)
+    # Adapter results may be shared cache entries, so merge into a fresh list
+    items = list(first_items)
+    errors = []
+    fetched = 1
+    next_page = pages.get("next")
+    
+    if isinstance(next_page, dict) and next_page.get("starting_after"):
+        # Cursor pagination: each page names the next one
+        cursor = next_page["starting_after"]
+        while cursor and fetched < _INTERCOM_MAX_PAGES:
+            result = await _ic_execute(tool_name, {**base_params, "starting_after": cursor})
+            fetched += 1
+            if not result.get("success"):
+                errors.append(result.get("error"))
+                break
+            page_items, pages = _intercom_page(result)
+            items.extend(page_items)
+            next_page = pages.get("next")
+            cursor = next_page.get("starting_after") if isinstance(next_page, dict) else None
+    else:
+        total_pages = min(int(pages.get("total_pages") or 1), _INTERCOM_MAX_PAGES)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results = await asyncio.gather(*(
+            _bounded(semaphore, _ic_execute(tool_name, {**base_params, "page": page}))
+            for page in range(2, total_pages + 1)
+        ))
+        fetched += len(results)
+        for result in results:
+            if result.get("success"):
+                items.extend(_intercom_page(result)[0])
+            else:
+                errors.append(result.get("error"))
+    
+    return _dump({
+        "success": not errors,
+        "tool_name": tool_name,
+        "result": items,
+        "total": len(items),
+        "pages_fetched": fetched,
+        "errors": errors,
+        "platform": "intercom"
+    })
 
 @mcp.tool()
-async def freshdesk_list_companies(per_page: int = 10, page: int = 1) -> str:
-    """List all companies from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_companies", {"per_page": per_page, "page": page})
+async def intercom_list_contacts_all(per_page: int = 150) -> str:
+    """List every contact from Intercom, following all pages"""
+    return await _paginate_all("list_contacts", {"page_size": per_page})
 
 @mcp.tool()
-async def freshdesk_update_company(company_id: str, name: str = None, description: str = None, website: str = None) -> str:
-    """Update an existing company in Freshdesk"""
-    params = {"id": company_id}
-    if name: params["name"] = name
-    if description: params["description"] = description
-    if website: params["website"] = website
-    return await adapters['freshdesk'].execute_tool("update_company", params)
+async def intercom_list_conversations_all(per_page: int = 150) -> str:
+    """List every conversation from Intercom, following all pages"""
+    return await _paginate_all("list_conversations", {"page_size": per_page})
 
 @mcp.tool()
-async def freshdesk_delete_company(company_id: str) -> str:
-    """Delete a company from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_company", {"id": company_id})
+async def intercom_list_companies_all(per_page: int = 60) -> str:
+    """List every company from Intercom, fetching pages concurrently"""
+    return await _paginate_all("list_companies", {"page_size": per_page})
 
-@mcp.tool()
-async def freshdesk_list_agents(per_page: int = 10, page: int = 1) -> str:
-    """List all agents from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_agents", {"per_page": per_page, "page": page})
+# Export Operations
+def _export_path(prefix: str, suffix: str) -> str:
+    """Create an empty export file and return its path"""
+    fd, path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=MCPServerConfig.EXPORT_DIR)
+    os.close(fd)
+    return path
+
+def _unix_timestamp(value: str) -> int:
+    """Parse a Unix timestamp or ISO 8601 date/time"""
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+async def _intercom_export(method: str, prefix: str, suffix: str, *args) -> str:
+    """Run an IntercomAdapter export method into a new file, removing the file if the export fails"""
+    if intercom_adapter is None:
+        return _dump({"success": False, "error": "Intercom adapter not available", "platform": "intercom"})
+    
+    path = _export_path(prefix, suffix)
+    try:
+        result = await getattr(intercom_adapter, method)(path, *args)
+    except Exception as e:
+        logger.error(f"Intercom export error: {e}")
+        os.unlink(path)
+        return _dump({"success": False, "error": str(e), "platform": "intercom"})
+    
+    if result.get("path") is None:
+        os.unlink(path)
+    return _dump({"success": result.get("path") is not None, "result": result, "platform": "intercom"})
 
 @mcp.tool()
-async def freshdesk_create_agent(name: str, email: str, phone: str = None) -> str:
-    """Create a new agent in Freshdesk"""
-    params = {"name": name, "email": email}
-    if phone: params["phone"] = phone
-    return await adapters['freshdesk'].execute_tool("create_agent", params)
+async def intercom_export_contacts(segment_id: str = None) -> str:
+    """
+    Export contacts from Intercom to a JSON lines file.
+    
+    Args:
+        segment_id (str): Only export contacts in this segment (optional)
+    
+    Returns:
+        str: JSON with the export file path, contact count and size in bytes
+    """
+    return await _intercom_export("export_contacts", "intercom_contacts_", ".jsonl", segment_id)
 
 @mcp.tool()
-async def freshdesk_view_agent(agent_id: str) -> str:
-    """Retrieve a specific agent by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_agent", {"id": agent_id})
+async def intercom_export_conversations(start_time: str, end_time: str) -> str:
+    """
+    Export conversation content data from Intercom to a gzip archive file.
+    
+    Args:
+        start_time (str): Export start as a Unix timestamp or ISO 8601 date/time
+        end_time (str): Export end as a Unix timestamp or ISO 8601 date/time
+    
+    Returns:
+        str: JSON with the export job, archive file path and size in bytes
+    """
+    try:
+        window = (_unix_timestamp(start_time), _unix_timestamp(end_time))
+    except ValueError as e:
+        return _dump({"success": False, "error": f"Invalid export time: {e}", "platform": "intercom"})
+    
+    return await _intercom_export("export_conversations", "intercom_conversations_", ".gz", *window)
 
-@mcp.tool()
-async def freshdesk_update_agent(agent_id: str, name: str = None, email: str = None, phone: str = None) -> str:
-    """Update an existing agent in Freshdesk"""
-    params = {"id": agent_id}
-    if name: params["name"] = name
-    if email: params["email"] = email
-    if phone: params["phone"] = phone
-    return await adapters['freshdesk'].execute_tool("update_agent", params)
+# Bulk Operations
+# Concurrent Intercom requests issued by one bulk tool call
+_INTERCOM_BULK_CONCURRENCY = 64
 
-@mcp.tool()
-async def freshdesk_delete_agent(agent_id: str) -> str:
-    """Delete an agent from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_agent", {"id": agent_id})
+def _parse_contact_rows(contacts_data: str) -> List[Dict[str, Any]]:
+    """Parse a JSON contact (or list of contacts) into adapter arguments, raising ValueError on bad input"""
+    try:
+        rows = orjson.loads(contacts_data)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid contacts JSON: {e}") from e
+    if isinstance(rows, dict):
+        rows = [rows]
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise ValueError("contacts_data must be a JSON object or a list of objects")
+    # Adapter tools take the sanitized parameter names (id -> item_id, name -> item_name)
+    return [{sanitize_param_name(key): value for key, value in row.items()} for row in rows]
 
 @mcp.tool()
-async def freshdesk_list_groups(per_page: int = 10, page: int = 1) -> str:
-    """List all groups from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_groups", {"per_page": per_page, "page": page})
+async def intercom_bulk_create_contacts(contacts_data: str) -> str:
+    """Bulk create contacts in Intercom"""
+    try:
+        payloads = _parse_contact_rows(contacts_data)
+    except ValueError as e:
+        return _dump({"success": False, "error": str(e), "platform": "intercom"})
+    return await _fan_out("intercom", _ic_execute, "create_contact", payloads, _INTERCOM_BULK_CONCURRENCY)
 
 @mcp.tool()
-async def freshdesk_create_group(name: str, description: str = None) -> str:
-    """Create a new group in Freshdesk"""
-    params = {"name": name}
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("create_group", params)
+async def intercom_bulk_update_contacts(contacts_data: str) -> str:
+    """Bulk update contacts in Intercom"""
+    try:
+        payloads = _parse_contact_rows(contacts_data)
+    except ValueError as e:
+        return _dump({"success": False, "error": str(e), "platform": "intercom"})
+    return await _fan_out("intercom", _ic_execute, "update_contact", payloads, _INTERCOM_BULK_CONCURRENCY)
 
 @mcp.tool()
-async def freshdesk_view_group(group_id: str) -> str:
-    """Retrieve a specific group by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_group", {"id": group_id})
+async def intercom_bulk_delete_contacts(contact_ids: str) -> str:
+    """Bulk delete contacts in Intercom"""
+    payloads = [{"item_id": contact_id.strip()} for contact_id in contact_ids.split(",") if contact_id.strip()]
+    return await _fan_out("intercom", _ic_execute, "delete_contact", payloads, _INTERCOM_BULK_CONCURRENCY)
 
-@mcp.tool()
-async def freshdesk_update_group(group_id: str, name: str = None, description: str = None) -> str:
-    """Update an existing group in Freshdesk"""
-    params = {"id": group_id}
-    if name: params["name"] = name
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("update_group", params)
+# =============================================================================
+# REGISTRATION FUNCTION (SIMPLIFIED)
+# =============================================================================
 
-@mcp.tool()
-async def freshdesk_delete_group(group_id: str) -> str:
-    """Delete a group from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_group", {"id": group_id})
+def register_adapter_tools():
+    """Static tools are automatically registered via @mcp.tool() decorators"""
+    logger.info("📋 Static tool registration complete via decorators")
+    
+    # Count registered tools (private FastMCP attributes, may change between versions)
+    try:
+        total_tools = len(mcp._tool_manager._tools)
+    except AttributeError:
+        logger.info("🔧 Tool count unavailable")
+    else:
+        logger.info(f"🔧 Total Tools Registered: {total_tools}")
+    
+    invalidate_tools_doc()
 
-@mcp.tool()
-async def freshdesk_create_comment(ticket_id: str, body: str, private: bool = False) -> str:
-    """Create a comment on a ticket in Freshdesk"""
-    params = {"id": ticket_id, "body": body, "private": private}
-    return await adapters['freshdesk'].execute_tool("create_comment", params)
-
-@mcp.tool()
-async def freshdesk_create_reply(ticket_id: str, body: str, from_email: str = None) -> str:
-    """Create a reply to a ticket in Freshdesk"""
-    params = {"id": ticket_id, "body": body}
-    if from_email: params["from_email"] = from_email
-    return await adapters['freshdesk'].execute_tool("create_reply", params)
-
-@mcp.tool()
-async def freshdesk_list_time_entries(ticket_id: str = None, per_page: int = 10, page: int = 1) -> str:
-    """List time entries from Freshdesk"""
-    params = {"per_page": per_page, "page": page}
-    if ticket_id: params["ticket_id"] = ticket_id
-    return await adapters['freshdesk'].execute_tool("list_time_entries", params)
-
-@mcp.tool()
-async def freshdesk_create_time_entry(ticket_id: str, time_spent: str, note: str = None) -> str:
-    """Create a time entry for a ticket in Freshdesk"""
-    params = {"ticket_id": ticket_id, "time_spent": time_spent}
-    if note: params["note"] = note
-    return await adapters['freshdesk'].execute_tool("create_time_entry", params)
-
-@mcp.tool()
-async def freshdesk_view_time_entry(time_entry_id: str) -> str:
-    """Retrieve a specific time entry by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_time_entry", {"id": time_entry_id})
-
-@mcp.tool()
-async def freshdesk_update_time_entry(time_entry_id: str, time_spent: str = None, note: str = None) -> str:
-    """Update an existing time entry in Freshdesk"""
-    params = {"id": time_entry_id}
-    if time_spent: params["time_spent"] = time_spent
-    if note: params["note"] = note
-    return await adapters['freshdesk'].execute_tool("update_time_entry", params)
-
-@mcp.tool()
-async def freshdesk_delete_time_entry(time_entry_id: str) -> str:
-    """Delete a time entry from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_time_entry", {"id": time_entry_id})
-
-@mcp.tool()
-async def freshdesk_filter_contacts(query: str) -> str:
-    """Filter contacts using advanced search in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("filter_contacts", {"query": query})
-
-@mcp.tool()
-async def freshdesk_filter_companies(query: str) -> str:
-    """Filter companies using advanced search in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("filter_companies", {"query": query})
-
-@mcp.tool()
-async def freshdesk_merge_tickets(primary_ticket_id: str, secondary_ticket_id: str) -> str:
-    """Merge two tickets in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("merge_tickets", {"primary_ticket_id": primary_ticket_id, "secondary_ticket_id": secondary_ticket_id})
-
-@mcp.tool()
-async def freshdesk_merge_contacts(primary_contact_id: str, secondary_contact_id: str) -> str:
-    """Merge two contacts in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("merge_contacts", {"primary_contact_id": primary_contact_id, "secondary_contact_id": secondary_contact_id})
-
-@mcp.tool()
-async def freshdesk_add_watcher(ticket_id: str, user_id: str) -> str:
-    """Add a watcher to a ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("add_watcher", {"ticket_id": ticket_id, "user_id": user_id})
-
-@mcp.tool()
-async def freshdesk_remove_watcher(ticket_id: str, user_id: str) -> str:
-    """Remove a watcher from a ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("remove_watcher", {"ticket_id": ticket_id, "user_id": user_id})
-
-@mcp.tool()
-async def freshdesk_list_conversations(per_page: int = 10, page: int = 1) -> str:
-    """List all conversations from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_conversations", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_update_conversation(conversation_id: str, status: str = None) -> str:
-    """Update a conversation in Freshdesk"""
-    params = {"id": conversation_id}
-    if status: params["status"] = status
-    return await adapters['freshdesk'].execute_tool("update_conversation", params)
-
-@mcp.tool()
-async def freshdesk_delete_conversation(conversation_id: str) -> str:
-    """Delete a conversation from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_conversation", {"id": conversation_id})
-
-@mcp.tool()
-async def freshdesk_bulk_update_tickets(ticket_ids: str, status: int = None, priority: int = None) -> str:
-    """Bulk update multiple tickets in Freshdesk"""
-    params = {"ticket_ids": ticket_ids}
-    if status: params["status"] = status
-    if priority: params["priority"] = priority
-    return await adapters['freshdesk'].execute_tool("bulk_update_tickets", params)
-
-@mcp.tool()
-async def freshdesk_bulk_delete_tickets(ticket_ids: str) -> str:
-    """Bulk delete multiple tickets in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("bulk_delete_tickets", {"ticket_ids": ticket_ids})
-
-@mcp.tool()
-async def freshdesk_archive_tickets(ticket_ids: str) -> str:
-    """Archive multiple tickets in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("archive_tickets", {"ticket_ids": ticket_ids})
-
-@mcp.tool()
-async def freshdesk_restore_contact(contact_id: str) -> str:
-    """Restore a deleted contact in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("restore_contact", {"id": contact_id})
-
-@mcp.tool()
-async def freshdesk_make_agent(contact_id: str) -> str:
-    """Convert a contact to an agent in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("make_agent", {"id": contact_id})
-
-@mcp.tool()
-async def freshdesk_send_invite(agent_id: str) -> str:
-    """Send an invite to an agent in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("send_invite", {"id": agent_id})
-
-@mcp.tool()
-async def freshdesk_list_solution_articles(per_page: int = 10, page: int = 1) -> str:
-    """List all solution articles from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_solution_articles", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_solution_article(title: str, description: str, folder_id: str) -> str:
-    """Create a new solution article in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_solution_article", {"title": title, "description": description, "folder_id": folder_id})
-
-@mcp.tool()
-async def freshdesk_view_solution_article(article_id: str) -> str:
-    """Retrieve a specific solution article by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_solution_article", {"id": article_id})
-
-@mcp.tool()
-async def freshdesk_update_solution_article(article_id: str, title: str = None, description: str = None) -> str:
-    """Update an existing solution article in Freshdesk"""
-    params = {"id": article_id}
-    if title: params["title"] = title
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("update_solution_article", params)
-
-@mcp.tool()
-async def freshdesk_delete_solution_article(article_id: str) -> str:
-    """Delete a solution article from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_solution_article", {"id": article_id})
-
-@mcp.tool()
-async def freshdesk_list_solution_categories(per_page: int = 10, page: int = 1) -> str:
-    """List all solution categories from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_solution_categories", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_solution_category(name: str, description: str = None) -> str:
-    """Create a new solution category in Freshdesk"""
-    params = {"name": name}
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("create_solution_category", params)
-
-@mcp.tool()
-async def freshdesk_view_solution_category(category_id: str) -> str:
-    """Retrieve a specific solution category by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_solution_category", {"id": category_id})
-
-@mcp.tool()
-async def freshdesk_update_solution_category(category_id: str, name: str = None, description: str = None) -> str:
-    """Update an existing solution category in Freshdesk"""
-    params = {"id": category_id}
-    if name: params["name"] = name
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("update_solution_category", params)
-
-@mcp.tool()
-async def freshdesk_delete_solution_category(category_id: str) -> str:
-    """Delete a solution category from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_solution_category", {"id": category_id})
-
-@mcp.tool()
-async def freshdesk_list_solution_folders(category_id: str, per_page: int = 10, page: int = 1) -> str:
-    """List all solution folders from a category in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_solution_folders", {"category_id": category_id, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_solution_folder(name: str, category_id: str, description: str = None) -> str:
-    """Create a new solution folder in Freshdesk"""
-    params = {"name": name, "category_id": category_id}
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("create_solution_folder", params)
-
-@mcp.tool()
-async def freshdesk_view_solution_folder(folder_id: str) -> str:
-    """Retrieve a specific solution folder by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_solution_folder", {"id": folder_id})
-
-@mcp.tool()
-async def freshdesk_update_solution_folder(folder_id: str, name: str = None, description: str = None) -> str:
-    """Update an existing solution folder in Freshdesk"""
-    params = {"id": folder_id}
-    if name: params["name"] = name
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("update_solution_folder", params)
-
-@mcp.tool()
-async def freshdesk_delete_solution_folder(folder_id: str) -> str:
-    """Delete a solution folder from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_solution_folder", {"id": folder_id})
-
-@mcp.tool()
-async def freshdesk_list_forums(per_page: int = 10, page: int = 1) -> str:
-    """List all forums from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_forums", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_forum(name: str, description: str = None) -> str:
-    """Create a new forum in Freshdesk"""
-    params = {"name": name}
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("create_forum", params)
-
-@mcp.tool()
-async def freshdesk_list_forum_categories(forum_id: str, per_page: int = 10, page: int = 1) -> str:
-    """List all forum categories from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_forum_categories", {"forum_id": forum_id, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_forum_category(name: str, forum_id: str, description: str = None) -> str:
-    """Create a new forum category in Freshdesk"""
-    params = {"name": name, "forum_id": forum_id}
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("create_forum_category", params)
-
-@mcp.tool()
-async def freshdesk_list_topics(category_id: str, per_page: int = 10, page: int = 1) -> str:
-    """List all topics from a forum category in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_topics", {"category_id": category_id, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_topic(title: str, message: str, category_id: str) -> str:
-    """Create a new topic in a forum category in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_topic", {"title": title, "message": message, "category_id": category_id})
-
-@mcp.tool()
-async def freshdesk_view_topic(topic_id: str) -> str:
-    """Retrieve a specific topic by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_topic", {"id": topic_id})
-
-@mcp.tool()
-async def freshdesk_update_topic(topic_id: str, title: str = None, message: str = None) -> str:
-    """Update an existing topic in Freshdesk"""
-    params = {"id": topic_id}
-    if title: params["title"] = title
-    if message: params["message"] = message
-    return await adapters['freshdesk'].execute_tool("update_topic", params)
-
-@mcp.tool()
-async def freshdesk_delete_topic(topic_id: str) -> str:
-    """Delete a topic from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_topic", {"id": topic_id})
-
-@mcp.tool()
-async def freshdesk_monitor_topic(topic_id: str) -> str:
-    """Monitor a topic for updates in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("monitor_topic", {"id": topic_id})
-
-@mcp.tool()
-async def freshdesk_list_ratings(per_page: int = 10, page: int = 1) -> str:
-    """List all ratings from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_ratings", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_rating(ticket_id: str, rating: int, feedback: str = None) -> str:
-    """Create a rating for a ticket in Freshdesk"""
-    params = {"ticket_id": ticket_id, "rating": rating}
-    if feedback: params["feedback"] = feedback
-    return await adapters['freshdesk'].execute_tool("create_rating", params)
-
-@mcp.tool()
-async def freshdesk_view_ratings(ticket_id: str) -> str:
-    """View ratings for a specific ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_ratings", {"ticket_id": ticket_id})
-
-@mcp.tool()
-async def freshdesk_list_mailboxes(per_page: int = 10, page: int = 1) -> str:
-    """List all mailboxes from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_mailboxes", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_mailbox(name: str, email: str) -> str:
-    """Create a new mailbox in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_mailbox", {"name": name, "email": email})
-
-@mcp.tool()
-async def freshdesk_view_mailbox(mailbox_id: str) -> str:
-    """Retrieve a specific mailbox by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_mailbox", {"id": mailbox_id})
-
-@mcp.tool()
-async def freshdesk_update_mailbox(mailbox_id: str, name: str = None, email: str = None) -> str:
-    """Update an existing mailbox in Freshdesk"""
-    params = {"id": mailbox_id}
-    if name: params["name"] = name
-    if email: params["email"] = email
-    return await adapters['freshdesk'].execute_tool("update_mailbox", params)
-
-@mcp.tool()
-async def freshdesk_delete_mailbox(mailbox_id: str) -> str:
-    """Delete a mailbox from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("delete_mailbox", {"id": mailbox_id})
-
-@mcp.tool()
-async def freshdesk_mailbox_settings(mailbox_id: str) -> str:
-    """Get mailbox settings from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("mailbox_settings", {"id": mailbox_id})
-
-@mcp.tool()
-async def freshdesk_list_sla_policies(per_page: int = 10, page: int = 1) -> str:
-    """List all SLA policies from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_sla_policies", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_view_sla_policy(policy_id: str) -> str:
-    """Retrieve a specific SLA policy by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_sla_policy", {"id": policy_id})
-
-@mcp.tool()
-async def freshdesk_list_business_hours(per_page: int = 10, page: int = 1) -> str:
-    """List all business hours from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_business_hours", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_view_business_hour(business_hour_id: str) -> str:
-    """Retrieve specific business hours by ID from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_business_hour", {"id": business_hour_id})
-
-@mcp.tool()
-async def freshdesk_view_current_agent() -> str:
-    """Get current agent information from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_current_agent", {})
-
-@mcp.tool()
-async def freshdesk_view_email_configs() -> str:
-    """Get email configurations from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("view_email_configs", {})
-
-@mcp.tool()
-async def freshdesk_agent_groups(agent_id: str) -> str:
-    """Get groups for a specific agent in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("agent_groups", {"id": agent_id})
-
-@mcp.tool()
-async def freshdesk_agent_skills(agent_id: str) -> str:
-    """Get skills for a specific agent in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("agent_skills", {"id": agent_id})
-
-@mcp.tool()
-async def freshdesk_company_fields() -> str:
-    """Get company custom fields from Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("company_fields", {})
-
-@mcp.tool()
-async def freshdesk_create_note(ticket_id: str, body: str, private: bool = True) -> str:
-    """Create a note on a ticket in Freshdesk"""
-    params = {"ticket_id": ticket_id, "body": body, "private": private}
-    return await adapters['freshdesk'].execute_tool("create_note", params)
-
-@mcp.tool()
-async def freshdesk_create_outbound_email(to_email: str, subject: str, description: str) -> str:
-    """Create an outbound email in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_outbound_email", {"to_email": to_email, "subject": subject, "description": description})
-
-@mcp.tool()
-async def freshdesk_create_bcc_email(ticket_id: str, bcc_email: str) -> str:
-    """Add a BCC email to a ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_bcc_email", {"ticket_id": ticket_id, "bcc_email": bcc_email})
-
-@mcp.tool()
-async def freshdesk_forward_ticket(ticket_id: str, email: str) -> str:
-    """Forward a ticket to an email address in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("forward_ticket", {"ticket_id": ticket_id, "email": email})
-
-@mcp.tool()
-async def freshdesk_reply_to_forward(ticket_id: str, body: str) -> str:
-    """Reply to a forwarded ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("reply_to_forward", {"ticket_id": ticket_id, "body": body})
-
-@mcp.tool()
-async def freshdesk_reply_ticket(ticket_id: str, body: str) -> str:
-    """Reply to a ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("reply_ticket", {"ticket_id": ticket_id, "body": body})
-
-@mcp.tool()
-async def freshdesk_toggle_timer(time_entry_id: str) -> str:
-    """Toggle timer for a time entry in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("toggle_timer", {"id": time_entry_id})
-
-@mcp.tool()
-async def freshdesk_get_associated_tickets(contact_id: str) -> str:
-    """Get tickets associated with a contact in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("get_associated_tickets", {"contact_id": contact_id})
-
-@mcp.tool()
-async def freshdesk_create_child_ticket(parent_ticket_id: str, name: str, email: str, subject: str, description: str) -> str:
-    """Create a child ticket for an existing ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_child_ticket", {"parent_ticket_id": parent_ticket_id, "name": name, "email": email, "subject": subject, "description": description})
-
-@mcp.tool()
-async def freshdesk_create_ticket_with_attachments(name: str, email: str, subject: str, description: str, attachments: str) -> str:
-    """Create a ticket with file attachments in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_ticket_with_attachments", {"name": name, "email": email, "subject": subject, "description": description, "attachments": attachments})
-
-@mcp.tool()
-async def freshdesk_create_contact_with_avatar(name: str, email: str, avatar_url: str) -> str:
-    """Create a contact with avatar in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("create_contact_with_avatar", {"name": name, "email": email, "avatar_url": avatar_url})
-
-@mcp.tool()
-async def freshdesk_list_comments(ticket_id: str, per_page: int = 10, page: int = 1) -> str:
-    """List all comments for a ticket in Freshdesk"""
-    return await adapters['freshdesk'].execute_tool("list_comments", {"ticket_id": ticket_id, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def freshdesk_create_tracker(name: str, description: str = None) -> str:
-    """Create a new tracker in Freshdesk"""
-    params = {"name": name}
-    if description: params["description"] = description
-    return await adapters['freshdesk'].execute_tool("create_tracker", params)
-
-# =============================================================================
-# STATIC TOOL DEFINITIONS - INTERCOM (Core Tools)
-# =============================================================================
-
-# Conversation Management
-@mcp.tool()
-async def intercom_list_conversations(per_page: int = 10, page: int = 1) -> str:
-    """List all conversations from Intercom"""
-    return await adapters['intercom'].execute_tool("list_conversations", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_create_conversation(contact_id: str, message: str, message_type: str = "comment") -> str:
-    """Create a new conversation in Intercom"""
-    params = {"contact_id": contact_id, "message": message, "message_type": message_type}
-    return await adapters['intercom'].execute_tool("create_conversation", params)
-
-@mcp.tool()
-async def intercom_view_conversation(conversation_id: str) -> str:
-    """Retrieve a specific conversation by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_conversation", {"id": conversation_id})
-
-@mcp.tool()
-async def intercom_reply_conversation(conversation_id: str, message: str, message_type: str = "comment") -> str:
-    """Reply to a conversation in Intercom"""
-    params = {"id": conversation_id, "message": message, "message_type": message_type}
-    return await adapters['intercom'].execute_tool("reply_conversation", params)
-
-@mcp.tool()
-async def intercom_close_conversation(conversation_id: str) -> str:
-    """Close a conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("close_conversation", {"id": conversation_id})
-
-@mcp.tool()
-async def intercom_search_conversations(query: str, per_page: int = 10) -> str:
-    """Search conversations in Intercom"""
-    return await adapters['intercom'].execute_tool("search_conversations", {"query": query, "per_page": per_page})
-
-# Contact Management
-@mcp.tool()
-async def intercom_list_contacts(per_page: int = 10, page: int = 1) -> str:
-    """List all contacts from Intercom"""
-    return await adapters['intercom'].execute_tool("list_contacts", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_create_contact(email: str, name: str = None, phone: str = None) -> str:
-    """Create a new contact in Intercom"""
-    params = {"email": email}
-    if name: params["name"] = name
-    if phone: params["phone"] = phone
-    return await adapters['intercom'].execute_tool("create_contact", params)
-
-@mcp.tool()
-async def intercom_view_contact(contact_id: str) -> str:
-    """Retrieve a specific contact by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_contact", {"id": contact_id})
-
-@mcp.tool()
-async def intercom_update_contact(contact_id: str, name: str = None, email: str = None, phone: str = None) -> str:
-    """Update an existing contact in Intercom"""
-    params = {"id": contact_id}
-    if name: params["name"] = name
-    if email: params["email"] = email
-    if phone: params["phone"] = phone
-    return await adapters['intercom'].execute_tool("update_contact", params)
-
-@mcp.tool()
-async def intercom_delete_contact(contact_id: str) -> str:
-    """Delete a contact from Intercom"""
-    return await adapters['intercom'].execute_tool("delete_contact", {"id": contact_id})
-
-@mcp.tool()
-async def intercom_search_contacts(query: str, per_page: int = 10) -> str:
-    """Search contacts in Intercom"""
-    return await adapters['intercom'].execute_tool("search_contacts", {"query": query, "per_page": per_page})
-
-# Company Management
-@mcp.tool()
-async def intercom_list_companies(per_page: int = 10, page: int = 1) -> str:
-    """List all companies from Intercom"""
-    return await adapters['intercom'].execute_tool("list_companies", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_create_company(name: str, company_id: str, website: str = None, industry: str = None) -> str:
-    """Create a new company in Intercom"""
-    params = {"name": name, "company_id": company_id}
-    if website: params["website"] = website
-    if industry: params["industry"] = industry
-    return await adapters['intercom'].execute_tool("create_company", params)
-
-@mcp.tool()
-async def intercom_view_company(company_id: str) -> str:
-    """Retrieve a specific company by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_company", {"id": company_id})
-
-# Admin Management
-@mcp.tool()
-async def intercom_list_admins() -> str:
-    """List all admins from Intercom"""
-    return await adapters['intercom'].execute_tool("list_admins", {})
-
-@mcp.tool()
-async def intercom_retrieve_admin(admin_id: str) -> str:
-    """Retrieve a specific admin by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("retrieve_admin", {"id": admin_id})
-
-@mcp.tool()
-async def intercom_set_admin_away(admin_id: str, away_mode_enabled: bool = True) -> str:
-    """Set admin away status in Intercom"""
-    return await adapters['intercom'].execute_tool("set_admin_away", {"id": admin_id, "away_mode_enabled": away_mode_enabled})
-
-@mcp.tool()
-async def intercom_list_away_reasons() -> str:
-    """List all away reasons from Intercom"""
-    return await adapters['intercom'].execute_tool("list_away_reasons", {})
-
-@mcp.tool()
-async def intercom_get_team_permissions(admin_id: str) -> str:
-    """Get team permissions for an admin in Intercom"""
-    return await adapters['intercom'].execute_tool("get_team_permissions", {"id": admin_id})
-
-@mcp.tool()
-async def intercom_list_admin_activities(admin_id: str, per_page: int = 10, page: int = 1) -> str:
-    """List admin activities from Intercom"""
-    return await adapters['intercom'].execute_tool("list_admin_activities", {"admin_id": admin_id, "per_page": per_page, "page": page})
-
-# Message Management
-@mcp.tool()
-async def intercom_list_messages(conversation_id: str, per_page: int = 10, page: int = 1) -> str:
-    """List all messages from a conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("list_messages", {"conversation_id": conversation_id, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_create_message(conversation_id: str, message_type: str, body: str) -> str:
-    """Create a message in a conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("create_message", {"conversation_id": conversation_id, "message_type": message_type, "body": body})
-
-@mcp.tool()
-async def intercom_reply_to_message(conversation_id: str, message: str, message_type: str = "comment") -> str:
-    """Reply to a message in Intercom"""
-    return await adapters['intercom'].execute_tool("reply_to_message", {"conversation_id": conversation_id, "message": message, "message_type": message_type})
-
-@mcp.tool()
-async def intercom_email_message(to_email: str, subject: str, body: str) -> str:
-    """Send an email message via Intercom"""
-    return await adapters['intercom'].execute_tool("email_message", {"to_email": to_email, "subject": subject, "body": body})
-
-@mcp.tool()
-async def intercom_group_message(user_ids: str, message: str) -> str:
-    """Send a group message in Intercom"""
-    return await adapters['intercom'].execute_tool("group_message", {"user_ids": user_ids, "message": message})
-
-@mcp.tool()
-async def intercom_message_attachments(message_id: str) -> str:
-    """Get attachments for a message in Intercom"""
-    return await adapters['intercom'].execute_tool("message_attachments", {"id": message_id})
-
-@mcp.tool()
-async def intercom_attach_file(conversation_id: str, file_url: str) -> str:
-    """Attach a file to a conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("attach_file", {"conversation_id": conversation_id, "file_url": file_url})
-
-# Conversation Actions
-@mcp.tool()
-async def intercom_assign_conversation(conversation_id: str, admin_id: str) -> str:
-    """Assign a conversation to an admin in Intercom"""
-    return await adapters['intercom'].execute_tool("assign_conversation", {"conversation_id": conversation_id, "admin_id": admin_id})
-
-@mcp.tool()
-async def intercom_open_conversation(conversation_id: str) -> str:
-    """Open a conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("open_conversation", {"id": conversation_id})
-
-@mcp.tool()
-async def intercom_snooze_conversation(conversation_id: str, snooze_until: str) -> str:
-    """Snooze a conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("snooze_conversation", {"conversation_id": conversation_id, "snooze_until": snooze_until})
-
-@mcp.tool()
-async def intercom_list_conversation_parts(conversation_id: str, per_page: int = 10, page: int = 1) -> str:
-    """List conversation parts from Intercom"""
-    return await adapters['intercom'].execute_tool("list_conversation_parts", {"conversation_id": conversation_id, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_redact_conversation_part(conversation_id: str, part_id: str) -> str:
-    """Redact a conversation part in Intercom"""
-    return await adapters['intercom'].execute_tool("redact_conversation_part", {"conversation_id": conversation_id, "part_id": part_id})
-
-@mcp.tool()
-async def intercom_customer_initiated_conversation(contact_id: str, message: str) -> str:
-    """Create a customer-initiated conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("customer_initiated_conversation", {"contact_id": contact_id, "message": message})
-
-@mcp.tool()
-async def intercom_admin_initiated_conversation(admin_id: str, contact_id: str, message: str) -> str:
-    """Create an admin-initiated conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("admin_initiated_conversation", {"admin_id": admin_id, "contact_id": contact_id, "message": message})
-
-@mcp.tool()
-async def intercom_view_admin(admin_id: str) -> str:
-    """Retrieve a specific admin by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_admin", {"id": admin_id})
-
-# Segment Management
-@mcp.tool()
-async def intercom_list_segments() -> str:
-    """List all segments from Intercom"""
-    return await adapters['intercom'].execute_tool("list_segments", {})
-
-@mcp.tool()
-async def intercom_view_segment(segment_id: str) -> str:
-    """Retrieve a specific segment by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_segment", {"id": segment_id})
-
-@mcp.tool()
-async def intercom_create_segment(name: str, conditions: str) -> str:
-    """Create a new segment in Intercom"""
-    return await adapters['intercom'].execute_tool("create_segment", {"name": name, "conditions": conditions})
-
-@mcp.tool()
-async def intercom_update_segment(segment_id: str, name: str = None, conditions: str = None) -> str:
-    """Update a segment in Intercom"""
-    params = {"id": segment_id}
-    if name: params["name"] = name
-    if conditions: params["conditions"] = conditions
-    return await adapters['intercom'].execute_tool("update_segment", params)
-
-@mcp.tool()
-async def intercom_delete_segment(segment_id: str) -> str:
-    """Delete a segment from Intercom"""
-    return await adapters['intercom'].execute_tool("delete_segment", {"id": segment_id})
-
-# Tag Management
-@mcp.tool()
-async def intercom_list_tags() -> str:
-    """List all tags from Intercom"""
-    return await adapters['intercom'].execute_tool("list_tags", {})
-
-@mcp.tool()
-async def intercom_create_tag(name: str) -> str:
-    """Create a new tag in Intercom"""
-    return await adapters['intercom'].execute_tool("create_tag", {"name": name})
-
-@mcp.tool()
-async def intercom_delete_tag(tag_id: str) -> str:
-    """Delete a tag from Intercom"""
-    return await adapters['intercom'].execute_tool("delete_tag", {"id": tag_id})
-
-@mcp.tool()
-async def intercom_tag_contact(contact_id: str, tag_id: str) -> str:
-    """Tag a contact in Intercom"""
-    return await adapters['intercom'].execute_tool("tag_contact", {"contact_id": contact_id, "tag_id": tag_id})
-
-@mcp.tool()
-async def intercom_untag_contact(contact_id: str, tag_id: str) -> str:
-    """Remove a tag from a contact in Intercom"""
-    return await adapters['intercom'].execute_tool("untag_contact", {"contact_id": contact_id, "tag_id": tag_id})
-
-@mcp.tool()
-async def intercom_tag_conversation(conversation_id: str, tag_id: str) -> str:
-    """Tag a conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("tag_conversation", {"conversation_id": conversation_id, "tag_id": tag_id})
-
-@mcp.tool()
-async def intercom_untag_conversation(conversation_id: str, tag_id: str) -> str:
-    """Remove a tag from a conversation in Intercom"""
-    return await adapters['intercom'].execute_tool("untag_conversation", {"conversation_id": conversation_id, "tag_id": tag_id})
-
-# Team Management
-@mcp.tool()
-async def intercom_list_teams() -> str:
-    """List all teams from Intercom"""
-    return await adapters['intercom'].execute_tool("list_teams", {})
-
-@mcp.tool()
-async def intercom_view_team(team_id: str) -> str:
-    """Retrieve a specific team by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_team", {"id": team_id})
-
-@mcp.tool()
-async def intercom_create_team(name: str) -> str:
-    """Create a new team in Intercom"""
-    return await adapters['intercom'].execute_tool("create_team", {"name": name})
-
-@mcp.tool()
-async def intercom_update_team(team_id: str, name: str) -> str:
-    """Update a team in Intercom"""
-    return await adapters['intercom'].execute_tool("update_team", {"id": team_id, "name": name})
-
-@mcp.tool()
-async def intercom_delete_team(team_id: str) -> str:
-    """Delete a team from Intercom"""
-    return await adapters['intercom'].execute_tool("delete_team", {"id": team_id})
-
-# Event Management
-@mcp.tool()
-async def intercom_list_events(contact_id: str, per_page: int = 10, page: int = 1) -> str:
-    """List events for a contact from Intercom"""
-    return await adapters['intercom'].execute_tool("list_events", {"contact_id": contact_id, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_create_event(contact_id: str, event_name: str, metadata: str = None) -> str:
-    """Create an event for a contact in Intercom"""
-    params = {"contact_id": contact_id, "event_name": event_name}
-    if metadata: params["metadata"] = metadata
-    return await adapters['intercom'].execute_tool("create_event", params)
-
-@mcp.tool()
-async def intercom_track_event(contact_id: str, event_name: str, created_at: str = None, metadata: str = None) -> str:
-    """Track an event for a contact in Intercom"""
-    params = {"contact_id": contact_id, "event_name": event_name}
-    if created_at: params["created_at"] = created_at
-    if metadata: params["metadata"] = metadata
-    return await adapters['intercom'].execute_tool("track_event", params)
-
-# Data Attributes
-@mcp.tool()
-async def intercom_list_data_attributes() -> str:
-    """List all data attributes from Intercom"""
-    return await adapters['intercom'].execute_tool("list_data_attributes", {})
-
-@mcp.tool()
-async def intercom_create_data_attribute(name: str, model: str, data_type: str) -> str:
-    """Create a data attribute in Intercom"""
-    return await adapters['intercom'].execute_tool("create_data_attribute", {"name": name, "model": model, "data_type": data_type})
-
-@mcp.tool()
-async def intercom_update_data_attribute(data_attribute_id: str, name: str = None, description: str = None) -> str:
-    """Update a data attribute in Intercom"""
-    params = {"id": data_attribute_id}
-    if name: params["name"] = name
-    if description: params["description"] = description
-    return await adapters['intercom'].execute_tool("update_data_attribute", params)
-
-# Article Management
-@mcp.tool()
-async def intercom_list_articles() -> str:
-    """List all articles from Intercom"""
-    return await adapters['intercom'].execute_tool("list_articles", {})
-
-@mcp.tool()
-async def intercom_view_article(article_id: str) -> str:
-    """Retrieve a specific article by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_article", {"id": article_id})
-
-@mcp.tool()
-async def intercom_create_article(title: str, body: str, author_id: str) -> str:
-    """Create a new article in Intercom"""
-    return await adapters['intercom'].execute_tool("create_article", {"title": title, "body": body, "author_id": author_id})
-
-@mcp.tool()
-async def intercom_update_article(article_id: str, title: str = None, body: str = None) -> str:
-    """Update an article in Intercom"""
-    params = {"id": article_id}
-    if title: params["title"] = title
-    if body: params["body"] = body
-    return await adapters['intercom'].execute_tool("update_article", params)
-
-@mcp.tool()
-async def intercom_delete_article(article_id: str) -> str:
-    """Delete an article from Intercom"""
-    return await adapters['intercom'].execute_tool("delete_article", {"id": article_id})
-
-# Collection Management
-@mcp.tool()
-async def intercom_list_collections() -> str:
-    """List all collections from Intercom"""
-    return await adapters['intercom'].execute_tool("list_collections", {})
-
-@mcp.tool()
-async def intercom_view_collection(collection_id: str) -> str:
-    """Retrieve a specific collection by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_collection", {"id": collection_id})
-
-@mcp.tool()
-async def intercom_create_collection(name: str, description: str = None) -> str:
-    """Create a new collection in Intercom"""
-    params = {"name": name}
-    if description: params["description"] = description
-    return await adapters['intercom'].execute_tool("create_collection", params)
-
-@mcp.tool()
-async def intercom_update_collection(collection_id: str, name: str = None, description: str = None) -> str:
-    """Update a collection in Intercom"""
-    params = {"id": collection_id}
-    if name: params["name"] = name
-    if description: params["description"] = description
-    return await adapters['intercom'].execute_tool("update_collection", params)
-
-@mcp.tool()
-async def intercom_delete_collection(collection_id: str) -> str:
-    """Delete a collection from Intercom"""
-    return await adapters['intercom'].execute_tool("delete_collection", {"id": collection_id})
-
-# Note Management
-@mcp.tool()
-async def intercom_list_notes(contact_id: str) -> str:
-    """List notes for a contact from Intercom"""
-    return await adapters['intercom'].execute_tool("list_notes", {"contact_id": contact_id})
-
-@mcp.tool()
-async def intercom_create_note(contact_id: str, body: str) -> str:
-    """Create a note for a contact in Intercom"""
-    return await adapters['intercom'].execute_tool("create_note", {"contact_id": contact_id, "body": body})
-
-@mcp.tool()
-async def intercom_view_note(note_id: str) -> str:
-    """Retrieve a specific note by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_note", {"id": note_id})
-
-# Subscription Management
-@mcp.tool()
-async def intercom_list_subscription_types() -> str:
-    """List all subscription types from Intercom"""
-    return await adapters['intercom'].execute_tool("list_subscription_types", {})
-
-@mcp.tool()
-async def intercom_create_subscription(contact_id: str, subscription_type_id: str) -> str:
-    """Create a subscription for a contact in Intercom"""
-    return await adapters['intercom'].execute_tool("create_subscription", {"contact_id": contact_id, "subscription_type_id": subscription_type_id})
-
-@mcp.tool()
-async def intercom_delete_subscription(contact_id: str, subscription_type_id: str) -> str:
-    """Delete a subscription for a contact in Intercom"""
-    return await adapters['intercom'].execute_tool("delete_subscription", {"contact_id": contact_id, "subscription_type_id": subscription_type_id})
-
-# Visitor Management
-@mcp.tool()
-async def intercom_list_visitors(per_page: int = 10, page: int = 1) -> str:
-    """List all visitors from Intercom"""
-    return await adapters['intercom'].execute_tool("list_visitors", {"per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_view_visitor(visitor_id: str) -> str:
-    """Retrieve a specific visitor by ID from Intercom"""
-    return await adapters['intercom'].execute_tool("view_visitor", {"id": visitor_id})
-
-@mcp.tool()
-async def intercom_update_visitor(visitor_id: str, name: str = None, email: str = None) -> str:
-    """Update a visitor in Intercom"""
-    params = {"id": visitor_id}
-    if name: params["name"] = name
-    if email: params["email"] = email
-    return await adapters['intercom'].execute_tool("update_visitor", params)
-
-@mcp.tool()
-async def intercom_convert_visitor(visitor_id: str, contact_id: str = None) -> str:
-    """Convert a visitor to a contact in Intercom"""
-    params = {"visitor_id": visitor_id}
-    if contact_id: params["contact_id"] = contact_id
-    return await adapters['intercom'].execute_tool("convert_visitor", params)
-
-# Count and Statistics
-@mcp.tool()
-async def intercom_count_conversations() -> str:
-    """Get conversation count from Intercom"""
-    return await adapters['intercom'].execute_tool("count_conversations", {})
-
-@mcp.tool()
-async def intercom_count_contacts() -> str:
-    """Get contact count from Intercom"""
-    return await adapters['intercom'].execute_tool("count_contacts", {})
-
-@mcp.tool()
-async def intercom_count_companies() -> str:
-    """Get company count from Intercom"""
-    return await adapters['intercom'].execute_tool("count_companies", {})
-
-@mcp.tool()
-async def intercom_count_admins() -> str:
-    """Get admin count from Intercom"""
-    return await adapters['intercom'].execute_tool("count_admins", {})
-
-# Search Operations
-@mcp.tool()
-async def intercom_search_contacts(query: str, per_page: int = 10, page: int = 1) -> str:
-    """Search contacts in Intercom"""
-    return await adapters['intercom'].execute_tool("search_contacts", {"query": query, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_search_conversations(query: str, per_page: int = 10, page: int = 1) -> str:
-    """Search conversations in Intercom"""
-    return await adapters['intercom'].execute_tool("search_conversations", {"query": query, "per_page": per_page, "page": page})
-
-@mcp.tool()
-async def intercom_search_companies(query: str, per_page: int = 10, page: int = 1) -> str:
-    """Search companies in Intercom"""
-    return await adapters['intercom'].execute_tool("search_companies", {"query": query, "per_page": per_page, "page": page})
-
-# Export Operations
-@mcp.tool()
-async def intercom_export_contacts(segment_id: str = None) -> str:
-    """Export contacts from Intercom"""
-    params = {}
-    if segment_id: params["segment_id"] = segment_id
-    return await adapters['intercom'].execute_tool("export_contacts", params)
-
-@mcp.tool()
-async def intercom_export_conversations(start_time: str, end_time: str) -> str:
-    """Export conversations from Intercom"""
-    return await adapters['intercom'].execute_tool("export_conversations", {"start_time": start_time, "end_time": end_time})
-
-# Bulk Operations
-@mcp.tool()
-async def intercom_bulk_create_contacts(contacts_data: str) -> str:
-    """Bulk create contacts in Intercom"""
-    return await adapters['intercom'].execute_tool("bulk_create_contacts", {"contacts_data": contacts_data})
-
-@mcp.tool()
-async def intercom_bulk_update_contacts(contacts_data: str) -> str:
-    """Bulk update contacts in Intercom"""
-    return await adapters['intercom'].execute_tool("bulk_update_contacts", {"contacts_data": contacts_data})
-
-@mcp.tool()
-async def intercom_bulk_delete_contacts(contact_ids: str) -> str:
-    """Bulk delete contacts in Intercom"""
-    return await adapters['intercom'].execute_tool("bulk_delete_contacts", {"contact_ids": contact_ids})
-
-# =============================================================================
-# REGISTRATION FUNCTION (SIMPLIFIED)
-# =============================================================================
-
-def register_adapter_tools():
-    """Static tools are automatically registered via @mcp.tool() decorators"""
-    logger.info("📋 Static tool registration complete via decorators")
-    
-    # Count registered tools
-    if hasattr(mcp, '_tool_manager') and hasattr(mcp._tool_manager, '_tools'):
-        total_tools = len(mcp._tool_manager._tools)
-        logger.info(f"🔧 Total Tools Registered: {total_tools}")
-    else:
-        logger.info("🔧 Tool count unavailable")
-
-# =============================================================================
-# RESOURCES - Configuration and Documentation
-# =============================================================================
+# =============================================================================
+# RESOURCES - Configuration and Documentation
+# =============================================================================
 
 @mcp.resource("config://server")
 def get_server_config() -> str:
     """Server configuration and environment details"""
+    global _server_config_cache
+    
+    # Configuration is read from the environment at startup; only the adapters can change
+    if _server_config_cache is not None and _server_config_cache[0] == _adapter_registry_version:
+        return _server_config_cache[1]
+    
+    config_version = _adapter_registry_version
     config = {
         "server_name": "Aura MCP Unified Server",
         "version": "1.0.0",
@@ -1702,32 +1857,54 @@ def get_server_config() -> str:
                 "configured": bool(MCPServerConfig.POSTGRES_USER)
             }
         },
-        "total_tools_available": sum(len(adapter.all_tools) for adapter in active_adapters.values()) + 5
+        "total_tools_available": sum(len(adapter.all_tools) for adapter in active_adapters.values()) + _UNIFIED_TOOLS_COUNT
     }
-    return json.dumps(config, indent=2)
+    
+    config_json = _dump(config, pretty=True)
+    _server_config_cache = (config_version, config_json)
+    return config_json
+
+def invalidate_tools_doc():
+    """Drop the serialized docs://tools resource so the next fetch rebuilds it"""
+    global _tools_doc_cache
+    _tools_doc_cache = None
 
 @mcp.resource("docs://tools")
 def get_tools_documentation() -> str:
     """Complete tools documentation for all integrated platforms"""
+    global _tools_doc_cache
+    
+    # Tool lists only change when adapters are (re)registered
+    if _tools_doc_cache is not None and _tools_doc_cache[0] == _adapter_registry_version:
+        return _tools_doc_cache[1]
+    
+    docs_version = _adapter_registry_version
     docs = {
         "title": "Aura MCP Unified Server - API Tools Documentation",
         "platforms": {},
-        "unified_features": [
-            "health_check", "unified_search", "get_customer_journey",
-            "list_platform_tools", "get_rate_limit_status"
-        ],
+        "unified_features": _UNIFIED_TOOLS,
         "total_tools": 0
     }
     
     for platform, adapter in active_adapters.items():
         platform_docs = {
             "total_tools": len(adapter.get_tools()),
-            "rate_limit": adapter.rate_limiter.limit if hasattr(adapter, 'rate_limiter') else "unknown",
+            "rate_limit": _rate_limiters[platform].max_requests if platform in _rate_limiters else "unknown",
             "categories": {},
             "tools": []
         }
         
         for tool in adapter.get_tools():
+            if isinstance(tool, str):
+                # Freshdesk lists tool names only; describe them from the tool config
+                config = adapter.all_tools.get(tool, {})
+                tool = {
+                    "name": tool,
+                    "category": config.get("category", "general"),
+                    "description": config.get("description", ""),
+                    "parameters": config.get("parameters", {})
+                }
+            
             category = tool.get("category", "general")
             if category not in platform_docs["categories"]:
                 platform_docs["categories"][category] = []
@@ -1743,12 +1920,66 @@ def get_tools_documentation() -> str:
         docs["platforms"][platform] = platform_docs
         docs["total_tools"] += len(adapter.all_tools)
     
-    return json.dumps(docs, indent=2)
+    docs_json = _dump(docs, pretty=True)
+    _tools_doc_cache = (docs_version, docs_json)
+    return docs_json
+
+@mcp.resource("metrics://tools")
+def get_tool_metrics() -> str:
+    """Per-tool call latency (P50/P99) of each platform adapter, slowest first"""
+    metrics = {
+        platform: adapter.tool_metrics.snapshot()
+        for platform, adapter in active_adapters.items()
+        if hasattr(adapter, 'tool_metrics')
+    }
+    return _dump(metrics, pretty=True)
 
 # =============================================================================
 # MAIN SERVER FUNCTION
 # =============================================================================
 
+def start_metrics_server():
+    """Expose Prometheus metrics on MCP_METRICS_PORT when configured and installed"""
+    if not MCPServerConfig.METRICS_PORT:
+        return
+    
+    try:
+        from prometheus_client import start_http_server
+    except ImportError:
+        logger.warning("⚠️  MCP_METRICS_PORT set but prometheus_client is not installed - metrics export disabled")
+        return
+    
+    start_http_server(int(MCPServerConfig.METRICS_PORT))
+    logger.info(f"📈 Prometheus metrics: http://localhost:{MCPServerConfig.METRICS_PORT}/metrics")
+
+async def _log_startup_summary():
+    """Log platform, tool and endpoint information once the server is starting"""
+    total_tools = _UNIFIED_TOOLS_COUNT
+    for platform, adapter in active_adapters.items():
+        try:
+            tool_count = len(adapter.all_tools)
+        except AttributeError:
+            continue
+        total_tools += tool_count
+        logger.info(f"🔧 {platform.title()} registered {tool_count} tools")
+    
+    logger.info(f"📡 Server: Aura MCP Unified Server v1.0.0")
+    logger.info(f"🚢 Transport: SSE")
+    logger.info(f"🔌 Port: {MCPServerConfig.MCP_SERVER_PORT}")
+    logger.info(f"🢂 Active Platforms: {', '.join(active_adapters.keys())}")
+    logger.info(f"🔧 Total Tools Available: {total_tools}")
+    logger.info(f"⚡ Rate Limits: Freshdesk={MCPServerConfig.FRESHDESK_RATE_LIMIT}/min, Intercom={MCPServerConfig.INTERCOM_RATE_LIMIT}/min")
+    logger.info(f"🏥 Health Endpoint: http://localhost:{MCPServerConfig.MCP_SERVER_PORT}/health")
+    
+    # Log adapter-specific information
+    if freshdesk_adapter:
+        logger.info(f"🎫 Freshdesk: {MCPServerConfig.FRESHDESK_DOMAIN} ({len(freshdesk_adapter.all_tools)} tools)")
+    
+    if intercom_adapter:
+        logger.info(f"💬 Intercom: Configured ({len(intercom_adapter.all_tools)} tools)")
+    
+    logger.info("✅ Server initialization complete - ready for connections!")
+
 async def main():
     """Main server startup function"""
     try:
@@ -1757,6 +1988,8 @@ async def main():
         # Validate configuration
         MCPServerConfig.validate()
         
+        start_metrics_server()
+        
         # Initialize adapters
         initialization_success = await initialize_adapters()
         
@@ -1771,39 +2004,8 @@ async def main():
         logger.info("🛠️  Static tools registered via @mcp.tool() decorators")
         # register_adapter_tools()  # Disabled - using static decorators
         
-        # Log startup information
-        total_tools = 0
-        for platform, adapter in active_adapters.items():
-            if hasattr(adapter, 'all_tools'):
-                try:
-                    tools = list(adapter.all_tools.keys())
-                    tool_count = len(tools)
-                    total_tools += tool_count
-                    logger.info(f"🔧 {platform.title()} registered {tool_count} tools")
-                except Exception as e:
-                    logger.error(f"❌ Failed to get tools from {platform}: {e}")
-        
-        # Add core tools
-        total_tools += 5  # Core tools: health_check, unified_search, get_customer_journey, list_platform_tools, get_rate_limit_status
-        
-        logger.info(f"📡 Server: Aura MCP Unified Server v1.0.0")
-        logger.info(f"🚢 Transport: SSE")
-        logger.info(f"🔌 Port: {MCPServerConfig.MCP_SERVER_PORT}")
-        logger.info(f"🢂 Active Platforms: {', '.join(active_adapters.keys())}")
-        logger.info(f"🔧 Total Tools Available: {total_tools}")
-        logger.info(f"⚡ Rate Limits: Freshdesk={MCPServerConfig.FRESHDESK_RATE_LIMIT}/min, Intercom={MCPServerConfig.INTERCOM_RATE_LIMIT}/min")
-        logger.info(f"🏥 Health Endpoint: http://localhost:{MCPServerConfig.MCP_SERVER_PORT}/health")
-        
-        # Log adapter-specific information
-        if freshdesk_adapter:
-            tools = len(freshdesk_adapter.all_tools) if freshdesk_adapter else 'not available'
-            logger.info(f"🎫 Freshdesk: {MCPServerConfig.FRESHDESK_DOMAIN} ({tools} tools)")
-        
-        if intercom_adapter:
-            tools = len(intercom_adapter.all_tools) if intercom_adapter else 'not available'
-            logger.info(f"💬 Intercom: Configured ({tools} tools)")
-        
-        logger.info("✅ Server initialization complete - ready for connections!")
+        # Log startup information in the background so the listener binds immediately
+        startup_log_task = asyncio.create_task(_log_startup_summary())
         
         # Start the MCP server with SSE transport
         await mcp.run_async(
@@ -1815,11 +2017,22 @@ async def main():
     except Exception as e:
         logger.error(f"❌ Server startup failed: {e}")
         raise
+    finally:
+        # Release pooled HTTP connections on shutdown
+        await close_adapters()
 
 if __name__ == "__main__":
     # Ensure required directories exist
     os.makedirs("/app/logs", exist_ok=True)
     
+    # Use uvloop's libuv-based event loop when available
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("⚡ Using uvloop event loop")
+    except ImportError:
+        logger.info("ℹ️  uvloop not installed - using default asyncio event loop")
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
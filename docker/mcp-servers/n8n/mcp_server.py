@@ -7,43 +7,124 @@ Implements official MCP protocol with JSON-RPC over stdio transport
 import asyncio
 import logging
 import os
-import sys
-import json
-from typing import Any, Dict, List, Optional
+import ssl
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 import httpx
+import orjson
 
-# Add shared MCP base to path
-sys.path.append('/app/shared/mcp-base')
+# Shared MCP base is importable via PYTHONPATH (see Dockerfile)
 from mcp_server_base import MCPServerBase, MCPTool, MCPResource
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Incremental JSON parsing of execution lists needs the optional ijson package
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Execution fields used by the execution summaries
+_EXECUTION_SUMMARY_FIELDS = ("id", "status", "workflowName", "startedAt")
+
+
+def _summarize_execution(execution: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the execution fields shown in execution lists"""
+    return {field: execution[field] for field in _EXECUTION_SUMMARY_FIELDS if field in execution}
+
+# Read caching: workflow lists change often, single workflows rarely
+_WORKFLOWS_TTL_SECONDS = 5.0
+_WORKFLOW_TTL_SECONDS = 30.0
+_CACHE_MAX_ENTRIES = 256
+
+# TLS context built once, so the CA bundle is loaded at import rather than per client
+_SSL_CTX = ssl.create_default_context()
+
 class N8nClient:
     """Standard n8n API client for MCP server"""
     
+    __slots__ = ("base_url", "api_key", "_client", "_cache")
+    
     def __init__(self, base_url: str, api_key: str = ""):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         
-    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make authenticated request to n8n API"""
-        url = f"{self.base_url}/api/v1{endpoint}"
-        
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["X-N8N-API-KEY"] = self.api_key
         
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                **kwargs
-            )
-            response.raise_for_status()
-            return response.json() if response.content else {}
+        # One pooled client for all calls so connections are kept alive between requests
+        self._client = httpx.AsyncClient(
+            base_url=f"{self.base_url}/api/v1",
+            headers=headers,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=HTTP2_AVAILABLE,
+            verify=_SSL_CTX
+        )
+        
+        # key -> (expires_at, task); a pending task is shared by concurrent callers
+        self._cache: Dict[Hashable, Tuple[float, asyncio.Task]] = {}
+        
+    async def aclose(self):
+        """Close the HTTP client and its connection pool"""
+        await self._client.aclose()
+        
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make authenticated request to n8n API"""
+        response = await self._client.request(method=method, url=endpoint, **kwargs)
+        response.raise_for_status()
+        raw = response.content
+        return orjson.loads(raw) if raw else {}
+    
+    async def _cached(self, key: Hashable, ttl: float, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached result for key, or run factory() once for all concurrent callers
+        
+        Args:
+            key: Cache key
+            ttl: Seconds the result stays fresh
+            factory: Zero-argument callable returning the request awaitable
+            
+        Returns:
+            The (possibly shared) result; failures are not cached
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and (entry[0] > now or not entry[1].done()):
+            return await asyncio.shield(entry[1])
+        
+        if len(self._cache) >= _CACHE_MAX_ENTRIES:
+            self._cache = {k: e for k, e in self._cache.items() if e[0] > now or not e[1].done()}
+        
+        task = asyncio.ensure_future(factory())
+        self._cache[key] = (now + ttl, task)
+        task.add_done_callback(lambda done: self._evict_failed(key, done))
+        return await asyncio.shield(task)
+    
+    def _evict_failed(self, key: Hashable, task: asyncio.Task):
+        """Drop a failed request so the next caller retries it"""
+        if task.cancelled() or task.exception() is not None:
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] is task:
+                del self._cache[key]
+    
+    def invalidate(self, workflow_id: Optional[str] = None):
+        """Drop cached workflow lists and, if given, the cached workflow"""
+        for key in [key for key in self._cache if key[0] == "workflows"]:
+            del self._cache[key]
+        if workflow_id is not None:
+            self._cache.pop(("workflow", workflow_id), None)
     
     async def list_workflows(self, active: Optional[bool] = None) -> List[Dict[str, Any]]:
         """List workflows"""
@@ -52,7 +133,10 @@ class N8nClient:
             params["active"] = str(active).lower()
             
         try:
-            result = await self._make_request("GET", "/workflows", params=params)
+            result = await self._cached(
+                ("workflows", active), _WORKFLOWS_TTL_SECONDS,
+                lambda: self._make_request("GET", "/workflows", params=params)
+            )
             return result.get("data", []) if isinstance(result, dict) else result
         except Exception as e:
             logger.error(f"Error listing workflows: {e}")
@@ -61,7 +145,10 @@ class N8nClient:
     async def get_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Get workflow details by ID"""
         try:
-            return await self._make_request("GET", f"/workflows/{workflow_id}")
+            return await self._cached(
+                ("workflow", workflow_id), _WORKFLOW_TTL_SECONDS,
+                lambda: self._make_request("GET", f"/workflows/{workflow_id}")
+            )
         except Exception as e:
             logger.error(f"Error getting workflow {workflow_id}: {e}")
             raise
@@ -80,6 +167,9 @@ class N8nClient:
     
     async def get_executions(self, workflow_id: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
         """Get workflow executions"""
+        if limit <= 0:
+            return []
+        
         params = {"limit": min(limit, 100)}
         if workflow_id:
             params["workflowId"] = workflow_id
@@ -91,6 +181,49 @@ class N8nClient:
             logger.error(f"Error getting executions: {e}")
             return []
     
+    async def iter_execution_summaries(self, workflow_id: Optional[str] = None,
+                                       limit: int = 20) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the summary fields of recent executions as the response arrives
+        
+        Args:
+            workflow_id: Optional workflow ID to filter by
+            limit: Number of executions to retrieve (max 100)
+            
+        Returns:
+            Async iterator of dicts with id, status, workflowName and startedAt;
+            without ijson the list is fetched whole and then summarized
+        """
+        if not IJSON_AVAILABLE:
+            for execution in await self.get_executions(workflow_id, limit):
+                yield _summarize_execution(execution)
+            return
+        
+        if limit <= 0:
+            return
+        
+        params = {"limit": min(limit, 100)}
+        if workflow_id:
+            params["workflowId"] = workflow_id
+        
+        try:
+            async with self._client.stream("GET", "/executions", params=params) as response:
+                response.raise_for_status()
+                
+                # Push-parse each chunk; only completed items of the data array are built
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, "data.item")
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for execution in items:
+                        yield _summarize_execution(execution)
+                    del items[:]
+                parser.close()
+                for execution in items:
+                    yield _summarize_execution(execution)
+        except Exception as e:
+            logger.error(f"Error getting executions: {e}")
+    
     async def get_execution(self, execution_id: str) -> Dict[str, Any]:
         """Get execution details by ID"""
         try:
@@ -102,7 +235,9 @@ class N8nClient:
     async def activate_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Activate a workflow"""
         try:
-            return await self._make_request("POST", f"/workflows/{workflow_id}/activate")
+            result = await self._make_request("POST", f"/workflows/{workflow_id}/activate")
+            self.invalidate(workflow_id)
+            return result
         except Exception as e:
             logger.error(f"Error activating workflow {workflow_id}: {e}")
             raise
@@ -110,11 +245,72 @@ class N8nClient:
     async def deactivate_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Deactivate a workflow"""
         try:
-            return await self._make_request("POST", f"/workflows/{workflow_id}/deactivate")
+            result = await self._make_request("POST", f"/workflows/{workflow_id}/deactivate")
+            self.invalidate(workflow_id)
+            return result
         except Exception as e:
             logger.error(f"Error deactivating workflow {workflow_id}: {e}")
             raise
 
+# Result formatting, compiled once at import
+_STATUS_EMOJI = {"success": "✅", "error": "❌", "running": "🔄", "waiting": "⏳"}
+_UNKNOWN_STATUS_EMOJI = "❓"
+_ACTIVE_LABEL = "🟢 Active"
+_INACTIVE_LABEL = "⚪ Inactive"
+
+_WORKFLOW_DETAILS_TEMPLATE = (
+    "Workflow Details for ID: {id}\n"
+    "📝 Name: {name}\n"
+    "{status_emoji} Status: {status}\n"
+    "🔗 Nodes: {nodes}\n"
+    "🔄 Connections: {connections}\n"
+    "📅 Created: {created}\n"
+    "🔄 Updated: {updated}\n"
+    "🏷️ Tags: {tags}"
+)
+
+_EXECUTION_DETAILS_TEMPLATE = (
+    "Execution Details for ID: {id}\n"
+    "{status_emoji} Status: {status}\n"
+    "📝 Workflow: {workflow}\n"
+    "🆔 Workflow ID: {workflow_id}\n"
+    "🚀 Started: {started}\n"
+    "🏁 Finished: {finished}\n"
+    "⏱️ Duration: {duration} ms\n"
+    "🔢 Mode: {mode}"
+)
+
+
+def _format_workflow_row(workflow: Dict[str, Any]) -> str:
+    """One line of the list_workflows result"""
+    return (f"{_ACTIVE_LABEL if workflow.get('active') else _INACTIVE_LABEL} {workflow.get('name', 'Unnamed')} "
+            f"(ID: {workflow.get('id')}) - Updated: {workflow.get('updatedAt', 'Unknown')}")
+
+
+def _format_execution_row(execution: Dict[str, Any]) -> str:
+    """One line of the get_workflow_executions result"""
+    return (f"{_STATUS_EMOJI.get(execution.get('status'), _UNKNOWN_STATUS_EMOJI)} Execution {execution.get('id')} "
+            f"[{execution.get('status', 'unknown')}] - Workflow: {execution.get('workflowName', 'Unknown')} "
+            f"- {execution.get('startedAt', 'Unknown time')}")
+
+
+# Tool and resource definitions, built once at import: (definition, handler method name)
+_TOOL_SPECS: Tuple[Tuple[MCPTool, str], ...] = (
+    (MCPTool(name="list_workflows", title="List n8n Workflows", description="List n8n workflows with optional filters", inputSchema={"type": "object", "properties": {"active_only": {"type": "boolean", "description": "If true, only return active workflows"}}}), "_tool_list_workflows"),
+    (MCPTool(name="get_workflow_details", title="Get Workflow Details", description="Get detailed information about a specific workflow", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "The n8n workflow ID"}}, "required": ["workflow_id"]}), "_tool_get_workflow_details"),
+    (MCPTool(name="execute_workflow", title="Execute Workflow", description="Execute an n8n workflow", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "The n8n workflow ID to execute"}, "input_data": {"type": "string", "description": "JSON string of input data for the workflow", "default": "{}"}}, "required": ["workflow_id"]}), "_tool_execute_workflow"),
+    (MCPTool(name="get_workflow_executions", title="Get Workflow Executions", description="Get recent workflow executions", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "Optional specific workflow ID to filter by"}, "limit": {"type": "integer", "description": "Number of executions to retrieve (max 50)", "default": 10}}}), "_tool_get_workflow_executions"),
+    (MCPTool(name="get_execution_details", title="Get Execution Details", description="Get detailed information about a specific execution", inputSchema={"type": "object", "properties": {"execution_id": {"type": "string", "description": "The n8n execution ID"}}, "required": ["execution_id"]}), "_tool_get_execution_details"),
+    (MCPTool(name="activate_workflow", title="Activate Workflow", description="Activate an n8n workflow", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "The n8n workflow ID to activate"}}, "required": ["workflow_id"]}), "_tool_activate_workflow"),
+    (MCPTool(name="deactivate_workflow", title="Deactivate Workflow", description="Deactivate an n8n workflow", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "The n8n workflow ID to deactivate"}}, "required": ["workflow_id"]}), "_tool_deactivate_workflow"),
+)
+
+_RESOURCE_SPECS: Tuple[Tuple[MCPResource, str], ...] = (
+    (MCPResource(uri="n8n://workflows", name="workflows_overview", title="n8n Workflows Overview", description="Overview of n8n workflows", mimeType="application/json"), "_resource_workflows_overview"),
+    (MCPResource(uri="n8n://status", name="connection_status", title="n8n Connection Status", description="Current n8n connection status", mimeType="application/json"), "_resource_connection_status"),
+)
+
+
 class N8nMcpServer(MCPServerBase):
     """Production n8n MCP Server"""
 
@@ -124,13 +320,18 @@ class N8nMcpServer(MCPServerBase):
             port=int(os.getenv("N8N_MCP_PORT", 3001))
         )
         self.n8n_client = None
+        # Dispatch tables filled at registration: tool name / resource URI -> handler
+        self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[str]]] = {}
+        self._resource_handlers: Dict[str, Callable[[], Awaitable[str]]] = {}
 
     async def initialize_server(self):
         """Initialize n8n MCP server"""
         base_url = os.getenv("N8N_BASE_URL", "http://localhost:5678")
         api_key = os.getenv("N8N_API_KEY", "")
-        self.n8n_client = N8nClient(base_url, api_key)
-        logger.info(f"n8n client initialized for URL: {base_url}")
+        # run() initializes again; keep the first client rather than leaking its pool
+        if self.n8n_client is None:
+            self.n8n_client = N8nClient(base_url, api_key)
+            logger.info(f"n8n client initialized for URL: {base_url}")
 
         await self._register_tools()
         await self._register_resources()
@@ -139,26 +340,17 @@ class N8nMcpServer(MCPServerBase):
 
     async def _register_tools(self):
         """Register n8n MCP tools"""
-        tools_to_register = [
-            (MCPTool(name="list_workflows", title="List n8n Workflows", description="List n8n workflows with optional filters", inputSchema={"type": "object", "properties": {"active_only": {"type": "boolean", "description": "If true, only return active workflows"}}}), self._tool_list_workflows),
-            (MCPTool(name="get_workflow_details", title="Get Workflow Details", description="Get detailed information about a specific workflow", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "The n8n workflow ID"}}, "required": ["workflow_id"]}), self._tool_get_workflow_details),
-            (MCPTool(name="execute_workflow", title="Execute Workflow", description="Execute an n8n workflow", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "The n8n workflow ID to execute"}, "input_data": {"type": "string", "description": "JSON string of input data for the workflow", "default": "{}"}}, "required": ["workflow_id"]}), self._tool_execute_workflow),
-            (MCPTool(name="get_workflow_executions", title="Get Workflow Executions", description="Get recent workflow executions", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "Optional specific workflow ID to filter by"}, "limit": {"type": "integer", "description": "Number of executions to retrieve (max 50)", "default": 10}}}), self._tool_get_workflow_executions),
-            (MCPTool(name="get_execution_details", title="Get Execution Details", description="Get detailed information about a specific execution", inputSchema={"type": "object", "properties": {"execution_id": {"type": "string", "description": "The n8n execution ID"}}, "required": ["execution_id"]}), self._tool_get_execution_details),
-            (MCPTool(name="activate_workflow", title="Activate Workflow", description="Activate an n8n workflow", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "The n8n workflow ID to activate"}}, "required": ["workflow_id"]}), self._tool_activate_workflow),
-            (MCPTool(name="deactivate_workflow", title="Deactivate Workflow", description="Deactivate an n8n workflow", inputSchema={"type": "object", "properties": {"workflow_id": {"type": "string", "description": "The n8n workflow ID to deactivate"}}, "required": ["workflow_id"]}), self._tool_deactivate_workflow),
-        ]
-        for tool, handler in tools_to_register:
+        for tool, handler_name in _TOOL_SPECS:
+            handler = getattr(self, handler_name)
             self.register_tool(tool, handler)
+            self._tool_handlers[tool.name] = handler
 
     async def _register_resources(self):
         """Register n8n MCP resources"""
-        resources_to_register = [
-            (MCPResource(uri="n8n://workflows", name="workflows_overview", title="n8n Workflows Overview", description="Overview of n8n workflows", mimeType="application/json"), self._resource_workflows_overview),
-            (MCPResource(uri="n8n://status", name="connection_status", title="n8n Connection Status", description="Current n8n connection status", mimeType="application/json"), self._resource_connection_status),
-        ]
-        for resource, handler in resources_to_register:
+        for resource, handler_name in _RESOURCE_SPECS:
+            handler = getattr(self, handler_name)
             self.register_resource(resource, handler)
+            self._resource_handlers[resource.uri] = handler
 
     # Tool implementations
     async def _tool_list_workflows(self, arguments: Dict[str, Any]) -> str:
@@ -167,8 +359,7 @@ class N8nMcpServer(MCPServerBase):
             active_only = arguments.get("active_only", False)
             workflows = await self.n8n_client.list_workflows(active=active_only if active_only else None)
             if not workflows: return "No workflows found in n8n."
-            results = [f"{'🟢 Active' if w.get('active') else '⚪ Inactive'} {w.get('name', 'Unnamed')} (ID: {w.get('id')}) - Updated: {w.get('updatedAt', 'Unknown')}" for w in workflows]
-            return f"Found {len(workflows)} workflows:\n" + "\n".join(results)
+            return f"Found {len(workflows)} workflows:\n" + "\n".join(map(_format_workflow_row, workflows))
         except Exception as e:
             logger.error(f"Error in list_workflows tool: {e}")
             return f"Error listing workflows: {str(e)}"
@@ -178,15 +369,18 @@ class N8nMcpServer(MCPServerBase):
         try:
             workflow_id = arguments["workflow_id"]
             workflow = await self.n8n_client.get_workflow(workflow_id)
-            status = "🟢 Active" if workflow.get("active") else "⚪ Inactive"
-            return (f"Workflow Details for ID: {workflow_id}\n"
-                    f"📝 Name: {workflow.get('name', 'Unnamed')}\n"
-                    f"{status} Status: {'Active' if workflow.get('active') else 'Inactive'}\n"
-                    f"🔗 Nodes: {len(workflow.get('nodes', []))}\n"
-                    f"🔄 Connections: {len(workflow.get('connections', {}))}\n"
-                    f"📅 Created: {workflow.get('createdAt', 'Unknown')}\n"
-                    f"🔄 Updated: {workflow.get('updatedAt', 'Unknown')}\n"
-                    f"🏷️ Tags: {', '.join(workflow.get('tags', []))}")
+            active = workflow.get("active")
+            return _WORKFLOW_DETAILS_TEMPLATE.format_map({
+                "id": workflow_id,
+                "name": workflow.get("name", "Unnamed"),
+                "status_emoji": _ACTIVE_LABEL if active else _INACTIVE_LABEL,
+                "status": "Active" if active else "Inactive",
+                "nodes": len(workflow.get("nodes", [])),
+                "connections": len(workflow.get("connections", {})),
+                "created": workflow.get("createdAt", "Unknown"),
+                "updated": workflow.get("updatedAt", "Unknown"),
+                "tags": ", ".join(workflow.get("tags", []))
+            })
         except Exception as e:
             logger.error(f"Error in get_workflow_details tool: {e}")
             return f"Error getting workflow details: {str(e)}"
@@ -196,7 +390,7 @@ class N8nMcpServer(MCPServerBase):
         try:
             workflow_id = arguments["workflow_id"]
             input_data_str = arguments.get("input_data", "{}")
-            data = json.loads(input_data_str) if input_data_str != "{}" else None
+            data = orjson.loads(input_data_str) if input_data_str and input_data_str != "{}" else None
             result = await self.n8n_client.execute_workflow(workflow_id, data)
             return (f"🚀 Workflow executed successfully!\n"
                     f"Workflow ID: {workflow_id}\n"
@@ -212,10 +406,8 @@ class N8nMcpServer(MCPServerBase):
         try:
             workflow_id = arguments.get("workflow_id")
             limit = min(arguments.get("limit", 10), 50)
-            executions = await self.n8n_client.get_executions(workflow_id, limit)
-            if not executions: return "No executions found."
-            status_emoji = {"success": "✅", "error": "❌", "running": "🔄", "waiting": "⏳"}
-            results = [f"{status_emoji.get(e.get('status'), '❓')} Execution {e.get('id')} [{e.get('status', 'unknown')}] - Workflow: {e.get('workflowName', 'Unknown')} - {e.get('startedAt', 'Unknown time')}" for e in executions]
+            results = [_format_execution_row(e) async for e in self.n8n_client.iter_execution_summaries(workflow_id, limit)]
+            if not results: return "No executions found."
             return f"Recent {len(results)} executions:\n" + "\n".join(results)
         except Exception as e:
             logger.error(f"Error in get_workflow_executions tool: {e}")
@@ -226,15 +418,18 @@ class N8nMcpServer(MCPServerBase):
         try:
             execution_id = arguments["execution_id"]
             execution = await self.n8n_client.get_execution(execution_id)
-            status_emoji = {"success": "✅", "error": "❌", "running": "🔄", "waiting": "⏳"}
-            return (f"Execution Details for ID: {execution_id}\n"
-                    f"{status_emoji.get(execution.get('status'), '❓')} Status: {execution.get('status', 'Unknown')}\n"
-                    f"📝 Workflow: {execution.get('workflowName', 'Unknown')}\n"
-                    f"🆔 Workflow ID: {execution.get('workflowId', 'Unknown')}\n"
-                    f"🚀 Started: {execution.get('startedAt', 'Unknown')}\n"
-                    f"🏁 Finished: {execution.get('stoppedAt', 'Not finished')}\n"
-                    f"⏱️ Duration: {execution.get('duration', 'Unknown')} ms\n"
-                    f"🔢 Mode: {execution.get('mode', 'Unknown')}")
+            status = execution.get("status")
+            return _EXECUTION_DETAILS_TEMPLATE.format_map({
+                "id": execution_id,
+                "status_emoji": _STATUS_EMOJI.get(status, _UNKNOWN_STATUS_EMOJI),
+                "status": execution.get("status", "Unknown"),
+                "workflow": execution.get("workflowName", "Unknown"),
+                "workflow_id": execution.get("workflowId", "Unknown"),
+                "started": execution.get("startedAt", "Unknown"),
+                "finished": execution.get("stoppedAt", "Not finished"),
+                "duration": execution.get("duration", "Unknown"),
+                "mode": execution.get("mode", "Unknown")
+            })
         except Exception as e:
             logger.error(f"Error in get_execution_details tool: {e}")
             return f"Error getting execution details: {str(e)}"
@@ -271,9 +466,9 @@ class N8nMcpServer(MCPServerBase):
         try:
             workflows = await self.n8n_client.list_workflows()
             active_count = sum(1 for w in workflows if w.get("active"))
-            return json.dumps({"total_workflows": len(workflows), "active_workflows": active_count})
+            return orjson.dumps({"total_workflows": len(workflows), "active_workflows": active_count}).decode()
         except Exception as e:
-            return f'{{"error": "Error accessing workflows: {str(e)}"}}'
+            return orjson.dumps({"error": f"Error accessing workflows: {str(e)}"}).decode()
 
     async def _resource_connection_status(self) -> str:
         if not self.n8n_client: return '{"status": "not_connected", "reason": "missing configuration"}'
@@ -281,29 +476,30 @@ class N8nMcpServer(MCPServerBase):
             await self.n8n_client.list_workflows()
             return '{"status": "connected", "reason": "operational"}'
         except Exception as e:
-            return f'{{"status": "error", "reason": "{str(e)}"}}'
+            return orjson.dumps({"status": "error", "reason": str(e)}).decode()
 
     # Abstract method implementations
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
-        handler = getattr(self, f"_tool_{tool_name}", None)
+        handler = self._tool_handlers.get(tool_name)
         if handler:
             return await handler(arguments)
         return f"Tool not found: {tool_name}"
 
     async def read_resource(self, uri: str) -> str:
-        resource_key = uri.replace("://", "_").replace("/", "_")
-        handler = None
-        if uri == "n8n://status":
-            handler = self._resource_connection_status
-        elif uri == "n8n://workflows":
-            handler = self._resource_workflows_overview
-            
+        handler = self._resource_handlers.get(uri)
+        if handler:
+            return await handler()
+        return orjson.dumps({"error": f"Resource not found: {uri}"}).decode()
+
 
 async def main():
     """Run the n8n MCP server."""
     server = N8nMcpServer()
-    await server.initialize_server()
-    await server.run()
+    try:
+        await server.run()
+    finally:
+        if server.n8n_client:
+            await server.n8n_client.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
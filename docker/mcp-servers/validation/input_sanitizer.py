@@ -5,13 +5,38 @@ Prevents injection attacks, XSS, and other security vulnerabilities
 """
 
 import re
-import html
-import urllib.parse
-from typing import Any, Dict, List, Union, Optional
+from itertools import islice
+from typing import Any, Dict, List, Union, Optional, Pattern, Set
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Optional Hyperscan: matches every dangerous pattern in one native pass
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+def _build_hyperscan_database(patterns: List[str]) -> Optional["hyperscan.Database"]:
+    """Compile patterns into one block-mode Hyperscan database (None if unavailable)"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns)
+        )
+        return database
+    except hyperscan.error as e:
+        logger.warning(f"⚠️  Hyperscan compile failed, using re patterns: {e}")
+        return None
+
 class InputSanitizer:
     """
     Comprehensive input sanitization for MCP server tools
@@ -46,6 +71,38 @@ class InputSanitizer:
     COMPILED_PATTERNS = [re.compile(pattern, re.IGNORECASE | re.DOTALL) 
                         for pattern in DANGEROUS_PATTERNS]
     
+    # All patterns in one Hyperscan database, when the package is installed
+    HYPERSCAN_DATABASE = _build_hyperscan_database(DANGEROUS_PATTERNS)
+    
+    # Characters that could be used for injection, escaped in one translate pass:
+    # HTML-significant characters become entities (as html.escape(quote=True)),
+    # CR/LF/tab and the rest are percent-encoded, other control characters deleted.
+    # Afterwards the only ASCII whitespace left is the plain space
+    ESCAPE_TABLE = str.maketrans({
+        **dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]),
+        '&': '&amp;',
+        '<': '&lt;',
+        '>': '&gt;',
+        '"': '&quot;',
+        "'": '&#x27;',
+        '\r': '%0D',
+        '\n': '%0A',
+        '\t': '%09',
+        '`': '%60',
+        '\\': '%5C',
+    })
+    
+    WHITESPACE_RUN = re.compile(r'\s+')
+    
+    # Text no sanitizing step would change, apart from dangerous patterns: no
+    # characters that are escaped, encoded or stripped, and single inner spaces only
+    CLEAN_TEXT = re.compile(r"[^\s&<>\"'`\\\x00-\x1f\x7f]+(?: [^\s&<>\"'`\\\x00-\x1f\x7f]+)*")
+    
+    MAX_LENGTH = 10000
+    
+    # Patterns listed in a field's security warning
+    MAX_LOGGED_PATTERNS = 8
+    
     @classmethod
     def sanitize_value(cls, value: Any, field_name: str = "unknown") -> Any:
         """
@@ -69,11 +126,26 @@ class InputSanitizer:
         elif isinstance(value, str):
             return cls._sanitize_string(value, field_name)
         elif isinstance(value, list):
-            return [cls.sanitize_value(item, f"{field_name}[{i}]") 
-                   for i, item in enumerate(value)]
+            # Copy only from the first changed item; clean lists are returned as-is
+            sanitized = None
+            for i, item in enumerate(value):
+                clean = cls.sanitize_value(item, f"{field_name}[{i}]")
+                if sanitized is None:
+                    if clean is item:
+                        continue
+                    sanitized = value[:i]
+                sanitized.append(clean)
+            return value if sanitized is None else sanitized
         elif isinstance(value, dict):
-            return {k: cls.sanitize_value(v, f"{field_name}.{k}") 
-                   for k, v in value.items()}
+            sanitized = None
+            for i, (k, v) in enumerate(value.items()):
+                clean = cls.sanitize_value(v, f"{field_name}.{k}")
+                if sanitized is None:
+                    if clean is v:
+                        continue
+                    sanitized = dict(islice(value.items(), i))
+                sanitized[k] = clean
+            return value if sanitized is None else sanitized
         else:
             # Convert unknown types to string and sanitize
             return cls._sanitize_string(str(value), field_name)
@@ -93,72 +165,92 @@ class InputSanitizer:
         if not isinstance(text, str) or not text.strip():
             return text
             
-        original_text = text
-        
-        # 1. Detect and log dangerous patterns
-        for pattern in cls.COMPILED_PATTERNS:
-            if pattern.search(text):
-                logger.warning(
-                    f"🚨 SECURITY: Dangerous pattern detected in field '{field_name}': "
-                    f"{pattern.pattern[:50]}..."
-                )
+        # 1. Detect and log dangerous patterns (one record per field)
+        detected = cls._detect_patterns(text)
+        if detected and logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"🚨 SECURITY: {len(detected)} dangerous pattern(s) detected in field '{field_name}': "
+                + ", ".join(f"{pattern.pattern[:50]}..." for pattern in detected[:cls.MAX_LOGGED_PATTERNS])
+            )
         
-        # 2. HTML escape to prevent XSS
-        text = html.escape(text, quote=True)
+        # Already-safe text (the common case) would pass every step unchanged
+        if not detected and len(text) <= cls.MAX_LENGTH and cls.CLEAN_TEXT.fullmatch(text):
+            return text
         
-        # 3. URL encode special characters that could cause injection
-        # But preserve normal characters for usability
-        text = cls._selective_url_encode(text)
+        # 2. HTML escape to prevent XSS, encode other injection characters and
+        # drop control characters, preserving normal characters for usability
+        text = text.translate(cls.ESCAPE_TABLE)
         
-        # 4. Remove/escape dangerous patterns
-        for pattern in cls.COMPILED_PATTERNS:
-            text = pattern.sub('', text)  # Remove dangerous content
+        # 3. Remove/escape dangerous patterns
+        text = cls._remove_patterns(text)
         
-        # 5. Normalize whitespace and control characters
+        # 4. Normalize whitespace
         text = cls._normalize_whitespace(text)
         
-        # 6. Length limiting (prevent DoS)
+        # 5. Length limiting (prevent DoS)
         text = cls._limit_length(text, field_name)
         
-        if text != original_text:
-            logger.debug(f"🧹 Sanitized field '{field_name}': {len(original_text)} → {len(text)} chars")
-        
         return text
     
     @classmethod
-    def _selective_url_encode(cls, text: str) -> str:
-        """URL encode only dangerous characters, preserve readability"""
-        # Characters that could be used for injection
-        dangerous_chars = {
-            '\r': '%0D',
-            '\n': '%0A', 
-            '\t': '%09',
-            '<': '%3C',
-            '>': '%3E',
-            '"': '%22',
-            "'": '%27',
-            '`': '%60',
-            '\\': '%5C',
-        }
-        
-        for char, encoded in dangerous_chars.items():
-            text = text.replace(char, encoded)
+    def _hyperscan_matches(cls, text: str) -> Optional[Set[int]]:
+        """
+        Indexes of the DANGEROUS_PATTERNS found in text by one Hyperscan pass
         
+        Returns:
+            Set of matching pattern indexes, or None when Hyperscan is unavailable
+            or text is not ASCII (re's Unicode case folding is kept authoritative)
+        """
+        if cls.HYPERSCAN_DATABASE is None or not text.isascii():
+            return None
+        
+        matched = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matched.add(pattern_id)
+        
+        cls.HYPERSCAN_DATABASE.scan(text.encode('ascii'), match_event_handler=on_match)
+        return matched
+    
+    @classmethod
+    def _detect_patterns(cls, text: str) -> List[Pattern]:
+        """Compiled dangerous patterns that occur in text, in pattern order"""
+        matched = cls._hyperscan_matches(text)
+        if matched is None:
+            return [pattern for pattern in cls.COMPILED_PATTERNS if pattern.search(text)]
+        return [cls.COMPILED_PATTERNS[i] for i in sorted(matched)]
+    
+    @classmethod
+    def _remove_patterns(cls, text: str) -> str:
+        """Remove every dangerous pattern, applying them in order as re.sub would"""
+        matched = cls._hyperscan_matches(text)
+        if matched is None:
+            for pattern in cls.COMPILED_PATTERNS:
+                text = pattern.sub('', text)
+            return text
+        
+        # Only substitute patterns present in the current text; a removal can
+        # create new matches, so rescan whenever the text changes
+        for i, pattern in enumerate(cls.COMPILED_PATTERNS):
+            if i in matched:
+                cleaned = pattern.sub('', text)
+                if cleaned != text:
+                    text = cleaned
+                    matched = cls._hyperscan_matches(text)
         return text
     
     @classmethod
     def _normalize_whitespace(cls, text: str) -> str:
-        """Normalize whitespace and remove control characters"""
-        # Remove control characters except normal whitespace
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-        
-        # Normalize multiple whitespace to single space
-        text = re.sub(r'\s+', ' ', text)
+        """Collapse whitespace runs in text already passed through ESCAPE_TABLE"""
+        # ASCII text can then only contain plain spaces, so without a double
+        # space there is no run to collapse (isascii is a constant-time flag check)
+        if not (text.isascii() and '  ' not in text):
+            text = cls.WHITESPACE_RUN.sub(' ', text)
         
         return text.strip()
     
     @classmethod
-    def _limit_length(cls, text: str, field_name: str, max_length: int = 10000) -> str:
+    def _limit_length(cls, text: str, field_name: str, max_length: int = MAX_LENGTH) -> str:
         """Limit string length to prevent DoS attacks"""
         if len(text) > max_length:
             logger.warning(
@@ -182,6 +274,7 @@ class InputSanitizer:
             return params
             
         sanitized = {}
+        changed = []
         
         for key, value in params.items():
             # Sanitize the key name too (basic safety)
@@ -189,9 +282,14 @@ class InputSanitizer:
             
             # Sanitize the value
             clean_value = cls.sanitize_value(value, key)
+            if clean_value is not value:
+                changed.append(clean_key)
             
             sanitized[clean_key] = clean_value
         
+        if changed and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🧹 Sanitized {len(changed)} field(s): {', '.join(changed)}")
+        
         return sanitized
     
     @classmethod
@@ -205,13 +303,12 @@ class InputSanitizer:
         if not isinstance(text, str):
             return True
             
-        for pattern in cls.COMPILED_PATTERNS:
-            if pattern.search(text):
-                logger.error(
-                    f"🚫 BLOCKED: Dangerous content in field '{field_name}': "
-                    f"Pattern '{pattern.pattern[:30]}...' detected"
-                )
-                return False
+        for pattern in cls._detect_patterns(text):
+            logger.error(
+                f"🚫 BLOCKED: Dangerous content in field '{field_name}': "
+                f"Pattern '{pattern.pattern[:30]}...' detected"
+            )
+            return False
         
         return True
 
@@ -3,14 +3,40 @@ Pydantic Validation Layer for MCP Tools
 Enhances existing validation without breaking current functionality
 """
 
+import hashlib
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union, Type
-from pydantic import BaseModel, Field, ValidationError, validator
-from pydantic.fields import FieldInfo
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union, Type
+
+import orjson
+from pydantic import AfterValidator, Field, TypeAdapter, ValidationError
+# pydantic requires typing_extensions.TypedDict before Python 3.12
+from typing_extensions import Annotated, NotRequired, Required, TypedDict
 
 logger = logging.getLogger(__name__)
 
+# JSON schema types -> Python types (unknown types validate as strings)
+_JSON_TO_PY: Dict[str, Type] = {
+    'string': str,
+    'integer': int,
+    'number': float,
+    'boolean': bool,
+    'array': list,
+    'object': dict
+}
+
+
+def _enum_member_check(enum_values: List[Any]) -> Callable[[Any], Any]:
+    """Build an after-validator that accepts only the allowed enum values"""
+    allowed = tuple(enum_values)
+    
+    def check(value: Any) -> Any:
+        if value not in allowed:
+            raise ValueError(f"must be one of {list(allowed)}")
+        return value
+    
+    return check
+
 
 class PydanticParameterValidator:
     """
@@ -18,16 +44,34 @@ class PydanticParameterValidator:
     without breaking current tool registration system
     """
     
-    def __init__(self):
-        self.model_cache = {}
+    def __init__(self) -> None:
+        # Structural key of a parameter config -> adapter, shared by tools with identical parameters
+        self.adapter_cache: Dict[bytes, TypeAdapter] = {}
+        # Structural key -> (parameter names, required parameter names)
+        self._field_sets: Dict[bytes, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        # tool name -> (params config object, structural key), skips re-hashing an unchanged config
+        self._config_keys: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
     
-    def create_dynamic_model(self, tool_name: str, params: Dict[str, Any]) -> Type[BaseModel]:
+    def _config_key(self, tool_name: str, params: Dict[str, Any]) -> bytes:
+        """Canonical hash of a parameter config, memoized per tool for the same config object"""
+        cached = self._config_keys.get(tool_name)
+        if cached is not None and cached[0] is params:
+            return cached[1]
+        
+        canonical = orjson.dumps(params, option=orjson.OPT_SORT_KEYS, default=str)
+        key = hashlib.blake2b(canonical, digest_size=16).digest()
+        self._config_keys[tool_name] = (params, key)
+        return key
+    
+    def create_type_adapter(self, tool_name: str, params: Dict[str, Any]) -> TypeAdapter:
         """
-        Create a dynamic Pydantic model from tool parameter definitions
+        Create a Pydantic TypeAdapter over a TypedDict of the tool parameter definitions
         This enhances the existing parameter validation without replacing it
         """
-        if tool_name in self.model_cache:
-            return self.model_cache[tool_name]
+        key = self._config_key(tool_name, params)
+        adapter = self.adapter_cache.get(key)
+        if adapter is not None:
+            return adapter
         
         fields = {}
         
@@ -38,63 +82,22 @@ class PydanticParameterValidator:
             description = param_info.get('description', f'Parameter: {param_name}')
             enum_values = param_info.get('enum', [])
             
-            # Map JSON schema types to Python types
-            python_type = self._map_type(param_type)
-            
-            # Create field with proper validation
-            if required:
-                if enum_values:
-                    fields[param_name] = (python_type, Field(..., description=description))
-                else:
-                    fields[param_name] = (python_type, Field(..., description=description))
-            else:
-                if enum_values:
-                    fields[param_name] = (Optional[python_type], Field(None, description=description))
-                else:
-                    fields[param_name] = (Optional[python_type], Field(None, description=description))
-        
-        # Create dynamic model class
-        model_class = type(
-            f"{tool_name.title()}Parameters",
-            (BaseModel,),
-            {
-                '__annotations__': {k: v[0] for k, v in fields.items()},
-                **{k: v[1] for k, v in fields.items()},
-                '__module__': __name__
-            }
-        )
-        
-        # Add enum validation if needed
-        for param_name, param_info in params.items():
-            enum_values = param_info.get('enum', [])
+            # Map JSON schema types to Python types; enum membership is checked after
+            # coercion so e.g. "2" still matches an integer enum
+            python_type = _JSON_TO_PY.get(param_type, str)
             if enum_values:
-                self._add_enum_validator(model_class, param_name, enum_values)
+                python_type = Annotated[python_type, AfterValidator(_enum_member_check(enum_values))]
+            
+            # Create field with proper validation; optional parameters also accept None
+            annotated = Annotated[python_type if required else Optional[python_type], Field(description=description)]
+            fields[param_name] = Required[annotated] if required else NotRequired[annotated]
         
-        self.model_cache[tool_name] = model_class
-        return model_class
-    
-    def _map_type(self, json_type: str) -> Type:
-        """Map JSON schema types to Python types"""
-        type_mapping = {
-            'string': str,
-            'integer': int,
-            'number': float,
-            'boolean': bool,
-            'array': list,
-            'object': dict
-        }
-        return type_mapping.get(json_type, str)
-    
-    def _add_enum_validator(self, model_class: Type[BaseModel], field_name: str, enum_values: List[str]):
-        """Add enum validation to a field"""
-        def enum_validator(cls, v):
-            if v is not None and v not in enum_values:
-                raise ValueError(f"Invalid value '{v}' for {field_name}. Must be one of: {enum_values}")
-            return v
+        # Create the TypedDict and its validator
+        typed_dict = TypedDict(f"{tool_name.title()}Parameters", fields, total=False)
+        adapter = TypeAdapter(typed_dict)
         
-        # Add validator to the model
-        validator_name = f"validate_{field_name}"
-        setattr(model_class, validator_name, validator(field_name, allow_reuse=True)(enum_validator))
+        self.adapter_cache[key] = adapter
+        return adapter
     
     def validate_parameters(self, tool_name: str, params_config: Dict[str, Any], input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -102,19 +105,14 @@ class PydanticParameterValidator:
         Falls back to existing validation if Pydantic validation fails
         """
         try:
-            # Create dynamic model
-            model_class = self.create_dynamic_model(tool_name, params_config)
+            # Create (or reuse) the validator
+            adapter = self.create_type_adapter(tool_name, params_config)
             
             # Validate input data
-            validated_model = model_class(**input_data)
+            validated = adapter.validate_python(input_data)
             
             # Convert back to dict, excluding None values for optional parameters
-            validated_data = {}
-            for field_name, field_value in validated_model.dict().items():
-                if field_value is not None:
-                    validated_data[field_name] = field_value
-                elif params_config.get(field_name, {}).get('required', False):
-                    validated_data[field_name] = field_value
+            validated_data = self._project(tool_name, params_config, validated)
             
             logger.debug(f"✅ Pydantic validation successful for {tool_name}")
             return validated_data
@@ -129,8 +127,32 @@ class PydanticParameterValidator:
             logger.warning(f"⚠️ Pydantic validation error for {tool_name}: {e}")
             return input_data
     
+    def validate_trusted(self, tool_name: str, params_config: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Shape parameters the caller already trusts without running Pydantic
+        Use for argument dicts that were validated before (e.g. loaded from the database or a cache)
+        """
+        return self._project(tool_name, params_config, data)
+    
+    def _project(self, tool_name: str, params_config: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep configured parameters, excluding None values for optional ones"""
+        key = self._config_key(tool_name, params_config)
+        field_sets = self._field_sets.get(key)
+        if field_sets is None:
+            field_sets = self._field_sets[key] = (
+                frozenset(params_config),
+                frozenset(name for name, info in params_config.items() if info.get('required', False))
+            )
+        
+        fields, required = field_sets
+        return {
+            field_name: field_value for field_name, field_value in data.items()
+            if field_name in fields and (field_value is not None or field_name in required)
+        }
+    
     def enhance_existing_validation(self, tool_name: str, params_config: Dict[str, Any], 
-                                  existing_validation_func, input_data: Dict[str, Any]) -> Dict[str, Any]:
+                                  existing_validation_func: Callable[[Dict[str, Any]], Dict[str, Any]],
+                                  input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enhance existing validation with Pydantic without breaking current flow
         """
@@ -147,7 +169,7 @@ class PydanticParameterValidator:
 
 
 # Global validator instance
-_validator = None
+_validator: Optional[PydanticParameterValidator] = None
 
 def get_validator() -> PydanticParameterValidator:
     """Get singleton validator instance"""
@@ -158,9 +180,12 @@ def get_validator() -> PydanticParameterValidator:
 
 
 def validate_tool_parameters(tool_name: str, params_config: Dict[str, Any], 
-                           input_data: Dict[str, Any]) -> Dict[str, Any]:
+                           input_data: Dict[str, Any], trusted: bool = False) -> Dict[str, Any]:
     """
     Main validation function that enhances existing validation
+    Pass trusted=True for argument dicts that were already validated (database/cache sourced)
     """
     validator = get_validator()
+    if trusted:
+        return validator.validate_trusted(tool_name, params_config, input_data)
     return validator.validate_parameters(tool_name, params_config, input_data)
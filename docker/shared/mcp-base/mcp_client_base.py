@@ -6,15 +6,52 @@ HTTP Transport with proper session management
 """
 
 import asyncio
+import itertools
 import json
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 import httpx
 
+# JSON-RPC envelopes are encoded with orjson when installed, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a JSON-RPC message to bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON-RPC response body"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Incremental parsing of large resource reads needs the optional ijson package
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Resource responses above this size are parsed incrementally by read_resource_stream
+STREAM_THRESHOLD_BYTES = 64 * 1024
+
 @dataclass
 class MCPServerConnection:
     """MCP Server Connection Configuration"""
@@ -34,7 +71,7 @@ class MCPSession:
     tools: List[Dict[str, Any]]
     resources: List[Dict[str, Any]]
     connected_at: datetime
-    last_activity: datetime
+    last_activity: float  # time.monotonic() of the last successful request
 
 class MCPClientBase:
     """
@@ -52,9 +89,16 @@ class MCPClientBase:
         self.sessions: Dict[str, MCPSession] = {}
         self.connections: Dict[str, MCPServerConnection] = {}
         
+        # JSON-RPC request ids, unique for the lifetime of the client
+        self._request_ids = itertools.count(1)
+        
         # HTTP client configuration
         self.http_timeout = httpx.Timeout(30.0, connect=10.0)
         self.http_limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        self.ping_timeout = httpx.Timeout(5.0)
+        
+        # One pooled client shared by all servers, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
         
         # Setup logging
         self._setup_logging()
@@ -70,6 +114,20 @@ class MCPClientBase:
         )
         self.logger = logging.getLogger(f"mcp.client.{self.client_name}")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.http_timeout,
+                limits=self.http_limits,
+                http2=HTTP2_AVAILABLE
+            )
+        return self._client
+
+    def _next_request_id(self, prefix: str) -> str:
+        """Return a unique JSON-RPC request id"""
+        return f"{prefix}_{next(self._request_ids)}"
+
     def add_server(self, connection: MCPServerConnection):
         """Add MCP server connection configuration"""
         self.connections[connection.name] = connection
@@ -87,76 +145,75 @@ class MCPClientBase:
         connection = self.connections[server_name]
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.http_timeout,
-                limits=self.http_limits
-            ) as client:
-                
-                # Step 1: Initialize MCP session
-                init_request = {
-                    "jsonrpc": "2.0",
-                    "id": f"init_{int(time.time())}",
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": self.protocol_version,
-                        "capabilities": {
-                            "tools": {"listChanged": True},
-                            "resources": {"listChanged": True}
-                        },
-                        "clientInfo": {
-                            "name": self.client_name,
-                            "version": self.client_version
-                        }
+            client = self._get_client()
+            
+            # Step 1: Initialize MCP session
+            init_request = {
+                "jsonrpc": "2.0",
+                "id": self._next_request_id("init"),
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": self.protocol_version,
+                    "capabilities": {
+                        "tools": {"listChanged": True},
+                        "resources": {"listChanged": True}
+                    },
+                    "clientInfo": {
+                        "name": self.client_name,
+                        "version": self.client_version
                     }
                 }
+            }
 
-                self.logger.debug(f"Sending initialize request to {server_name}: {init_request}")
-                
-                response = await client.post(
-                    connection.url,
-                    json=init_request,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code != 200:
-                    self.logger.error(f"HTTP error connecting to {server_name}: {response.status_code}")
-                    return False
+            self.logger.debug(f"Sending initialize request to {server_name}: {init_request}")
+            
+            response = await client.post(
+                connection.url,
+                content=_dumps(init_request),
+                headers={"Content-Type": "application/json"}
+            )
+            
+            if response.status_code != 200:
+                self.logger.error(f"HTTP error connecting to {server_name}: {response.status_code}")
+                return False
+
+            init_result = _loads(response.content)
+            
+            if "error" in init_result:
+                self.logger.error(f"MCP error initializing {server_name}: {init_result['error']}")
+                return False
+
+            # Extract session information
+            result = init_result.get("result", {})
+            server_info = result.get("serverInfo", {})
+            server_capabilities = result.get("capabilities", {})
+            
+            # Step 2: Discover tools and resources (independent, so in one round trip)
+            tools, resources = await asyncio.gather(
+                self._discover_tools(connection),
+                self._discover_resources(connection)
+            )
 
-                init_result = response.json()
-                
-                if "error" in init_result:
-                    self.logger.error(f"MCP error initializing {server_name}: {init_result['error']}")
-                    return False
-
-                # Extract session information
-                result = init_result.get("result", {})
-                server_info = result.get("serverInfo", {})
-                server_capabilities = result.get("capabilities", {})
-                
-                # Step 2: Discover tools and resources
-                tools = await self._discover_tools(client, connection.url)
-                resources = await self._discover_resources(client, connection.url)
-
-                # Step 3: Create session
-                session = MCPSession(
-                    server_name=server_name,
-                    session_id=f"{server_name}_{int(time.time())}",
-                    protocol_version=result.get("protocolVersion", self.protocol_version),
-                    capabilities=server_capabilities,
-                    tools=tools,
-                    resources=resources,
-                    connected_at=datetime.utcnow(),
-                    last_activity=datetime.utcnow()
-                )
-
-                self.sessions[server_name] = session
-                
-                self.logger.info(f"✅ Successfully connected to MCP server: {server_name}")
-                self.logger.info(f"   Server: {server_info.get('name', 'Unknown')} v{server_info.get('version', 'Unknown')}")
-                self.logger.info(f"   Tools: {len(tools)}")
-                self.logger.info(f"   Resources: {len(resources)}")
-                
-                return True
+            # Step 3: Create session
+            session = MCPSession(
+                server_name=server_name,
+                session_id=f"{server_name}_{int(time.time())}",
+                protocol_version=result.get("protocolVersion", self.protocol_version),
+                capabilities=server_capabilities,
+                tools=tools,
+                resources=resources,
+                connected_at=datetime.now(timezone.utc),
+                last_activity=time.monotonic()
+            )
+
+            self.sessions[server_name] = session
+            
+            self.logger.info(f"✅ Successfully connected to MCP server: {server_name}")
+            self.logger.info(f"   Server: {server_info.get('name', 'Unknown')} v{server_info.get('version', 'Unknown')}")
+            self.logger.info(f"   Tools: {len(tools)}")
+            self.logger.info(f"   Resources: {len(resources)}")
+            
+            return True
 
         except httpx.TimeoutException:
             self.logger.error(f"Timeout connecting to MCP server: {server_name}")
@@ -168,27 +225,32 @@ class MCPClientBase:
             self.logger.error(f"Unexpected error connecting to {server_name}: {e}")
             return False
 
-    async def _discover_tools(self, client: httpx.AsyncClient, server_url: str) -> List[Dict[str, Any]]:
+    async def connect_all(self) -> Dict[str, bool]:
+        """
+        Connect to every configured MCP server concurrently
+        
+        Returns:
+            Dict mapping server name to whether the connection succeeded
+        """
+        server_names = list(self.connections)
+        results = await asyncio.gather(*(self.connect_to_server(name) for name in server_names))
+        return dict(zip(server_names, results))
+
+    async def _discover_tools(self, connection: MCPServerConnection) -> List[Dict[str, Any]]:
         """Discover available tools from MCP server"""
         try:
             tools_request = {
                 "jsonrpc": "2.0",
-                "id": f"tools_{int(time.time())}",
+                "id": self._next_request_id("tools"),
                 "method": "tools/list",
                 "params": {}
             }
 
-            response = await client.post(
-                server_url,
-                json=tools_request,
-                headers={
-                    "Content-Type": "application/json",
-                    "MCP-Protocol-Version": self.protocol_version  # Required in 2025-06-18
-                }
-            )
+            # Listing is read-only, so transient failures are retried like other reads
+            response = await self._post_json_rpc(connection, tools_request, retry=True)
 
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 if "result" in result:
                     return result["result"].get("tools", [])
 
@@ -197,27 +259,20 @@ class MCPClientBase:
 
         return []
 
-    async def _discover_resources(self, client: httpx.AsyncClient, server_url: str) -> List[Dict[str, Any]]:
+    async def _discover_resources(self, connection: MCPServerConnection) -> List[Dict[str, Any]]:
         """Discover available resources from MCP server"""
         try:
             resources_request = {
                 "jsonrpc": "2.0",
-                "id": f"resources_{int(time.time())}",
+                "id": self._next_request_id("resources"),
                 "method": "resources/list",
                 "params": {}
             }
 
-            response = await client.post(
-                server_url,
-                json=resources_request,
-                headers={
-                    "Content-Type": "application/json",
-                    "MCP-Protocol-Version": self.protocol_version  # Required in 2025-06-18
-                }
-            )
+            response = await self._post_json_rpc(connection, resources_request, retry=True)
 
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 if "result" in result:
                     return result["result"].get("resources", [])
 
@@ -226,6 +281,55 @@ class MCPClientBase:
 
         return []
 
+    async def _post_json_rpc(self, connection: MCPServerConnection, request: Dict[str, Any],
+                             retry: bool) -> httpx.Response:
+        """
+        POST a JSON-RPC request over the shared client, retrying transient failures
+        
+        Args:
+            connection: Server configuration (max_retries and retry_delay apply)
+            request: JSON-RPC request message
+            retry: Whether the request is safe to resend (idempotent)
+            
+        Returns:
+            The HTTP response; after the last attempt a 5xx response is returned as is
+        """
+        client = self._get_client()
+        content = _dumps(request)
+        headers = {
+            "Content-Type": "application/json",
+            "MCP-Protocol-Version": self.protocol_version
+        }
+        
+        attempts = connection.max_retries + 1 if retry else 1
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = await client.post(connection.url, content=content, headers=headers)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                reason = type(e).__name__
+            else:
+                if response.status_code < 500 or last_attempt:
+                    return response
+                reason = f"HTTP {response.status_code}"
+            
+            delay = connection.retry_delay * 2 ** attempt
+            self.logger.warning(
+                f"Retrying {request['method']} on {connection.name} in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{attempts} failed: {reason})"
+            )
+            await asyncio.sleep(delay)
+
+    def _is_idempotent_tool(self, server_name: str, tool_name: str) -> bool:
+        """Whether the server annotates the tool as read-only or idempotent"""
+        for tool in self.sessions[server_name].tools:
+            if tool.get("name") == tool_name:
+                annotations = tool.get("annotations") or {}
+                return bool(annotations.get("readOnlyHint") or annotations.get("idempotentHint"))
+        return False
+
     async def call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool on a specific MCP server"""
         if server_name not in self.sessions:
@@ -234,42 +338,35 @@ class MCPClientBase:
         connection = self.connections[server_name]
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.http_timeout,
-                limits=self.http_limits
-            ) as client:
-                
-                call_request = {
-                    "jsonrpc": "2.0",
-                    "id": f"call_{tool_name}_{int(time.time())}",
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments
-                    }
+            call_request = {
+                "jsonrpc": "2.0",
+                "id": self._next_request_id(f"call_{tool_name}"),
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments
                 }
+            }
 
-                response = await client.post(
-                    connection.url,
-                    json=call_request,
-                    headers={
-                        "Content-Type": "application/json",
-                        "MCP-Protocol-Version": self.protocol_version
-                    }
-                )
+            # Tool calls may have side effects; resend only those the server marks safe to repeat
+            response = await self._post_json_rpc(
+                connection,
+                call_request,
+                retry=self._is_idempotent_tool(server_name, tool_name)
+            )
 
-                if response.status_code != 200:
-                    raise ValueError(f"HTTP error: {response.status_code}")
+            if response.status_code != 200:
+                raise ValueError(f"HTTP error: {response.status_code}")
 
-                result = response.json()
-                
-                if "error" in result:
-                    raise ValueError(f"MCP error: {result['error']}")
+            result = _loads(response.content)
+            
+            if "error" in result:
+                raise ValueError(f"MCP error: {result['error']}")
 
-                # Update session activity
-                self.sessions[server_name].last_activity = datetime.utcnow()
-                
-                return result.get("result", {})
+            # Update session activity
+            self.sessions[server_name].last_activity = time.monotonic()
+            
+            return result.get("result", {})
 
         except Exception as e:
             self.logger.error(f"Error calling tool {tool_name} on {server_name}: {e}")
@@ -283,46 +380,115 @@ class MCPClientBase:
         connection = self.connections[server_name]
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.http_timeout,
-                limits=self.http_limits
-            ) as client:
-                
-                read_request = {
-                    "jsonrpc": "2.0",
-                    "id": f"read_{int(time.time())}",
-                    "method": "resources/read",
-                    "params": {
-                        "uri": uri
-                    }
+            read_request = {
+                "jsonrpc": "2.0",
+                "id": self._next_request_id("read"),
+                "method": "resources/read",
+                "params": {
+                    "uri": uri
                 }
+            }
 
-                response = await client.post(
-                    connection.url,
-                    json=read_request,
-                    headers={
-                        "Content-Type": "application/json",
-                        "MCP-Protocol-Version": self.protocol_version
-                    }
-                )
+            response = await self._post_json_rpc(connection, read_request, retry=True)
 
-                if response.status_code != 200:
-                    raise ValueError(f"HTTP error: {response.status_code}")
+            if response.status_code != 200:
+                raise ValueError(f"HTTP error: {response.status_code}")
 
-                result = response.json()
-                
-                if "error" in result:
-                    raise ValueError(f"MCP error: {result['error']}")
+            result = _loads(response.content)
+            
+            if "error" in result:
+                raise ValueError(f"MCP error: {result['error']}")
 
-                # Update session activity
-                self.sessions[server_name].last_activity = datetime.utcnow()
-                
-                return result.get("result", {})
+            # Update session activity
+            self.sessions[server_name].last_activity = time.monotonic()
+            
+            return result.get("result", {})
 
         except Exception as e:
             self.logger.error(f"Error reading resource {uri} from {server_name}: {e}")
             raise
 
+    async def read_resource_stream(self, server_name: str, uri: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Read a resource from a specific MCP server, yielding its content entries as they arrive
+        
+        Args:
+            server_name: Connected server to read from
+            uri: Resource URI
+            
+        Returns:
+            Async iterator over the entries of the result's contents; bodies larger than
+            STREAM_THRESHOLD_BYTES (or of unknown size) are parsed incrementally with ijson,
+            so the whole response is never held in memory at once
+        """
+        if not IJSON_AVAILABLE:
+            result = await self.read_resource(server_name, uri)
+            for content in result.get("contents", []):
+                yield content
+            return
+        
+        if server_name not in self.sessions:
+            raise ValueError(f"No active session for server: {server_name}")
+
+        connection = self.connections[server_name]
+        
+        read_request = {
+            "jsonrpc": "2.0",
+            "id": self._next_request_id("read"),
+            "method": "resources/read",
+            "params": {
+                "uri": uri
+            }
+        }
+        
+        try:
+            async with self._get_client().stream(
+                "POST",
+                connection.url,
+                content=_dumps(read_request),
+                headers={
+                    "Content-Type": "application/json",
+                    "MCP-Protocol-Version": self.protocol_version
+                }
+            ) as response:
+                if response.status_code != 200:
+                    raise ValueError(f"HTTP error: {response.status_code}")
+                
+                content_length = response.headers.get("content-length")
+                if content_length is not None and int(content_length) <= STREAM_THRESHOLD_BYTES:
+                    result = _loads(await response.aread())
+                    if "error" in result:
+                        raise ValueError(f"MCP error: {result['error']}")
+                    for content in result.get("result", {}).get("contents", []):
+                        yield content
+                else:
+                    # Push-parse each chunk; a second parser picks up a JSON-RPC error object
+                    contents = ijson.sendable_list()
+                    errors = ijson.sendable_list()
+                    contents_parser = ijson.items_coro(contents, "result.contents.item")
+                    error_parser = ijson.items_coro(errors, "error")
+                    async for chunk in response.aiter_bytes():
+                        contents_parser.send(chunk)
+                        error_parser.send(chunk)
+                        if errors:
+                            raise ValueError(f"MCP error: {errors[0]}")
+                        for content in contents:
+                            yield content
+                        del contents[:]
+                    contents_parser.close()
+                    error_parser.close()
+                    if errors:
+                        raise ValueError(f"MCP error: {errors[0]}")
+                    for content in contents:
+                        yield content
+            
+            # Update session activity
+            self.sessions[server_name].last_activity = time.monotonic()
+
+        except Exception as e:
+            self.logger.error(f"Error streaming resource {uri} from {server_name}: {e}")
+            raise
+
     async def ping_server(self, server_name: str) -> bool:
         """Ping MCP server to check connectivity"""
         if server_name not in self.connections:
@@ -331,21 +497,23 @@ class MCPClientBase:
         connection = self.connections[server_name]
         
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-                ping_request = {
-                    "jsonrpc": "2.0",
-                    "id": f"ping_{int(time.time())}",
-                    "method": "ping",
-                    "params": {}
-                }
+            client = self._get_client()
+            
+            ping_request = {
+                "jsonrpc": "2.0",
+                "id": self._next_request_id("ping"),
+                "method": "ping",
+                "params": {}
+            }
 
-                response = await client.post(
-                    connection.url,
-                    json=ping_request,
-                    headers={"Content-Type": "application/json"}
-                )
+            response = await client.post(
+                connection.url,
+                content=_dumps(ping_request),
+                headers={"Content-Type": "application/json"},
+                timeout=self.ping_timeout
+            )
 
-                return response.status_code == 200
+            return response.status_code == 200
 
         except:
             return False
@@ -375,9 +543,12 @@ class MCPClientBase:
             self.logger.info(f"Disconnected from MCP server: {server_name}")
 
     async def disconnect_all(self):
-        """Disconnect from all MCP servers"""
+        """Disconnect from all MCP servers and close the HTTP client"""
         for server_name in list(self.sessions.keys()):
             await self.disconnect_from_server(server_name)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         self.logger.info("Disconnected from all MCP servers")
 
 if __name__ == "__main__":